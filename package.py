@@ -53,6 +53,9 @@ SCRIPT_FILES = [
 # Combine all files
 ALL_RELEASE_FILES = RELEASE_FILES + SCRIPT_FILES
 
+# zlib level 1: near-max throughput for a few percent larger archive
+ZIP_COMPRESSLEVEL = 1
+
 
 def create_release(output_dir: Path) -> Path:
     """Create a release zip file.
@@ -92,11 +95,19 @@ def create_release(output_dir: Path) -> Path:
         sys.exit(1)
 
     # Create zip file
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
         for filename, file_path in files_to_package:
             # Store files in a subdirectory named lldb-objc
             arcname = f"lldb-objc/{filename}"
-            zf.write(file_path, arcname)
+            # ZipInfo.from_file keeps the file mode (install.py stays executable);
+            # the contents are then read once and written from memory
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            zf.writestr(
+                info,
+                file_path.read_bytes(),
+                compress_type=zipfile.ZIP_DEFLATED,
+                compresslevel=ZIP_COMPRESSLEVEL,
+            )
             print(f"  Added: {filename}")
 
     print()
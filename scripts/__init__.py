@@ -15,21 +15,29 @@ To reload commands within an LLDB session:
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import lldb
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List
 
-# Add the script directory to path for imports
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
 
-try:
-    from version import __version__
-except ImportError:
-    __version__ = "unknown"
+def _bootstrap_sys_path() -> None:
+    """Add the script directory to sys.path so modules import by top-level name."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+
+# Imported as a package, relative imports work without touching sys.path;
+# command modules add the directory themselves for their top-level imports
+if not __package__:
+    _bootstrap_sys_path()
+
+# find_spec returns None on a miss instead of raising
+_version_spec = importlib.util.find_spec(f"{__package__}.version" if __package__ else "version")
+__version__ = importlib.import_module(_version_spec.name).__version__ if _version_spec else "unknown"
 
 # Command modules to load (with package prefix)
 COMMAND_MODULES = [
@@ -41,24 +49,43 @@ COMMAND_MODULES = [
     ".objc_protos",
     ".objc_pool",
     ".objc_instance",
-    ".objc_explain",
 ]
 
-# Track loaded modules for reloading
-_loaded_modules = {}
+# Rarely used commands registered through a trampoline: the module is only
+# imported the first time the command runs, keeping LLDB startup cheap.
+# Entries: (command name, module name, function name, one-line description)
+LAZY_COMMANDS = [
+    ("oexplain", ".objc_explain", "explain_command", "Explain disassembly with LLM"),
+]
+
+# Shared helper modules, in dependency order (each imports only earlier entries).
+# Command modules import these by top-level name (e.g. `from objc_utils import ...`),
+# so they must be reloaded before any command module re-executes those imports.
+SUPPORT_MODULES = [
+    "version",
+    "objc_core",
+    "objc_utils",
+]
 
 
 def _load_command_module(module_name: str, debugger: lldb.SBDebugger) -> bool:
-    """Load or reload a single command module."""
-    global _loaded_modules
+    """
+    Load or reload a single command module.
 
+    sys.modules is the only record of what is loaded: a module found there
+    under its package name is reloaded, anything else is imported.
+
+    Args:
+        module_name: Relative module name (e.g. ".objc_cls")
+        debugger: LLDB debugger to register the command with
+    """
     try:
         # Import or reload the module (relative import from scripts package)
-        if module_name in _loaded_modules:
-            module = importlib.reload(_loaded_modules[module_name])
+        module = sys.modules.get(f"{__name__}{module_name}")
+        if module is not None:
+            importlib.reload(module)
         else:
             module = importlib.import_module(module_name, package=__name__)
-            _loaded_modules[module_name] = module
 
         # Call the module's initialization function if it exists
         if hasattr(module, '__lldb_init_module'):
@@ -70,6 +97,71 @@ def _load_command_module(module_name: str, debugger: lldb.SBDebugger) -> bool:
         return False
 
 
+def _make_lazy_dispatch(module_name: str, function_name: str):
+    """Build a command function that imports its module on first call, then dispatches."""
+    def dispatch(
+        debugger: lldb.SBDebugger,
+        command: str,
+        result: lldb.SBCommandReturnObject,
+        internal_dict: Dict[str, Any]
+    ) -> None:
+        # import_module returns the sys.modules entry once the module is loaded
+        module = importlib.import_module(module_name, package=__name__)
+        getattr(module, function_name)(debugger, command, result, internal_dict)
+
+    return dispatch
+
+
+# Trampolines must be module attributes so `command script add -f` can find them
+for _name, _module_name, _function_name, _ in LAZY_COMMANDS:
+    globals()[f"_lazy_dispatch_{_name}"] = _make_lazy_dispatch(_module_name, _function_name)
+
+# Registration commands never change between sessions, so build them once at import
+LAZY_REGISTRATIONS = [
+    f'command script add -f {__name__}._lazy_dispatch_{name} {name}'
+    for name, _, _, _ in LAZY_COMMANDS
+]
+RELOAD_REGISTRATION = (
+    f'command script add -f {__name__}.reload_commands oreload '
+    f'-h "Reload all LLDB Objective-C command modules"'
+)
+
+
+def _register_commands(debugger: lldb.SBDebugger, commands: List[str]) -> None:
+    """
+    Run registration commands through one command interpreter.
+
+    Going through SBCommandInterpreter directly skips the SBDebugger::HandleCommand
+    wrapper; errors are reported since they no longer reach the console on their own.
+    """
+    ci = debugger.GetCommandInterpreter()
+    for cmd in commands:
+        ret = lldb.SBCommandReturnObject()
+        ci.HandleCommand(cmd, ret)
+        if not ret.Succeeded():
+            print(f"Error registering command ({cmd}): {ret.GetError()}", file=sys.stderr)
+
+
+def _reload_module_by_name(name: str) -> bool:
+    """
+    Reload every loaded copy of a module inside this directory.
+
+    A module can be loaded twice: as part of the package (scripts.objc_cls) and
+    by top-level name through sys.path (objc_cls, used by `from objc_cls import`).
+    Both copies are reloaded so no dependent keeps running stale code.
+
+    Returns:
+        True if at least one copy was reloaded
+    """
+    reloaded = False
+    for full_name in (f"{__name__}.{name}", name):
+        module = sys.modules.get(full_name)
+        if module is not None:
+            importlib.reload(module)
+            reloaded = True
+    return reloaded
+
+
 def reload_commands(
     debugger: lldb.SBDebugger,
     command: str,
@@ -83,33 +175,41 @@ def reload_commands(
     """
     print(f"Reloading LLDB Objective-C Tools v{__version__}...")
 
-    # Reload utils first (other modules depend on it)
-    try:
-        if 'scripts.objc_utils' in sys.modules:
-            importlib.reload(sys.modules['scripts.objc_utils'])
-        elif 'objc_utils' in sys.modules:
-            importlib.reload(sys.modules['objc_utils'])
-    except Exception as e:
-        print(f"Error reloading objc_utils: {e}", file=sys.stderr)
-
-    # Reload version
-    try:
-        if 'scripts.version' in sys.modules:
-            importlib.reload(sys.modules['scripts.version'])
-            from .version import __version__ as new_version
-            print(f"Version: {new_version}")
-        elif 'version' in sys.modules:
-            importlib.reload(sys.modules['version'])
-            from version import __version__ as new_version
-            print(f"Version: {new_version}")
-    except Exception as e:
-        print(f"Error reloading version: {e}", file=sys.stderr)
-
-    # Reload each command module
+    # Reload shared helpers first, in dependency order, so command modules
+    # bind to the fresh code when their own imports re-run
+    for name in SUPPORT_MODULES:
+        try:
+            _reload_module_by_name(name)
+        except Exception as e:
+            print(f"Error reloading {name}: {e}", file=sys.stderr)
+
+    version_module = sys.modules.get(f"{__name__}.version") or sys.modules.get("version")
+    if version_module is not None:
+        print(f"Version: {version_module.__version__}")
+
+    # Reload each command module. COMMAND_MODULES is ordered so that modules
+    # imported by other commands (objc_cls by oprotos/oinstance) come first;
+    # their top-level copy is refreshed right away so later dependents import
+    # the new definitions.
     success_count = 0
     for module_name in COMMAND_MODULES:
         if _load_command_module(module_name, debugger):
             success_count += 1
+            top_level_name = module_name.lstrip('.')
+            if top_level_name in sys.modules:
+                try:
+                    importlib.reload(sys.modules[top_level_name])
+                except Exception as e:
+                    print(f"Error reloading {top_level_name}: {e}", file=sys.stderr)
+
+    # Lazy commands keep their trampoline; only reload modules already imported
+    for _, module_name, _, _ in LAZY_COMMANDS:
+        module = sys.modules.get(f"{__name__}{module_name}")
+        if module is not None:
+            try:
+                importlib.reload(module)
+            except Exception as e:
+                print(f"Error reloading {module_name}: {e}", file=sys.stderr)
 
     print(f"Reloaded {success_count}/{len(COMMAND_MODULES)} command modules")
 
@@ -131,12 +231,9 @@ def __lldb_init_module(debugger: lldb.SBDebugger, internal_dict: Dict[str, Any])
     for module_name in COMMAND_MODULES:
         _load_command_module(module_name, debugger)
 
-    # Register the reload command
-    # Use the full module path for the reload function
-    module_path = f"{__name__}.reload_commands"
-    debugger.HandleCommand(
-        f'command script add -f {module_path} oreload '
-        f'-h "Reload all LLDB Objective-C command modules"'
-    )
+    # Register lazy commands (without importing their modules) and the reload command
+    _register_commands(debugger, LAZY_REGISTRATIONS + [RELOAD_REGISTRATION])
+    for name, _, _, description in LAZY_COMMANDS:
+        print(f"[lldb-objc v{__version__}] '{name}' installed - {description}")
 
     print("LLDB Objective-C Tools loaded. Use 'oreload' to reload commands.")
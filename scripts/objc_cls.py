@@ -51,13 +51,14 @@ Output modes (based on number of matches):
 
 from __future__ import annotations
 
+import functools
 import lldb
 import os
 import re
 import struct
 import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Configurable batch size for class_getName() batching
 # Higher values = fewer expression evaluations but larger expression parsing overhead
@@ -65,6 +66,9 @@ from typing import Any, Dict, List, Optional, Tuple
 # Use --batch-size=N flag to override, or set this default
 DEFAULT_BATCH_SIZE = 35
 
+# Minimum seconds between progress line updates during class enumeration
+PROGRESS_INTERVAL = 0.1
+
 # Add the script directory to path for version import
 script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
@@ -75,14 +79,23 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-from objc_utils import unquote_string
+from objc_core import get_pattern_info
+from objc_utils import (
+    FAST_EXPR_OPTIONS,
+    RUNTIME_LIST_EXPR_OPTIONS,
+    get_pointer_size,
+    unquote_string,
+)
 
 # Type aliases
 TimingDict = Dict[str, Any]
 CacheEntry = Dict[str, Any]
 
 # Global cache for class lists
-# Structure: {process_id: {'classes': [class_names], 'timestamp': time, 'count': total_count}}
+# Structure: {process_id: {'classes': [class_names], 'pointers': {class_name: class_ptr},
+#                          'timestamp': time, 'count': total_count, 'unique_id': id}}
+# 'unique_id' is the process.GetUniqueID() the pointers belong to; the pid key
+# can be reused by a relaunched process, so check it before using 'pointers'.
 _class_cache: Dict[int, CacheEntry] = {}
 
 
@@ -354,7 +367,7 @@ def get_class_image_path(frame: lldb.SBFrame, class_name: str) -> Optional[str]:
     """
     # Get the class object
     class_expr = f'(void *)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return None
@@ -365,7 +378,7 @@ def get_class_image_path(frame: lldb.SBFrame, class_name: str) -> Optional[str]:
 
     # Get the image name using class_getImageName
     image_expr = f'(const char *)class_getImageName((Class)0x{class_ptr:x})'
-    image_result = frame.EvaluateExpression(image_expr)
+    image_result = frame.EvaluateExpression(image_expr, FAST_EXPR_OPTIONS)
 
     if not image_result.IsValid() or image_result.GetError().Fail():
         return None
@@ -395,7 +408,7 @@ def get_class_hierarchy(frame: lldb.SBFrame, class_name: str) -> List[str]:
 
     # Get the class object
     class_expr = f'(void *)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return []
@@ -409,7 +422,7 @@ def get_class_hierarchy(frame: lldb.SBFrame, class_name: str) -> List[str]:
     for _ in range(max_depth):
         # Get current class name
         name_expr = f'(const char *)class_getName((void *)0x{current_class:x})'
-        name_result = frame.EvaluateExpression(name_expr)
+        name_result = frame.EvaluateExpression(name_expr, FAST_EXPR_OPTIONS)
 
         if not name_result.IsValid() or name_result.GetError().Fail():
             break
@@ -423,7 +436,7 @@ def get_class_hierarchy(frame: lldb.SBFrame, class_name: str) -> List[str]:
 
         # Get superclass
         super_expr = f'(void *)class_getSuperclass((void *)0x{current_class:x})'
-        super_result = frame.EvaluateExpression(super_expr)
+        super_result = frame.EvaluateExpression(super_expr, FAST_EXPR_OPTIONS)
 
         if not super_result.IsValid() or super_result.GetError().Fail():
             break
@@ -457,7 +470,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
     # Get the class object
     class_expr = f'(void *)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return []
@@ -468,7 +481,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
     # We need to allocate memory for the count
     count_var_expr = f'(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
+    count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
 
     if not count_var_result.IsValid() or count_var_result.GetError().Fail():
         return []
@@ -477,33 +490,33 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
     # Get ivar list
     ivar_list_expr = f'(void *)class_copyIvarList((Class)0x{class_ptr:x}, (unsigned int *)0x{count_var_ptr:x})'
-    ivar_list_result = frame.EvaluateExpression(ivar_list_expr)
+    ivar_list_result = frame.EvaluateExpression(ivar_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
 
     if not ivar_list_result.IsValid() or ivar_list_result.GetError().Fail():
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     ivar_list_ptr = ivar_list_result.GetValueAsUnsigned()
 
     # Read the count
     count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
+    count_read_result = frame.EvaluateExpression(count_read_expr, FAST_EXPR_OPTIONS)
 
     if not count_read_result.IsValid() or count_read_result.GetError().Fail():
         if ivar_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})')
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})', FAST_EXPR_OPTIONS)
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     ivar_count = count_read_result.GetValueAsUnsigned()
 
     if ivar_count == 0 or ivar_list_ptr == 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     # Read ivar list as array of pointers
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    pointer_size = get_pointer_size(frame)
     array_size = ivar_count * pointer_size
 
     error = lldb.SBError()
@@ -511,8 +524,8 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
     if not error.Success():
         if ivar_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})')
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})', FAST_EXPR_OPTIONS)
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     # Parse ivar pointers
@@ -556,14 +569,13 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 '''
 
     # Execute the batch expression
-    batch_result = frame.EvaluateExpression(batch_expr)
+    batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
 
     if batch_result.IsValid() and not batch_result.GetError().Fail():
         info_ptr = batch_result.GetValueAsUnsigned()
 
         if info_ptr != 0:
-            # Read the entire info struct in one memory read
-            error = lldb.SBError()
+            # Read the entire info struct in one memory read (reusing the SBError)
             info_bytes = process.ReadMemory(info_ptr, info_struct_size, error)
 
             if error.Success():
@@ -585,6 +597,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
                     # Read name string from memory
                     ivar_name = process.ReadCStringFromMemory(name_ptr, 256, error)
                     if not error.Success() or not ivar_name:
+                        error.Clear()
                         continue
 
                     # Read type string from memory
@@ -593,6 +606,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
                     else:
                         ivar_type = process.ReadCStringFromMemory(type_ptr, 256, error)
                         if not error.Success() or not ivar_type:
+                            error.Clear()
                             ivar_type = "?"
 
                     # offset_val is already the offset (stored as pointer-sized value)
@@ -601,7 +615,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
                     ivars.append((ivar_name, ivar_type, ivar_offset))
 
             # Free the info struct
-            frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})', FAST_EXPR_OPTIONS)
     else:
         # Fallback to individual calls
         for ivar_ptr in ivar_pointers:
@@ -610,7 +624,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
             # Get ivar name
             name_expr = f'(const char *)ivar_getName((void *)0x{ivar_ptr:x})'
-            name_result = frame.EvaluateExpression(name_expr)
+            name_result = frame.EvaluateExpression(name_expr, FAST_EXPR_OPTIONS)
 
             if not name_result.IsValid() or name_result.GetError().Fail():
                 continue
@@ -625,7 +639,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
             # Get ivar type encoding
             type_expr = f'(const char *)ivar_getTypeEncoding((void *)0x{ivar_ptr:x})'
-            type_result = frame.EvaluateExpression(type_expr)
+            type_result = frame.EvaluateExpression(type_expr, FAST_EXPR_OPTIONS)
 
             if not type_result.IsValid() or type_result.GetError().Fail():
                 ivar_type = "?"
@@ -643,7 +657,7 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
             # Get ivar offset
             offset_expr = f'(ptrdiff_t)ivar_getOffset((void *)0x{ivar_ptr:x})'
-            offset_result = frame.EvaluateExpression(offset_expr)
+            offset_result = frame.EvaluateExpression(offset_expr, FAST_EXPR_OPTIONS)
 
             if not offset_result.IsValid() or offset_result.GetError().Fail():
                 ivar_offset = None
@@ -654,8 +668,8 @@ def get_class_ivars(frame: lldb.SBFrame, class_name: str) -> List[Dict[str, str]
 
     # Clean up
     if ivar_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})')
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{ivar_list_ptr:x})', FAST_EXPR_OPTIONS)
+    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
 
     return ivars
 
@@ -737,6 +751,8 @@ def parse_property_attributes(attr_string: str) -> Dict[str, Any]:
     return (type_string, attributes, ivar_name)
 
 
+# Pure and recursive (pointers, arrays): the cache also covers the inner encodings
+@functools.lru_cache(maxsize=2048)
 def decode_type_encoding(type_enc: str) -> str:
     """
     Decode Objective-C type encoding into human-readable type.
@@ -966,7 +982,7 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
     # Get the class object
     class_expr = f'(void *)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return []
@@ -977,7 +993,7 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
     # Allocate memory for the count
     count_var_expr = f'(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
+    count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
 
     if not count_var_result.IsValid() or count_var_result.GetError().Fail():
         return []
@@ -986,33 +1002,33 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
     # Get property list
     prop_list_expr = f'(void *)class_copyPropertyList((Class)0x{class_ptr:x}, (unsigned int *)0x{count_var_ptr:x})'
-    prop_list_result = frame.EvaluateExpression(prop_list_expr)
+    prop_list_result = frame.EvaluateExpression(prop_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
 
     if not prop_list_result.IsValid() or prop_list_result.GetError().Fail():
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     prop_list_ptr = prop_list_result.GetValueAsUnsigned()
 
     # Read the count
     count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
+    count_read_result = frame.EvaluateExpression(count_read_expr, FAST_EXPR_OPTIONS)
 
     if not count_read_result.IsValid() or count_read_result.GetError().Fail():
         if prop_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})')
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})', FAST_EXPR_OPTIONS)
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     prop_count = count_read_result.GetValueAsUnsigned()
 
     if prop_count == 0 or prop_list_ptr == 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     # Read property list as array of pointers
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    pointer_size = get_pointer_size(frame)
     array_size = prop_count * pointer_size
 
     error = lldb.SBError()
@@ -1020,8 +1036,8 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
     if not error.Success():
         if prop_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})')
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})', FAST_EXPR_OPTIONS)
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     # Parse property pointers
@@ -1063,14 +1079,13 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 '''
 
     # Execute the batch expression
-    batch_result = frame.EvaluateExpression(batch_expr)
+    batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
 
     if batch_result.IsValid() and not batch_result.GetError().Fail():
         info_ptr = batch_result.GetValueAsUnsigned()
 
         if info_ptr != 0:
-            # Read the entire info struct in one memory read
-            error = lldb.SBError()
+            # Read the entire info struct in one memory read (reusing the SBError)
             info_bytes = process.ReadMemory(info_ptr, info_struct_size, error)
 
             if error.Success():
@@ -1091,6 +1106,7 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
                     # Read name string from memory
                     prop_name = process.ReadCStringFromMemory(name_ptr, 256, error)
                     if not error.Success() or not prop_name:
+                        error.Clear()
                         continue
 
                     # Read attributes string from memory
@@ -1099,12 +1115,13 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
                     else:
                         prop_attrs = process.ReadCStringFromMemory(attr_ptr, 512, error)
                         if not error.Success() or not prop_attrs:
+                            error.Clear()
                             prop_attrs = ""
 
                     properties.append((prop_name, prop_attrs))
 
             # Free the info struct
-            frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})', FAST_EXPR_OPTIONS)
     else:
         # Fallback to individual calls
         for prop_ptr in prop_pointers:
@@ -1113,7 +1130,7 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
             # Get property name
             name_expr = f'(const char *)property_getName((void *)0x{prop_ptr:x})'
-            name_result = frame.EvaluateExpression(name_expr)
+            name_result = frame.EvaluateExpression(name_expr, FAST_EXPR_OPTIONS)
 
             if not name_result.IsValid() or name_result.GetError().Fail():
                 continue
@@ -1128,7 +1145,7 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
             # Get property attributes
             attr_expr = f'(const char *)property_getAttributes((void *)0x{prop_ptr:x})'
-            attr_result = frame.EvaluateExpression(attr_expr)
+            attr_result = frame.EvaluateExpression(attr_expr, FAST_EXPR_OPTIONS)
 
             if not attr_result.IsValid() or attr_result.GetError().Fail():
                 prop_attrs = ""
@@ -1147,8 +1164,8 @@ def get_class_properties(frame: lldb.SBFrame, class_name: str) -> List[Dict[str,
 
     # Clean up
     if prop_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})')
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{prop_list_ptr:x})', FAST_EXPR_OPTIONS)
+    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
 
     return properties
 
@@ -1162,28 +1179,28 @@ def matches_pattern(class_name: str, pattern: Optional[str]) -> bool:
     if pattern is None:
         return True
 
-    # Check if pattern contains wildcard characters
-    has_wildcards = '*' in pattern or '?' in pattern
+    # Wildcard check and regex compilation are cached per pattern
+    has_wildcards, matcher = get_pattern_info(pattern)
 
     if has_wildcards:
-        # Convert wildcard pattern to regex
-        # Escape special regex characters except * and ?
-        regex_pattern = re.escape(pattern)
-        # Replace escaped wildcards with regex equivalents
-        regex_pattern = regex_pattern.replace(r'\*', '.*')
-        regex_pattern = regex_pattern.replace(r'\?', '.')
-        # Make it match the whole string and case-insensitive
-        regex_pattern = f'^{regex_pattern}$'
-        try:
-            return bool(re.match(regex_pattern, class_name, re.IGNORECASE))
-        except re.error:
-            # Fallback to exact match if regex is invalid
-            return class_name == pattern
+        return matcher(class_name)
     else:
         # Exact matching (case-sensitive)
         return class_name == pattern
 
 
+def compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """
+    Resolve a pattern once into a predicate equivalent to matches_pattern(name, pattern).
+    Use this when filtering many class names against the same pattern.
+    """
+    has_wildcards, matcher = get_pattern_info(pattern)
+
+    if has_wildcards:
+        return matcher
+    return pattern.__eq__
+
+
 def matches_dylib_pattern(dylib_path: str, pattern: str) -> bool:
     """
     Check if a dylib path matches the given pattern.
@@ -1281,34 +1298,44 @@ def read_consolidated_string_buffer(
     batch_size: int,
     process: lldb.SBProcess,
     frame: lldb.SBFrame,
-    pattern: Optional[str] = None
+    error: Optional[lldb.SBError] = None,
+    class_pointers: Optional[Sequence[int]] = None,
+    pointer_map: Optional[Dict[str, int]] = None
 ) -> List[str]:
     """
     Read class names from a consolidated string buffer.
 
+    No pattern filtering happens here: batches feed the per-process cache,
+    which must hold the complete class list so it can serve any later pattern.
+
     Args:
         batch_result: SBValue pointing to consolidated buffer
         batch_size: Number of classes in the batch
         process: SBProcess object
         frame: SBFrame object for cleanup
-        pattern: Optional pattern to filter by
+        error: SBError to reuse for memory reads (avoids a per-batch allocation)
+        class_pointers: Class pointers of the batch, in order (with pointer_map)
+        pointer_map: If given, filled with class_name -> class pointer
 
     Returns:
-        List of class names matching the pattern
+        List of all class names in the batch
     """
     buffer_ptr = batch_result.GetValueAsUnsigned()
 
     if buffer_ptr == 0:
         return []
 
-    error = lldb.SBError()
+    if error is None:
+        error = lldb.SBError()
+    else:
+        error.Clear()
 
     # Read offset array (batch_size + 1 integers)
     offset_array_size = (batch_size + 1) * 4
     offset_bytes = process.ReadMemory(buffer_ptr, offset_array_size, error)
 
     if not error.Success():
-        frame.EvaluateExpression(f'(void)free((void *)0x{buffer_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{buffer_ptr:x})', FAST_EXPR_OPTIONS)
         return []
 
     # Parse offsets
@@ -1320,7 +1347,7 @@ def read_consolidated_string_buffer(
     string_data = process.ReadMemory(string_data_ptr, total_string_size, error)
 
     # Free the buffer
-    frame.EvaluateExpression(f'(void)free((void *)0x{buffer_ptr:x})')
+    frame.EvaluateExpression(f'(void)free((void *)0x{buffer_ptr:x})', FAST_EXPR_OPTIONS)
 
     if not error.Success():
         return []
@@ -1347,13 +1374,13 @@ def read_consolidated_string_buffer(
         # Extract string
         try:
             class_name = string_data[offset:next_offset - 1].decode('utf-8')
-
-            # Apply pattern filter
-            if pattern is None or matches_pattern(class_name, pattern):
-                class_names.append(class_name)
         except (UnicodeDecodeError, IndexError):
             continue
 
+        class_names.append(class_name)
+        if pointer_map is not None and class_name:
+            pointer_map[class_name] = class_pointers[i]
+
     return class_names
 
 
@@ -1375,7 +1402,7 @@ def try_exact_class_match(
 
     # Try to get the class directly
     class_expr = f'(void *)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return None, None
@@ -1386,7 +1413,7 @@ def try_exact_class_match(
 
     # Verify the class name matches (in case of partial match)
     name_expr = f'(const char *)class_getName((void *)0x{class_ptr:x})'
-    name_result = frame.EvaluateExpression(name_expr)
+    name_result = frame.EvaluateExpression(name_expr, FAST_EXPR_OPTIONS)
 
     if not name_result.IsValid() or name_result.GetError().Fail():
         return None, None
@@ -1477,7 +1504,7 @@ def get_all_classes(
 
         # Filter by pattern
         if pattern:
-            filtered_classes = [c for c in all_classes if matches_pattern(c, pattern)]
+            filtered_classes = list(filter(compile_pattern(pattern), all_classes))
         else:
             filtered_classes = all_classes
 
@@ -1510,7 +1537,7 @@ def get_all_classes(
     # Steps 1-3: Same as Phase 1/2 (get class pointer array via bulk read)
     # Allocate count variable
     count_var_expr = f'(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
+    count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     if not count_var_result.IsValid() or count_var_result.GetError().Fail():
@@ -1521,12 +1548,12 @@ def get_all_classes(
 
     # Get class list using objc_copyClassList
     class_list_expr = f'(void *)objc_copyClassList((unsigned int *)0x{count_var_ptr:x})'
-    class_list_result = frame.EvaluateExpression(class_list_expr)
+    class_list_result = frame.EvaluateExpression(class_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     if not class_list_result.IsValid() or class_list_result.GetError().Fail():
         print(f"Warning: objc_copyClassList failed: {class_list_result.GetError()}")
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
         return []
 
@@ -1534,15 +1561,15 @@ def get_all_classes(
 
     # Read the count
     count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
+    count_read_result = frame.EvaluateExpression(count_read_expr, FAST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     if not count_read_result.IsValid() or count_read_result.GetError().Fail():
         print(f"Warning: Failed to read class count")
         if class_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
         return []
 
@@ -1553,7 +1580,7 @@ def get_all_classes(
 
     # Bulk read the class pointer array (same as Phase 1/2)
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    pointer_size = get_pointer_size(frame)
     array_size = class_count * pointer_size
 
     error = lldb.SBError()
@@ -1563,9 +1590,9 @@ def get_all_classes(
     if not error.Success():
         print(f"Error: Failed to read class array from memory: {error}")
         if class_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
         return []
 
@@ -1582,10 +1609,13 @@ def get_all_classes(
 
     # PHASE 3 OPTIMIZATION: Use consolidated string buffers
     class_names = []
+    class_ptr_map: Dict[str, int] = {}
 
     num_batches = (len(class_pointers) + batch_size - 1) // batch_size
 
-    if len(class_pointers) > 1000:
+    show_progress = len(class_pointers) > 1000
+    last_progress_t = time.monotonic()
+    if show_progress:
         print(f"Processing {len(class_pointers)} classes in {num_batches} batches (batch_size={batch_size})...")
 
     for batch_idx in range(0, len(class_pointers), batch_size):
@@ -1597,7 +1627,7 @@ def get_all_classes(
         batch_expr = build_batch_expression(batch)
 
         # Execute batch expression
-        batch_result = frame.EvaluateExpression(batch_expr)
+        batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
         timing['expression_count'] += 1
 
         if not batch_result.IsValid() or batch_result.GetError().Fail():
@@ -1606,7 +1636,7 @@ def get_all_classes(
                 if class_ptr == 0:
                     continue
                 class_name_expr = f'(const char *)class_getName((void *)0x{class_ptr:x})'
-                class_name_result = frame.EvaluateExpression(class_name_expr)
+                class_name_result = frame.EvaluateExpression(class_name_expr, FAST_EXPR_OPTIONS)
                 timing['expression_count'] += 1
                 if class_name_result.IsValid():
                     class_name = class_name_result.GetSummary()
@@ -1614,23 +1644,28 @@ def get_all_classes(
                         class_name = unquote_string(class_name)
                         # Add all classes to cache (no pattern filtering here)
                         class_names.append(class_name)
+                        class_ptr_map[class_name] = class_ptr
             continue
 
-        # Read consolidated string buffer (without pattern filtering - get all classes)
+        # Read consolidated string buffer (all classes - filtering happens once at the end)
         batch_names = read_consolidated_string_buffer(
-            batch_result, current_batch_size, process, frame, pattern=None
+            batch_result, current_batch_size, process, frame, error,
+            class_pointers=batch, pointer_map=class_ptr_map
         )
         timing['expression_count'] += 1  # For free() in read_consolidated_string_buffer
         timing['memory_read_count'] += 2  # One for offsets, one for string data
 
         class_names.extend(batch_names)
 
-        # Progress indicator for large operations
-        if len(class_pointers) > 1000 and (batch_idx // batch_size) % 10 == 0 and batch_idx > 0:
-            progress = (batch_idx / len(class_pointers)) * 100
-            print(f"  Progress: {progress:.0f}%", end='\r')
+        # Progress indicator for large operations, throttled to one write per interval
+        if show_progress:
+            now = time.monotonic()
+            if now - last_progress_t > PROGRESS_INTERVAL:
+                last_progress_t = now
+                sys.stdout.write(f"  Progress: {batch_idx * 100 // len(class_pointers)}%\r")
+                sys.stdout.flush()
 
-    if len(class_pointers) > 1000:
+    if show_progress:
         print()  # Clear progress line
 
     timing['batching'] = time.time() - batching_start
@@ -1638,24 +1673,26 @@ def get_all_classes(
 
     # Clean up allocated memory
     if class_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     timing['cleanup'] = time.time() - cleanup_start
     timing['total'] = time.time() - start_time
 
-    # Store in cache (unfiltered list)
+    # Store in cache (class_names is the complete, unfiltered list)
     _class_cache[pid] = {
         'classes': class_names,
+        'pointers': class_ptr_map,
         'count': class_count,
-        'timestamp': time.time()
+        'timestamp': time.time(),
+        'unique_id': process.GetUniqueID()
     }
 
-    # Filter by pattern if needed
+    # Filter by pattern if needed - the only filtering pass on a cache miss
     if pattern:
-        filtered_classes = [c for c in class_names if matches_pattern(c, pattern)]
+        filtered_classes = list(filter(compile_pattern(pattern), class_names))
     else:
         filtered_classes = class_names
 
@@ -7,12 +7,43 @@ without any LLDB runtime. All functions are pure Python logic for:
 - String parsing and formatting
 - Pattern matching and filtering
 - Data structure manipulation
+- Decoding Objective-C runtime structures read from target memory
 """
 
 from __future__ import annotations
 
+import array
+import functools
 import re
-from typing import Optional, Tuple
+import struct
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Objective-C method symbols: +[ClassName selector] or -[ClassName selector]
+# The selector part can contain colons and arguments
+_INHERITED_RE = re.compile(r'^[+-]\[(\w+)\s+(.+)\]$')
+# Same, with optional category: +/-[ClassName(CategoryName) selector]
+_CATEGORY_RE = re.compile(r'^[+-]\[(\w+)(?:\((\w+)\))?\s+(.+)\]$')
+
+# Method signature prefix -> (is_instance_method, selector start index)
+_SIGNATURE_PREFIXES = {'-[': (True, 2), '+[': (False, 2)}
+
+# Method name template by is_instance_method
+_METHOD_NAME_FORMATS = {True: '-[{} {}]', False: '+[{} {}]'}
+
+# Cache of per-pattern matching info: pattern -> (has_wildcards, matcher_or_lower)
+# - has_wildcards=True:  second element is a matcher callable (name -> bool)
+# - has_wildcards=False: second element is the lowercased pattern
+_pattern_info: Dict[str, Tuple[bool, Union[Callable[[str], bool], str]]] = {}
+
+# method_list_t (objc4, 64-bit): uint32 entsizeAndFlags, uint32 count, entries.
+# Flags live in the top 16 and bottom 2 bits of the first word.
+METHOD_LIST_FLAG_MASK = 0xffff0003
+SMALL_METHOD_LIST_FLAG = 0x80000000
+DIRECT_SELECTORS_FLAG = 0x40000000
+# Strips pointer authentication bits from signed IMPs (arm64e)
+ADDRESS_MASK = 0x00007fffffffffff
+# Anything larger is taken as a misread rather than a real list
+MAX_METHOD_LIST_COUNT = 0x10000
 
 
 def unquote_string(s: Optional[str]) -> Optional[str]:
@@ -36,9 +67,62 @@ def unquote_string(s: Optional[str]) -> Optional[str]:
         >>> unquote_string('no quotes')
         'no quotes'
     """
-    if s and len(s) >= 2 and s.startswith('"') and s.endswith('"'):
-        return s[1:-1].replace('\\"', '"')
-    return s
+    # Most values from LLDB are unquoted: reject on the first character
+    if not s or s[0] != '"':
+        return s
+    if len(s) < 2 or s[-1] != '"':
+        return s
+    inner = s[1:-1]
+    return inner.replace('\\"', '"') if '\\"' in inner else inner
+
+
+def get_pattern_info(pattern: str) -> Tuple[bool, Union[Callable[[str], bool], str]]:
+    """
+    Get cached matching info for a wildcard pattern.
+
+    The wildcard check and regex compilation happen once per pattern; later
+    calls are a single dict lookup. Wildcards are * (any characters) and
+    ? (single character), matched against the whole string, case-insensitive.
+
+    Wildcard matchers first test for the longest literal run in the pattern
+    (e.g. "set" in "*set*") with a substring check, so most non-matching
+    names are rejected without running the regex engine.
+
+    Args:
+        pattern: The pattern string (may contain * and ? wildcards)
+
+    Returns:
+        Tuple of (has_wildcards, matcher_or_lower)
+        - (True, matcher callable) if the pattern contains wildcards
+        - (False, lowercased pattern) otherwise
+
+    Examples:
+        >>> get_pattern_info('IDS*')[1]('IDSService')
+        True
+        >>> get_pattern_info('Service')
+        (False, 'service')
+    """
+    info = _pattern_info.get(pattern)
+    if info is None:
+        if '*' in pattern or '?' in pattern:
+            info = (True, _compile_wildcard(pattern))
+        else:
+            info = (False, pattern.lower())
+        _pattern_info[pattern] = info
+    return info
+
+
+def _compile_wildcard(pattern: str) -> Callable[[str], bool]:
+    """Build a case-insensitive full-string matcher for a wildcard pattern."""
+    # Escape special regex characters, then map wildcards to regex equivalents
+    regex_pattern = re.escape(pattern).replace(r'\*', '.*').replace(r'\?', '.')
+    regex_match = re.compile(f'^{regex_pattern}$', re.IGNORECASE).match
+
+    literal = max(re.split(r'[*?]', pattern), key=len).lower()
+    if not literal:
+        return lambda name: regex_match(name) is not None
+
+    return lambda name: literal in name.lower() and regex_match(name) is not None
 
 
 def parse_method_signature(command: str) -> Tuple[Optional[bool], Optional[str], Optional[str], Optional[str]]:
@@ -56,28 +140,22 @@ def parse_method_signature(command: str) -> Tuple[Optional[bool], Optional[str],
     command = command.strip()
 
     # Determine method type based on prefix
-    if command.startswith('-['):
-        is_instance_method = True
-        start_idx = 2
-    elif command.startswith('+['):
-        is_instance_method = False
-        start_idx = 2
-    elif command.startswith('['):
+    entry = _SIGNATURE_PREFIXES.get(command[:2])
+    if entry is not None:
+        is_instance_method, start_idx = entry
+    elif command[:1] == '[':
         is_instance_method = None  # Signal auto-detect needed
         start_idx = 1
     else:
         return None, None, None, "Expected -[ClassName selector:], +[ClassName selector:], or [ClassName selector:]"
 
     # Remove the leading prefix and trailing ]
-    method_str = command[start_idx:-1] if command.endswith(']') else command[start_idx:]
-    parts = method_str.split(None, 1)  # Split on first whitespace
-
-    if len(parts) != 2:
+    method_str = command[start_idx:].removesuffix(']')
+    try:
+        class_name, selector = method_str.split(None, 1)  # Split on first whitespace
+    except ValueError:
         return None, None, None, "Invalid format. Expected: [ClassName selector:]"
 
-    class_name = parts[0]
-    selector = parts[1]
-
     return is_instance_method, class_name, selector, None
 
 
@@ -93,10 +171,10 @@ def format_method_name(class_name: str, selector: str, is_instance_method: bool)
     Returns:
         Formatted string like "-[NSString length]" or "+[NSDate date]"
     """
-    prefix = '-' if is_instance_method else '+'
-    return f"{prefix}[{class_name} {selector}]"
+    return _METHOD_NAME_FORMATS[bool(is_instance_method)].format(class_name, selector)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_inherited_class(
     symbol_name: str,
     requested_class: str,
@@ -116,10 +194,7 @@ def extract_inherited_class(
         The superclass name if inherited, None if it's the requested class's own method
     """
     # Match Objective-C method symbol: +[ClassName selector] or -[ClassName selector]
-    # The selector part can contain colons and arguments
-    prefix = '-' if is_instance_method else '+'
-    pattern = rf'^[+-]\[(\w+)\s+(.+)\]$'
-    match = re.match(pattern, symbol_name)
+    match = _INHERITED_RE.match(symbol_name)
 
     if match:
         symbol_class = match.group(1)
@@ -134,6 +209,7 @@ def extract_inherited_class(
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_category_from_symbol(symbol_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Extract class name, category name, and selector from an Objective-C symbol.
@@ -146,9 +222,106 @@ def extract_category_from_symbol(symbol_name: str) -> Tuple[Optional[str], Optio
         category_name is None if the method is not from a category
     """
     # Match: +/-[ClassName(CategoryName) selector] or +/-[ClassName selector]
-    pattern = r'^[+-]\[(\w+)(?:\((\w+)\))?\s+(.+)\]$'
-    match = re.match(pattern, symbol_name)
+    match = _CATEGORY_RE.match(symbol_name)
 
     if match:
         return match.group(1), match.group(2), match.group(3)
     return None, None, None
+
+
+def parse_method_list_header(header: bytes) -> Optional[Tuple[int, int, bool]]:
+    """
+    Decode a 64-bit method_list_t header.
+
+    Args:
+        header: The list's first 8 bytes (entsizeAndFlags, count)
+
+    Returns:
+        Tuple of (entsize, count, is_small), or None for layouts the reader
+        doesn't handle: implausible counts or sizes, and relative lists using
+        shared-cache direct selectors. is_small marks relative method_t entries.
+    """
+    entsize_and_flags, count = struct.unpack('<II', header)
+    entsize = entsize_and_flags & ~METHOD_LIST_FLAG_MASK
+    is_small = bool(entsize_and_flags & SMALL_METHOD_LIST_FLAG)
+    if count == 0:
+        return entsize, 0, is_small
+    if count > MAX_METHOD_LIST_COUNT or entsize < 12:
+        return None
+    if is_small:
+        if entsize_and_flags & DIRECT_SELECTORS_FLAG or entsize % 4:
+            return None
+    elif entsize < 24 or entsize % 8:
+        return None
+    return entsize, count, is_small
+
+
+def parse_method_entries(entries: bytes, entsize: int) -> Tuple[List[int], List[int]]:
+    """
+    Split pointer method_t entries (SEL name, const char *types, IMP imp).
+
+    Returns:
+        Tuple of (selector pointers, IMPs with pointer authentication stripped)
+    """
+    fields = array.array('Q')
+    fields.frombytes(entries)
+    stride = entsize // 8
+    return list(fields[0::stride]), [imp & ADDRESS_MASK for imp in fields[2::stride]]
+
+
+def parse_small_method_entries(entries: bytes, entries_ptr: int, entsize: int) -> Tuple[List[int], List[int]]:
+    """
+    Resolve relative method_t entries (int32 offsets to a selector ref, types, IMP).
+
+    The IMP offset is not used: a swizzled relative method keeps its original
+    offset and the new IMP lives in a runtime side table, so callers look IMPs
+    up through the runtime with the returned Method pointers.
+
+    Args:
+        entries: The list's entries as read from the target
+        entries_ptr: Address of the first entry
+        entsize: Entry size from the list header
+
+    Returns:
+        Tuple of (selector ref addresses, Method pointers). Method pointers
+        carry the runtime's low-bit tag for relative entries.
+    """
+    fields = array.array('i')
+    fields.frombytes(entries)
+    stride = entsize // 4
+    starts = range(entries_ptr, entries_ptr + len(fields[0::stride]) * entsize, entsize)
+    selrefs = [start + offset for start, offset in zip(starts, fields[0::stride])]
+    return selrefs, [start | 1 for start in starts]
+
+
+def selref_span(selrefs: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """
+    Range covering a list of selector ref addresses, for reading them in one go.
+
+    Returns:
+        Tuple of (start address, size in bytes), or None if the refs are not
+        8-byte slots of one array (e.g. misread offsets)
+    """
+    if not selrefs:
+        return None
+    lo = min(selrefs)
+    if any((ref - lo) % 8 for ref in selrefs):
+        return None
+    return lo, max(selrefs) - lo + 8
+
+
+def gather_selrefs(data: bytes, start: int, selrefs: Sequence[int]) -> List[int]:
+    """
+    Pick each selector ref's value out of a block read from selref_span().
+
+    Args:
+        data: Bytes read from start
+        start: Address data was read from
+        selrefs: Selector ref addresses inside the block
+
+    Returns:
+        The SEL stored at each ref, in selrefs order
+    """
+    refs = array.array('Q')
+    refs.frombytes(data)
+    return [refs[(ref - start) // 8] for ref in selrefs]
@@ -16,21 +16,15 @@ an LLM for analysis (llm by default, claude with --claude flag).
 from __future__ import annotations
 
 import lldb
-import os
-import subprocess
-import sys
-import time
 from typing import Any, Dict
 
-# Add the script directory to path for version import
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
+# subprocess, time and version are imported where used: most sessions never
+# run oexplain, so loading this module at LLDB startup should stay cheap.
 
-try:
-    from version import __version__
-except ImportError:
-    __version__ = "unknown"
+# Command interpreter per debugger, keyed by debugger.GetID()
+# (SWIG wraps the debugger in a new object per command, so id() is not stable;
+# the cache is reset when oreload reloads this module)
+_interpreter_cache: Dict[int, lldb.SBCommandInterpreter] = {}
 
 
 CLAUDE_PROMPT = """Here is some arm64 disassembly. Explain very concisely what this function does as you would to a security researcher. Avoid any boilerplate blurb. Include a compact view of the first 5 functions it will call."""
@@ -38,6 +32,13 @@ CLAUDE_PROMPT = """Here is some arm64 disassembly. Explain very concisely what t
 CLAUDE_ANNOTATE_PROMPT = """Here is some arm64 disassembly. Reproduce the disassembly exactly, but add concise high-level annotations as comments on lines where the purpose isn't obvious. Focus on what's happening semantically (e.g., "// get string length", "// check for nil", "// call objc_msgSend with selector"). Skip trivial operations like stack frame setup. Keep annotations brief."""
 
 
+# Built once at import; the registration is the same for every session
+REGISTRATION = f'command script add -f {__name__}.explain_command oexplain'
+
+# Flags selecting annotate mode
+ANNOTATE_FLAGS = frozenset(('-a', '--annotate'))
+
+
 def get_disassembly(debugger: lldb.SBDebugger, address: str) -> tuple[bool, str]:
     """
     Get disassembly at the given address using LLDB's disass command.
@@ -50,7 +51,11 @@ def get_disassembly(debugger: lldb.SBDebugger, address: str) -> tuple[bool, str]
         (success, output) tuple
     """
     result = lldb.SBCommandReturnObject()
-    ci = debugger.GetCommandInterpreter()
+    debugger_id = debugger.GetID()
+    ci = _interpreter_cache.get(debugger_id)
+    if ci is None:
+        ci = debugger.GetCommandInterpreter()
+        _interpreter_cache[debugger_id] = ci
 
     # Use disass -a to disassemble at address
     ci.HandleCommand(f"disass -a {address}", result)
@@ -61,6 +66,46 @@ def get_disassembly(debugger: lldb.SBDebugger, address: str) -> tuple[bool, str]
         return False, result.GetError()
 
 
+def run_cli(argv: list[str], input_text: str, timeout: int) -> tuple[int, str, str]:
+    """
+    Run a CLI with text on stdin and collect its output.
+
+    Output is captured as bytes and decoded once at the end rather than
+    incrementally while reading the pipes.
+
+    Args:
+        argv: Command and arguments
+        input_text: Text to write to the process's stdin
+        timeout: Seconds to wait before killing the process
+
+    Returns:
+        (returncode, stdout, stderr) tuple
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran past the timeout (it is killed first)
+    """
+    import subprocess
+
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = proc.communicate(input=input_text.encode('utf-8'), timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+
+    return (
+        proc.returncode,
+        stdout.decode('utf-8', errors='replace'),
+        stderr.decode('utf-8', errors='replace'),
+    )
+
+
 def call_llm(disassembly: str, prompt: str = CLAUDE_PROMPT) -> tuple[bool, str]:
     """
     Send disassembly to llm CLI for explanation.
@@ -72,20 +117,17 @@ def call_llm(disassembly: str, prompt: str = CLAUDE_PROMPT) -> tuple[bool, str]:
     Returns:
         (success, output) tuple
     """
-    full_prompt = f"{prompt}\n\n{disassembly}"
+    import subprocess
 
+    # Disassembly goes through stdin (llm prepends piped input to the prompt),
+    # avoiding an argv copy of the whole listing and the ARG_MAX limit
     try:
-        result = subprocess.run(
-            ["llm", full_prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        returncode, stdout, stderr = run_cli(["llm", prompt], disassembly, timeout=120)
 
-        if result.returncode == 0:
-            return True, result.stdout
+        if returncode == 0:
+            return True, stdout
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip() or f"exit code {result.returncode}"
+            error_msg = stderr.strip() or stdout.strip() or f"exit code {returncode}"
             return False, f"llm CLI error: {error_msg}"
 
     except subprocess.TimeoutExpired:
@@ -107,24 +149,25 @@ def call_claude(disassembly: str, prompt: str = CLAUDE_PROMPT) -> tuple[bool, st
     Returns:
         (success, output) tuple
     """
-    full_prompt = f"{prompt}\n\n{disassembly}"
+    import subprocess
 
+    # Disassembly goes through stdin (claude -p reads piped input as context),
+    # avoiding an argv copy of the whole listing and the ARG_MAX limit
     try:
-        result = subprocess.run(
+        returncode, stdout, stderr = run_cli(
             [
                 "claude",
-                "-p", full_prompt,
+                "-p", prompt,
                 "--model", "opus",
             ],
-            capture_output=True,
-            text=True,
+            disassembly,
             timeout=60,
         )
 
-        if result.returncode == 0:
-            return True, result.stdout
+        if returncode == 0:
+            return True, stdout
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip() or f"exit code {result.returncode}"
+            error_msg = stderr.strip() or stdout.strip() or f"exit code {returncode}"
             return False, f"Claude CLI error: {error_msg}"
 
     except subprocess.TimeoutExpired:
@@ -137,8 +180,7 @@ def call_claude(disassembly: str, prompt: str = CLAUDE_PROMPT) -> tuple[bool, st
 
 def format_output(text: str) -> str:
     """Format output with >> prefix on each line."""
-    lines = text.rstrip().split('\n')
-    return '\n'.join(f">> {line}" for line in lines)
+    return '>> ' + text.rstrip().replace('\n', '\n>> ')
 
 
 def parse_args(command: str) -> tuple[bool, bool, str]:
@@ -156,15 +198,13 @@ def parse_args(command: str) -> tuple[bool, bool, str]:
     use_claude = False
     address_parts = []
 
-    i = 0
-    while i < len(parts):
-        if parts[i] in ('-a', '--annotate'):
+    for part in parts:
+        if part in ANNOTATE_FLAGS:
             annotate = True
-        elif parts[i] == '--claude':
+        elif part == '--claude':
             use_claude = True
         else:
-            address_parts.append(parts[i])
-        i += 1
+            address_parts.append(part)
 
     return annotate, use_claude, ' '.join(address_parts)
 
@@ -208,8 +248,10 @@ def explain_command(
     mode_desc = "annotating" if annotate else "explaining"
     backend = "Claude" if use_claude else "llm"
 
-    # Call LLM
-    print(f"Sending {len(disasm.splitlines())} lines of disassembly to {backend} ({mode_desc})...")
+    # Call LLM (count newlines in place rather than building a list of lines)
+    line_count = disasm.count('\n') + (0 if disasm.endswith('\n') else 1)
+    print(f"Sending {line_count} lines of disassembly to {backend} ({mode_desc})...")
+    import time
     start_time = time.time()
     if use_claude:
         success, explanation = call_claude(disasm, prompt)
@@ -229,8 +271,15 @@ def explain_command(
 
 def __lldb_init_module(debugger: lldb.SBDebugger, internal_dict: Dict[str, Any]) -> None:
     """Initialize the oexplain command when this module is loaded in LLDB."""
-    module_path = f"{__name__}.explain_command"
-    debugger.HandleCommand(
-        f'command script add -f {module_path} oexplain'
-    )
+    import importlib
+    import importlib.util
+
+    version_spec = importlib.util.find_spec(f"{__package__}.version" if __package__ else "version")
+    __version__ = importlib.import_module(version_spec.name).__version__ if version_spec else "unknown"
+
+    ret = lldb.SBCommandReturnObject()
+    debugger.GetCommandInterpreter().HandleCommand(REGISTRATION, ret)
+    if not ret.Succeeded():
+        print(f"Error registering oexplain: {ret.GetError()}")
+        return
     print(f"[lldb-objc v{__version__}] 'oexplain' installed - Explain disassembly with LLM")
@@ -5,6 +5,7 @@ Usage: oinstance <address|$var|expression>   # Inspect specific object
        oinstance 0x123456789abc              # Inspect by hex address
        oinstance $0                          # Inspect LLDB variable
        oinstance (id)[NSDate date]           # Inspect by expression
+       oinstance --fast <address>            # Skip -description calls
 
 This command provides detailed inspection of an object including:
 - Class name and description
@@ -18,7 +19,7 @@ import lldb
 import os
 import sys
 import struct
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Add the script directory to path for version import
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -30,6 +31,14 @@ try:
 except ImportError:
     __version__ = "unknown"
 
+from objc_utils import (
+    OBJECT_EXPR_OPTIONS,
+    evaluate_pointer_batch,
+    get_expression_templates,
+    get_pointer_size,
+    read_c_strings,
+)
+
 # Import helper functions from objc_cls
 try:
     from objc_cls import get_class_hierarchy, get_class_ivars, decode_type_encoding
@@ -44,142 +53,231 @@ except ImportError:
     def decode_type_encoding(type_enc: str) -> str:
         return type_enc
 
+# Flags that skip -description calls (class names only)
+FAST_FLAGS = frozenset(('--fast', '--no-desc'))
+
+# ANSI codes for secondary (dim gray) output, and per-ivar line templates:
+# offset (dim) + name + value address + description, or type (dim) without one
+DIM = "\033[90m"
+RESET = "\033[0m"
+_IVAR_LINE = "    " + DIM + "0x{:03x}" + RESET + "  {:20s}  0x{:016x}  {}"
+_IVAR_LINE_TYPE = "    " + DIM + "0x{:03x}" + RESET + "  {:20s}  0x{:016x}  " + DIM + "{}" + RESET
+
+# Superclass levels returned by the object summary expression (same bound as
+# get_class_hierarchy's walk)
+MAX_HIERARCHY_DEPTH = 20
+
+# Per-process caches of class metadata (fixed once a class is realized).
+# Keyed by process unique ID: a rebuilt binary relaunched under a reused pid
+# can have different ivar offsets.
+# Structure: {process_unique_id: {class_name: tuple}}
+_ivar_layout_cache: Dict[int, Dict[str, Tuple[Tuple[str, str, int], ...]]] = {}
+_hierarchy_cache: Dict[int, Dict[str, Tuple[str, ...]]] = {}
+
+# Precompiled decoders for ivar values (target memory is little-endian)
+_U64 = struct.Struct('<Q')
+_U32 = struct.Struct('<I')
+_U8 = struct.Struct('<B')
+_DOUBLE = struct.Struct('<d')
+_FLOAT = struct.Struct('<f')
+
+# Integer type encodings: type_enc -> (decoder, C type name)
+_SIGNED_TYPES = {
+    'q': (struct.Struct('<q'), 'long long'),
+    'l': (struct.Struct('<q'), 'long'),
+    'i': (struct.Struct('<i'), 'int'),
+    's': (struct.Struct('<h'), 'short'),
+    'c': (struct.Struct('<b'), 'char'),
+}
+_UNSIGNED_TYPES = {
+    'Q': (_U64, 'unsigned long long'),
+    'L': (_U64, 'unsigned long'),
+    'I': (_U32, 'unsigned int'),
+    'S': (struct.Struct('<H'), 'unsigned short'),
+    'C': (_U8, 'unsigned char'),
+}
+
+
+def get_ivar_layout(frame: lldb.SBFrame, class_name: str) -> Tuple[Tuple[str, str, int], ...]:
+    """
+    Get a class's ivar layout, cached per process.
+
+    Repeated inspections of the same class (the usual debugging loop) skip
+    the runtime crawl in get_class_ivars.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        class_name: Name of the class
+
+    Returns:
+        Tuple of (name, type_enc, offset) tuples for ivars with a known offset
+    """
+    unique_id = frame.GetThread().GetProcess().GetUniqueID()
+    layouts = _ivar_layout_cache.setdefault(unique_id, {})
+    layout = layouts.get(class_name)
+    if layout is None:
+        layout = tuple(
+            (ivar_name, ivar_type_enc, ivar_offset)
+            for ivar_name, ivar_type_enc, ivar_offset in get_class_ivars(frame, class_name)
+            if ivar_offset is not None
+        )
+        # Empty results may be lookup failures, so only real layouts are kept
+        if layout:
+            layouts[class_name] = layout
+    return layout
+
+
+def get_cached_class_hierarchy(frame: lldb.SBFrame, class_name: str) -> Tuple[str, ...]:
+    """
+    Get a class's inheritance hierarchy, cached per process.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        class_name: Name of the class
+
+    Returns:
+        Tuple of class names [ClassName, SuperClass, ..., NSObject]
+    """
+    unique_id = frame.GetThread().GetProcess().GetUniqueID()
+    hierarchies = _hierarchy_cache.setdefault(unique_id, {})
+    hierarchy = hierarchies.get(class_name)
+    if hierarchy is None:
+        hierarchy = tuple(get_class_hierarchy(frame, class_name))
+        if hierarchy:
+            hierarchies[class_name] = hierarchy
+    return hierarchy
+
+
+def runtime_lookups(
+    type_enc: str,
+    value: int,
+    templates: Dict[str, str],
+    fetch_desc: bool = True
+) -> List[str]:
+    """
+    Build the runtime calls needed to describe a pointer-typed ivar value.
+
+    Args:
+        type_enc: Objective-C type encoding of the ivar
+        value: Raw pointer value stored in the ivar
+        templates: Expression templates from get_expression_templates()
+        fetch_desc: If False, objects get only a class name lookup (no -description)
+
+    Returns:
+        Pointer-valued expressions whose strings read_ivar_value expects in
+        `names` (empty when the value needs no runtime call)
+    """
+    if value == 0:
+        return []
+    addr = f'0x{value:x}'
+    if type_enc.startswith('@'):
+        if not fetch_desc:
+            return [templates['object_class_name'].format(addr)]
+        return [
+            templates['description'].format(addr),
+            templates['object_class_name'].format(addr),
+        ]
+    if type_enc == '#':
+        return [templates['class_name'].format(addr)]
+    if type_enc == ':':
+        return [templates['sel_name'].format(addr)]
+    return []
+
 
 def read_ivar_value(
     process: lldb.SBProcess,
-    frame: lldb.SBFrame,
-    addr: int,
-    type_enc: str
+    buf: bytes,
+    offset: int,
+    type_enc: str,
+    names: List[Optional[str]]
 ) -> Tuple[int, str]:
     """
-    Read value at address and generate description based on type encoding.
+    Decode an ivar from the instance's memory and describe it based on type encoding.
 
     Args:
         process: LLDB process for memory reads
-        frame: LLDB frame for expression evaluation
-        addr: Memory address to read from
+        buf: Instance memory, starting at the object's address
+        offset: Ivar offset within buf
         type_enc: Objective-C type encoding
+        names: Strings resolved for the expressions from runtime_lookups()
 
     Returns:
         (value_as_int, description_string) tuple
     """
     error = lldb.SBError()
-    pointer_size = 8  # Assume 64-bit for modern systems
-
-    # Read raw bytes
-    raw_bytes = process.ReadMemory(addr, pointer_size, error)
-    if not error.Success():
-        return 0, "?"
 
     # Parse based on type encoding
     if type_enc.startswith('@'):
         # Object pointer
-        obj_ptr = struct.unpack('Q', raw_bytes)[0]
+        obj_ptr = _U64.unpack_from(buf, offset)[0]
         if obj_ptr == 0:
             return 0, "(nil)"
 
-        # Get object description
-        desc_expr = f'(const char *)[[(id)0x{obj_ptr:x} description] UTF8String]'
-        desc_result = frame.EvaluateExpression(desc_expr)
-
-        if desc_result.IsValid():
-            desc_ptr = desc_result.GetValueAsUnsigned()
-            if desc_ptr != 0:
-                desc = process.ReadCStringFromMemory(desc_ptr, 60, error)
-                if error.Success() and desc:
-                    # Truncate long descriptions
-                    if len(desc) > 40:
-                        desc = desc[:37] + "..."
-                    return obj_ptr, desc
-
-        # Fallback: try to get class name
-        class_expr = f'(const char *)class_getName(object_getClass((id)0x{obj_ptr:x}))'
-        class_result = frame.EvaluateExpression(class_expr)
-        if class_result.IsValid():
-            class_name_ptr = class_result.GetValueAsUnsigned()
-            if class_name_ptr != 0:
-                class_name = process.ReadCStringFromMemory(class_name_ptr, 100, error)
-                if error.Success() and class_name:
-                    return obj_ptr, f"({class_name} instance)"
+        # Object description (unless skipped), falling back to the class name
+        desc = names[0] if len(names) > 1 else None
+        class_name = names[-1]
+        if desc:
+            # Truncate long descriptions
+            if len(desc) > 40:
+                desc = desc[:37] + "..."
+            return obj_ptr, desc
+        if class_name:
+            return obj_ptr, f"({class_name} instance)"
 
         return obj_ptr, "(object)"
 
     elif type_enc == '#':
         # Class object
-        class_ptr = struct.unpack('Q', raw_bytes)[0]
+        class_ptr = _U64.unpack_from(buf, offset)[0]
         if class_ptr == 0:
             return 0, "(nil)"
 
-        class_expr = f'(const char *)class_getName((Class)0x{class_ptr:x})'
-        class_result = frame.EvaluateExpression(class_expr)
-        if class_result.IsValid():
-            name_ptr = class_result.GetValueAsUnsigned()
-            if name_ptr != 0:
-                class_name = process.ReadCStringFromMemory(name_ptr, 100, error)
-                if error.Success() and class_name:
-                    return class_ptr, f"Class ({class_name})"
+        class_name = names[0]
+        if class_name:
+            return class_ptr, f"Class ({class_name})"
         return class_ptr, "Class"
 
     elif type_enc == ':':
         # SEL
-        sel_ptr = struct.unpack('Q', raw_bytes)[0]
+        sel_ptr = _U64.unpack_from(buf, offset)[0]
         if sel_ptr == 0:
             return 0, "(NULL)"
 
-        sel_expr = f'(const char *)sel_getName((SEL)0x{sel_ptr:x})'
-        sel_result = frame.EvaluateExpression(sel_expr)
-        if sel_result.IsValid():
-            name_ptr = sel_result.GetValueAsUnsigned()
-            if name_ptr != 0:
-                sel_name = process.ReadCStringFromMemory(name_ptr, 100, error)
-                if error.Success() and sel_name:
-                    return sel_ptr, f"@selector({sel_name})"
+        sel_name = names[0]
+        if sel_name:
+            return sel_ptr, f"@selector({sel_name})"
         return sel_ptr, "SEL"
 
     elif type_enc in ['d', 'f']:
         # Double/Float
         if type_enc == 'd':
-            value = struct.unpack('d', raw_bytes)[0]
-            return struct.unpack('Q', raw_bytes)[0], f"{value} (double)"
+            value = _DOUBLE.unpack_from(buf, offset)[0]
+            return _U64.unpack_from(buf, offset)[0], f"{value} (double)"
         else:
-            value = struct.unpack('f', raw_bytes[:4])[0]
-            return struct.unpack('I', raw_bytes[:4])[0], f"{value} (float)"
+            value = _FLOAT.unpack_from(buf, offset)[0]
+            return _U32.unpack_from(buf, offset)[0], f"{value} (float)"
 
-    elif type_enc in ['q', 'l', 'i', 's', 'c']:
+    elif type_enc in _SIGNED_TYPES:
         # Signed integers
-        type_map = {
-            'q': ('q', 'long long'),
-            'l': ('q', 'long'),
-            'i': ('i', 'int'),
-            's': ('h', 'short'),
-            'c': ('b', 'char')
-        }
-        fmt, type_name = type_map[type_enc]
-        value = struct.unpack(fmt, raw_bytes[:struct.calcsize(fmt)])[0]
+        decoder, type_name = _SIGNED_TYPES[type_enc]
+        value = decoder.unpack_from(buf, offset)[0]
         return value & 0xFFFFFFFFFFFFFFFF, f"{value} ({type_name})"
 
-    elif type_enc in ['Q', 'L', 'I', 'S', 'C']:
+    elif type_enc in _UNSIGNED_TYPES:
         # Unsigned integers
-        type_map = {
-            'Q': ('Q', 'unsigned long long'),
-            'L': ('Q', 'unsigned long'),
-            'I': ('I', 'unsigned int'),
-            'S': ('H', 'unsigned short'),
-            'C': ('B', 'unsigned char')
-        }
-        fmt, type_name = type_map[type_enc]
-        value = struct.unpack(fmt, raw_bytes[:struct.calcsize(fmt)])[0]
+        decoder, type_name = _UNSIGNED_TYPES[type_enc]
+        value = decoder.unpack_from(buf, offset)[0]
         return value, f"{value} ({type_name})"
 
     elif type_enc == 'B':
         # BOOL
-        value = struct.unpack('B', raw_bytes[:1])[0]
+        value = _U8.unpack_from(buf, offset)[0]
         bool_str = "YES" if value else "NO"
         return value, f"{bool_str} (BOOL)"
 
     elif type_enc == '*':
         # char *
-        str_ptr = struct.unpack('Q', raw_bytes)[0]
+        str_ptr = _U64.unpack_from(buf, offset)[0]
         if str_ptr == 0:
             return 0, "(NULL)"
 
@@ -192,44 +290,78 @@ def read_ivar_value(
 
     elif type_enc.startswith('^'):
         # Pointer type
-        ptr_value = struct.unpack('Q', raw_bytes)[0]
+        ptr_value = _U64.unpack_from(buf, offset)[0]
         if ptr_value == 0:
             return 0, "(NULL)"
         return ptr_value, "(ptr)"
 
     else:
         # Unknown/struct/union - just show hex
-        value = struct.unpack('Q', raw_bytes)[0]
+        value = _U64.unpack_from(buf, offset)[0]
         return value, ""
 
 
-def get_ivar_values(frame: lldb.SBFrame, obj_addr: int, class_name: str) -> List[Tuple]:
+def get_ivar_values(
+    frame: lldb.SBFrame,
+    obj_addr: int,
+    class_name: str,
+    fetch_desc: bool = True
+) -> List[Tuple]:
     """
     Get ivar values for a specific object instance.
 
+    Runtime calls for object, Class and SEL ivars (description, class and
+    selector names) are batched into a single expression for all ivars.
+
     Args:
         frame: LLDB frame for expression evaluation
         obj_addr: Address of the object instance
         class_name: Name of the class
+        fetch_desc: If False, object ivars show their class instead of -description
 
     Returns:
         List of (name, type_enc, offset, value_addr, value_desc) tuples
     """
-    ivars = get_class_ivars(frame, class_name)
+    ivars = get_ivar_layout(frame, class_name)
+    if not ivars:
+        return []
     process = frame.GetThread().GetProcess()
-    result = []
+    pointer_size = 8  # Assume 64-bit for modern systems
+    templates = get_expression_templates(frame)
 
-    for ivar_name, ivar_type_enc, ivar_offset in ivars:
-        if ivar_offset is None:
-            continue
+    # Read the whole instance once (every ivar is decoded from a pointer-sized
+    # slot) instead of one debug-server round trip per ivar
+    error = lldb.SBError()
+    instance_size = max(ivar_offset for _, _, ivar_offset in ivars) + pointer_size
+    buf = process.ReadMemory(obj_addr, instance_size, error)
+    if not error.Success():
+        buf = None
 
-        # Calculate actual address in memory
-        ivar_addr = obj_addr + ivar_offset
+    # Pass 1: queue the runtime calls each value needs
+    pending = []
+    lookup_exprs = []
+    for ivar_name, ivar_type_enc, ivar_offset in ivars:
+        first = len(lookup_exprs)
+        if buf is not None:
+            lookup_exprs.extend(
+                runtime_lookups(
+                    ivar_type_enc, _U64.unpack_from(buf, ivar_offset)[0], templates, fetch_desc
+                )
+            )
+        pending.append((ivar_name, ivar_type_enc, ivar_offset, first, len(lookup_exprs)))
+
+    # Pass 2: one target call resolves every queued lookup
+    name_ptrs = evaluate_pointer_batch(frame, lookup_exprs, OBJECT_EXPR_OPTIONS)
+    names = read_c_strings(process, name_ptrs, 100)
 
-        # Read value at that address
-        value_addr, value_desc = read_ivar_value(
-            process, frame, ivar_addr, ivar_type_enc
-        )
+    result = []
+    for ivar_name, ivar_type_enc, ivar_offset, first, last in pending:
+        if buf is None:
+            value_addr, value_desc = 0, "?"
+        else:
+            value_addr, value_desc = read_ivar_value(
+                process, buf, ivar_offset, ivar_type_enc, names[first:last]
+            )
 
         result.append((
             ivar_name,
@@ -242,11 +374,107 @@ def get_ivar_values(frame: lldb.SBFrame, obj_addr: int, class_name: str) -> List
     return result
 
 
+def build_object_summary_expression(obj_addr: int, templates: Dict[str, str], fetch_desc: bool = True) -> str:
+    """
+    Build an expression that gathers an object's class name, description and
+    class hierarchy in one call.
+
+    The returned buffer holds pointer-sized slots: class name, description,
+    then one class name per hierarchy level, NULL-terminated.
+
+    Args:
+        obj_addr: Object address
+        templates: Expression templates from get_expression_templates()
+        fetch_desc: If False, leave the description slot empty
+
+    Returns:
+        String containing the compound expression
+    """
+    desc_expr = templates['description'].format('obj') if fetch_desc else '0'
+    return f'''
+(void *)(^{{
+    void **out = (void **)calloc({MAX_HIERARCHY_DEPTH + 3}, sizeof(void *));
+    if (!out) return (void *)0;
+    void *obj = (void *)0x{obj_addr:x};
+    Class cls = (Class)[(id)obj class];
+    if (!cls) return (void *)out;
+    out[0] = (void *)class_getName(cls);
+    out[1] = (void *)({desc_expr});
+    for (int i = 0; i < {MAX_HIERARCHY_DEPTH} && cls; i++) {{
+        out[2 + i] = (void *)class_getName(cls);
+        cls = (Class)class_getSuperclass(cls);
+    }}
+    return (void *)out;
+}}())
+'''
+
+
+def get_object_summary(
+    frame: lldb.SBFrame,
+    obj_addr: int,
+    fetch_desc: bool = True
+) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+    """
+    Get an object's class name, description and class hierarchy with a single
+    target call, then one memory read for the result slots.
+
+    The hierarchy is stored in the per-process cache used by
+    get_cached_class_hierarchy.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        obj_addr: Object address
+        fetch_desc: If False, skip -description
+
+    Returns:
+        (class_name, description, hierarchy) tuple, or None if the expression
+        failed or the object has no class (callers fall back to separate calls)
+    """
+    process = frame.GetThread().GetProcess()
+    summary_expr = build_object_summary_expression(obj_addr, get_expression_templates(frame), fetch_desc)
+    summary_result = frame.EvaluateExpression(summary_expr, OBJECT_EXPR_OPTIONS)
+    if not summary_result.IsValid() or summary_result.GetError().Fail():
+        return None
+
+    out_ptr = summary_result.GetValueAsUnsigned()
+    if out_ptr == 0:
+        return None
+
+    slot_count = MAX_HIERARCHY_DEPTH + 3
+    pointer_size = get_pointer_size(frame)
+    error = lldb.SBError()
+    out_bytes = process.ReadMemory(out_ptr, slot_count * pointer_size, error)
+    frame.EvaluateExpression(f'(void)free((void *)0x{out_ptr:x})', OBJECT_EXPR_OPTIONS)
+    if not error.Success():
+        return None
+
+    slot = 'Q' if pointer_size == 8 else 'I'
+    class_name_ptr, desc_ptr, *hierarchy_ptrs = struct.unpack(f'<{slot_count}{slot}', out_bytes)
+    if class_name_ptr == 0:
+        return None
+    # Hierarchy slots end at the first NULL
+    hierarchy_ptrs = hierarchy_ptrs[:hierarchy_ptrs.index(0)]
+
+    class_name, description, *hierarchy = read_c_strings(
+        process, [class_name_ptr, desc_ptr] + hierarchy_ptrs, 256
+    )
+    if not class_name:
+        return None
+
+    hierarchy = tuple(hierarchy) if all(hierarchy) else ()
+    if hierarchy:
+        _hierarchy_cache.setdefault(process.GetUniqueID(), {})[class_name] = hierarchy
+    else:
+        hierarchy = get_cached_class_hierarchy(frame, class_name)
+
+    return class_name, description or "", hierarchy
+
+
 def format_object_inspection(
     obj_addr: int,
     class_name: str,
     description: str,
-    hierarchy: List[str],
+    hierarchy: Sequence[str],
     ivar_values: List[Tuple]
 ) -> str:
     """Format the complete inspection output."""
@@ -268,7 +496,7 @@ def format_object_inspection(
         lines.append("")
         lines.append("  Class Hierarchy:")
         hierarchy_str = " → ".join(hierarchy[1:])
-        lines.append(f"    {hierarchy[0]} \033[90m→ {hierarchy_str}\033[0m")
+        lines.append(f"    {hierarchy[0]} {DIM}→ {hierarchy_str}{RESET}")
 
     # Instance variables with values
     if ivar_values:
@@ -276,20 +504,13 @@ def format_object_inspection(
         lines.append(f"  Instance Variables ({len(ivar_values)}):")
 
         for name, type_enc, offset, value_addr, value_desc in ivar_values:
-            # Decode type for display
-            type_str = decode_type_encoding(type_enc)
-
-            # Format line
-            # offset (dim) + name (normal) + address (hex) + description + (type in dim)
-            offset_str = f"\033[90m0x{offset:03x}\033[0m"
-            addr_str = f"0x{value_addr:016x}"
-
             if value_desc:
                 # Value description already includes type info
-                lines.append(f"    {offset_str}  {name:20s}  {addr_str}  {value_desc}")
+                lines.append(_IVAR_LINE.format(offset, name, value_addr, value_desc))
             else:
-                type_part = f"\033[90m{type_str}\033[0m"
-                lines.append(f"    {offset_str}  {name:20s}  {addr_str}  {type_part}")
+                # Decode type for display
+                type_str = decode_type_encoding(type_enc)
+                lines.append(_IVAR_LINE_TYPE.format(offset, name, value_addr, type_str))
     else:
         lines.append("")
         lines.append("  Instance Variables: none")
@@ -299,7 +520,8 @@ def format_object_inspection(
 
 def inspect_object(
     frame: lldb.SBFrame,
-    obj_input: str
+    obj_input: str,
+    fetch_desc: bool = True
 ) -> str:
     """
     Inspect a specific object instance.
@@ -307,6 +529,7 @@ def inspect_object(
     Args:
         frame: LLDB frame for expression evaluation
         obj_input: Address (0x...), variable ($0), or expression (self, etc.)
+        fetch_desc: If False, skip -description for the object and its ivars
 
     Returns:
         Formatted inspection output or error message
@@ -317,7 +540,7 @@ def inspect_object(
     obj_addr = 0
 
     # Try parsing as hex address first
-    if obj_input.startswith("0x") or obj_input.startswith("0X"):
+    if obj_input[:2].lower() == "0x":
         try:
             obj_addr = int(obj_input, 16)
         except ValueError:
@@ -325,7 +548,7 @@ def inspect_object(
     else:
         # Evaluate as expression to get the object pointer value
         var_expr = f'{obj_input}'
-        var_result = frame.EvaluateExpression(var_expr)
+        var_result = frame.EvaluateExpression(var_expr, OBJECT_EXPR_OPTIONS)
 
         if not var_result.IsValid() or var_result.GetError().Fail():
             return f"Error: Could not evaluate expression '{obj_input}': {var_result.GetError()}"
@@ -337,39 +560,43 @@ def inspect_object(
     if obj_addr == 0:
         return "Error: Invalid object address (nil)"
 
-    # Step 2: Validate it's an Objective-C object and get class name
-    class_expr = f'(const char *)class_getName((Class)[(id)0x{obj_addr:x} class])'
-    class_result = frame.EvaluateExpression(class_expr)
+    # Steps 2-4: Class name, description and hierarchy in one target call
+    summary = get_object_summary(frame, obj_addr, fetch_desc)
+    if summary is not None:
+        class_name, description, hierarchy = summary
+    else:
+        # Fallback to individual calls
+        class_expr = f'(const char *)class_getName((Class)[(id)0x{obj_addr:x} class])'
+        class_result = frame.EvaluateExpression(class_expr, OBJECT_EXPR_OPTIONS)
 
-    if not class_result.IsValid() or class_result.GetError().Fail():
-        return f"Error: Not a valid Objective-C object at 0x{obj_addr:x}: {class_result.GetError()}"
+        if not class_result.IsValid() or class_result.GetError().Fail():
+            return f"Error: Not a valid Objective-C object at 0x{obj_addr:x}: {class_result.GetError()}"
 
-    class_name_ptr = class_result.GetValueAsUnsigned()
-    if class_name_ptr == 0:
-        return f"Error: Not a valid Objective-C object at 0x{obj_addr:x}"
+        class_name_ptr = class_result.GetValueAsUnsigned()
+        if class_name_ptr == 0:
+            return f"Error: Not a valid Objective-C object at 0x{obj_addr:x}"
 
-    error = lldb.SBError()
-    class_name = process.ReadCStringFromMemory(class_name_ptr, 256, error)
-    if not error.Success() or not class_name:
-        return f"Error: Could not read class name for object at 0x{obj_addr:x}"
+        error = lldb.SBError()
+        class_name = process.ReadCStringFromMemory(class_name_ptr, 256, error)
+        if not error.Success() or not class_name:
+            return f"Error: Could not read class name for object at 0x{obj_addr:x}"
 
-    # Step 3: Get object description
-    desc_expr = f'(const char *)[[(id)0x{obj_addr:x} description] UTF8String]'
-    desc_result = frame.EvaluateExpression(desc_expr)
+        description = ""
+        if fetch_desc:
+            desc_expr = f'(const char *)[[(id)0x{obj_addr:x} description] UTF8String]'
+            desc_result = frame.EvaluateExpression(desc_expr, OBJECT_EXPR_OPTIONS)
 
-    description = ""
-    if desc_result.IsValid() and not desc_result.GetError().Fail():
-        desc_ptr = desc_result.GetValueAsUnsigned()
-        if desc_ptr != 0:
-            desc_bytes = process.ReadCStringFromMemory(desc_ptr, 256, error)
-            if error.Success() and desc_bytes:
-                description = desc_bytes
+            if desc_result.IsValid() and not desc_result.GetError().Fail():
+                desc_ptr = desc_result.GetValueAsUnsigned()
+                if desc_ptr != 0:
+                    desc_bytes = process.ReadCStringFromMemory(desc_ptr, 256, error)
+                    if error.Success() and desc_bytes:
+                        description = desc_bytes
 
-    # Step 4: Get class hierarchy
-    hierarchy = get_class_hierarchy(frame, class_name)
+        hierarchy = get_cached_class_hierarchy(frame, class_name)
 
     # Step 5: Get ivar values
-    ivar_values = get_ivar_values(frame, obj_addr, class_name)
+    ivar_values = get_ivar_values(frame, obj_addr, class_name, fetch_desc)
 
     # Step 6: Format and return output
     return format_object_inspection(obj_addr, class_name, description, hierarchy, ivar_values)
@@ -384,7 +611,7 @@ def inspect_instance_command(
     """
     LLDB command to inspect an Objective-C object instance.
 
-    Usage: oinstance <address|$var|expression>
+    Usage: oinstance [--fast|--no-desc] <address|$var|expression>
     """
     target = debugger.GetSelectedTarget()
     process = target.GetProcess()
@@ -393,11 +620,16 @@ def inspect_instance_command(
         result.SetError("Process must be running and stopped")
         return
 
-    # Parse arguments
+    # Parse arguments (the expression itself may contain spaces)
     obj_input = command.strip()
+    fetch_desc = True
+    flag, _, rest = obj_input.partition(' ')
+    if flag in FAST_FLAGS:
+        fetch_desc = False
+        obj_input = rest.strip()
 
     if not obj_input:
-        result.SetError("Usage: oinstance <address|$var|expression>")
+        result.SetError("Usage: oinstance [--fast|--no-desc] <address|$var|expression>")
         return
 
     # Get current frame
@@ -405,8 +637,8 @@ def inspect_instance_command(
     frame = thread.GetSelectedFrame()
 
     # Inspect the object
-    output = inspect_object(frame, obj_input)
-    print(output)
+    output = inspect_object(frame, obj_input, fetch_desc)
+    sys.stdout.write(output + '\n')
     result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
 
 
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """
 LLDB script for finding instances of Objective-C classes in autorelease pools.
-Usage: opool [--verbose] ClassName  # Find instances in autorelease pools
+Usage: opool [--verbose] [--exact] [--no-desc] [--count] ClassName  # Find instances in autorelease pools
        opool NSString               # Find NSString instances
        opool NSDate                 # Find NSDate instances
        opool --verbose NSString     # Show full pool debug output
+       opool --exact NSDate         # Only NSDate itself, no subclasses
+       opool --no-desc NSString     # Addresses and classes only (no -description calls)
+       opool --count NSString       # Number of instances only
 
 This command scans autorelease pools to find instances of the specified class.
 Use --verbose to show the raw pool contents from _objc_autoreleasePoolPrint().
@@ -16,7 +19,8 @@ import lldb
 import os
 import sys
 import re
-from typing import Any, Dict, List, Tuple
+import struct
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add the script directory to path for version import
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -28,31 +32,248 @@ try:
 except ImportError:
     __version__ = "unknown"
 
+from objc_utils import (
+    OBJECT_EXPR_OPTIONS,
+    evaluate_interpreted,
+    evaluate_pointer_batch,
+    get_expression_templates,
+    read_c_string_bytes,
+    read_c_strings,
+)
+
+# Pool entry line: "[slot_addr]  object_addr  ..." (captures object_addr).
+# Only blanks between the columns, so a match never spans two lines.
+_POOL_ENTRY_RE = re.compile(rb'\[0x[0-9a-fA-F]+\][ \t]+(0x[0-9a-fA-F]+)')
+
+# Substrings of PAGE/POOL marker lines
+_POOL_MARKERS = (b'####', b'PAGE')
+
+# Flags accepted before the class name
+POOL_FLAGS = frozenset(('--verbose', '--exact', '--no-desc', '--count'))
+POOL_USAGE = "Usage: opool [--verbose] [--exact] [--no-desc] [--count] ClassName"
+
+# Upper bound on the pool text read from the target (grown from a small first read)
+POOL_READ_LIMIT = 1000000
+
+# Candidates checked per target-side batch. Bounds the expression size, and a
+# candidate that faults only sends its own batch to the per-address fallback.
+POOL_BATCH_SIZE = 256
+
+# Bytes kept per description / class name, copied into the batch result
+# (one entry: object address + both strings)
+POOL_STRING_LENGTH = 256
+POOL_ENTRY_SIZE = 8 + 2 * POOL_STRING_LENGTH
+
+_U64 = struct.Struct('<Q')
+
+
+def _is_marker_entry(pool_info: bytes, match: re.Match) -> bool:
+    """Check whether an entry regex match sits on a PAGE/POOL marker line."""
+    line_start = pool_info.rfind(b'\n', 0, match.start()) + 1
+    line_end = pool_info.find(b'\n', match.end())
+    line = pool_info[line_start:line_end] if line_end != -1 else pool_info[line_start:]
+    return any(marker in line for marker in _POOL_MARKERS)
+
+
+def build_pool_check_expression(
+    candidates: List[int],
+    class_ptr: int,
+    templates: Dict[str, str],
+    exact: bool = False,
+    fetch_desc: bool = True
+) -> str:
+    """
+    Build an expression that checks every candidate against a class in one call.
+
+    The returned buffer starts with the match count, followed by one
+    POOL_ENTRY_SIZE entry per match: the object address, then its description
+    and actual class name copied inline (POOL_STRING_LENGTH bytes each, NUL
+    padded), so the whole result comes back in plain memory reads. Exact
+    matches leave the class name empty since it is the searched class by
+    definition, and the description is left empty when it is not wanted.
+
+    Args:
+        candidates: Object addresses taken from the pool output
+        class_ptr: Class to match
+        templates: Expression templates from get_expression_templates()
+        exact: Match the class itself only (object_getClass ==) instead of isKindOfClass
+        fetch_desc: If False, skip -description
+
+    Returns:
+        String containing the compound expression
+    """
+    count = len(candidates)
+    # hex() gives the same '0x...' literal as an f-string without the format machinery
+    addr_list = ', '.join(map(hex, candidates))
+    desc_expr = templates['description'].format('obj') if fetch_desc else '0'
+    if exact:
+        match_expr = '(void *)object_getClass((id)obj) == (void *)cls'
+        class_expr = '0'
+    else:
+        match_expr = '(BOOL)[(id)obj isKindOfClass:cls]'
+        class_expr = templates['object_class_name'].format('obj')
+
+    return f'''
+(void *)(^{{
+    unsigned long long addrs[{count}] = {{ {addr_list} }};
+    char *out = (char *)calloc(1, 8 + {count * POOL_ENTRY_SIZE});
+    if (!out) return (void *)0;
+    Class cls = (Class)0x{class_ptr:x};
+    unsigned long long found = 0;
+    for (int i = 0; i < {count}; i++) {{
+        void *obj = (void *)addrs[i];
+        if ({match_expr}) {{
+            char *entry = out + 8 + found * {POOL_ENTRY_SIZE};
+            *(unsigned long long *)entry = addrs[i];
+            const char *desc = (const char *)({desc_expr});
+            if (desc) (void)strncpy(entry + 8, desc, {POOL_STRING_LENGTH - 1});
+            const char *name = (const char *)({class_expr});
+            if (name) (void)strncpy(entry + {8 + POOL_STRING_LENGTH}, name, {POOL_STRING_LENGTH - 1});
+            found++;
+        }}
+    }}
+    *(unsigned long long *)out = found;
+    return (void *)out;
+}}())
+'''
+
+
+def _entry_string(entry: bytes, offset: int) -> Optional[str]:
+    """Decode one NUL-padded string field of a pool batch entry (None if empty)."""
+    raw = entry[offset:offset + POOL_STRING_LENGTH].split(b'\0', 1)[0]
+    return raw.decode('utf-8', errors='replace') if raw else None
+
+
+def check_pool_batch(
+    frame: lldb.SBFrame,
+    candidates: List[int],
+    class_ptr: int,
+    templates: Dict[str, str],
+    exact: bool = False,
+    fetch_desc: bool = True
+) -> Optional[List[Tuple[int, Optional[str], Optional[str]]]]:
+    """
+    Check a batch of candidates with a single target call.
+
+    The match count is read first, then every match with its strings in one
+    more read, instead of one string read per description and class name.
+
+    Args:
+        frame: Current stack frame for expression evaluation
+        candidates: Object addresses to check
+        class_ptr: Class to match
+        templates: Expression templates from get_expression_templates()
+        exact: Match the class itself only (no subclasses)
+        fetch_desc: If False, skip -description (description is None)
+
+    Returns:
+        List of (address, description, class_name) for matches,
+        or None if the batch expression failed
+    """
+    batch_expr = build_pool_check_expression(candidates, class_ptr, templates, exact, fetch_desc)
+    batch_result = frame.EvaluateExpression(batch_expr, OBJECT_EXPR_OPTIONS)
+    if not batch_result.IsValid() or batch_result.GetError().Fail():
+        return None
+
+    out_ptr = batch_result.GetValueAsUnsigned()
+    if out_ptr == 0:
+        return None
+
+    process = frame.GetThread().GetProcess()
+    error = lldb.SBError()
+    entries = b''
+    header = process.ReadMemory(out_ptr, 8, error)
+    if error.Success():
+        found = _U64.unpack(header)[0]
+        if found:
+            entries = process.ReadMemory(out_ptr + 8, found * POOL_ENTRY_SIZE, error)
+    frame.EvaluateExpression(f'(void)free((void *)0x{out_ptr:x})', OBJECT_EXPR_OPTIONS)
+    if not error.Success():
+        return None
+
+    return [
+        (
+            _U64.unpack_from(entries, start)[0],
+            _entry_string(entries, start + 8),
+            _entry_string(entries, start + 8 + POOL_STRING_LENGTH),
+        )
+        for start in range(0, len(entries), POOL_ENTRY_SIZE)
+    ]
+
+
+def check_pool_individually(
+    frame: lldb.SBFrame,
+    candidates: List[int],
+    class_ptr: int,
+    templates: Dict[str, str],
+    exact: bool = False,
+    fetch_desc: bool = True
+) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """
+    Fallback for check_pool_batch: one class check call per candidate.
+
+    Returns:
+        List of (address, description, class_name) for matches
+    """
+    matched = []
+    for addr in candidates:
+        if exact:
+            check_expr = f'(BOOL)((void *)object_getClass((id)0x{addr:x}) == (void *)0x{class_ptr:x})'
+        else:
+            # Use isKindOfClass to support subclasses
+            check_expr = f'(BOOL)[(id)0x{addr:x} isKindOfClass:(Class)0x{class_ptr:x}]'
+        check_result = frame.EvaluateExpression(check_expr, OBJECT_EXPR_OPTIONS)
+        if check_result.IsValid() and check_result.GetValueAsUnsigned() == 1:
+            matched.append(addr)
+
+    # Fetch description and actual class name of every match in one target call
+    # (exact matches are the searched class, so their class name is skipped)
+    class_template = '0' if exact else templates['object_class_name']
+    desc_template = templates['description'] if fetch_desc else '0'
+    lookup_exprs = []
+    for addr in matched:
+        lookup_exprs.append(desc_template.format(f'0x{addr:x}'))
+        lookup_exprs.append(class_template.format(f'0x{addr:x}'))
+    name_ptrs = evaluate_pointer_batch(frame, lookup_exprs, OBJECT_EXPR_OPTIONS)
+    names = read_c_strings(frame.GetThread().GetProcess(), name_ptrs, POOL_STRING_LENGTH)
+
+    return [
+        (addr, names[2 * i], names[2 * i + 1])
+        for i, addr in enumerate(matched)
+    ]
+
 
 def find_in_autorelease_pool(
     frame: lldb.SBFrame,
     class_name: str,
-    verbose: bool = False
-) -> Tuple[List[Tuple[int, str]], str]:
+    verbose: bool = False,
+    exact: bool = False,
+    fetch_desc: bool = True
+) -> Tuple[List[Tuple[int, str, str]], str]:
     """
     Find instances of a class by scanning autorelease pools.
 
+    Candidates are checked with isKindOfClass in target-side batches that
+    also return each match's description and actual class name.
+
     Args:
         frame: Current stack frame for expression evaluation
         class_name: Name of the class to search for
         verbose: If True, return the full pool contents
+        exact: If True, only match instances of the class itself (no subclasses)
+        fetch_desc: If False, skip -description (descriptions are empty)
 
     Returns:
         Tuple of (instances list, pool_output string)
-        instances: List of (address, description) tuples for found instances
+        instances: List of (address, class_name, description) tuples for found instances
         pool_output: Raw pool output if verbose=True, empty string otherwise
     """
     instances = []
     process = frame.GetThread().GetProcess()
 
-    # Step 1: Get the class pointer
-    class_expr = f'(Class)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    # Step 1: Get the class pointer (a plain C call, so no JIT needed)
+    class_expr = f'(void *)objc_getClass("{class_name}")'
+    class_result = evaluate_interpreted(frame, class_expr)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return instances, ""
@@ -65,25 +286,15 @@ def find_in_autorelease_pool(
     # The _objc_autoreleasePoolPrint() function prints to stderr AND returns the string
     # We need to suppress the stderr output unless --verbose is specified
 
+    templates = get_expression_templates(frame)
     if not verbose:
-        # Redirect stderr to /dev/null to suppress debug output
-        pool_expr = """
-        (const char *)(({
-            int saved_stderr = dup(2);
-            int devnull = open("/dev/null", 1);
-            dup2(devnull, 2);
-            const char *result = _objc_autoreleasePoolPrint();
-            dup2(saved_stderr, 2);
-            close(saved_stderr);
-            close(devnull);
-            result;
-        }))
-        """
+        # Suppress the debug output (stderr redirected to /dev/null by the helper)
+        pool_expr = templates['pool_print_quiet']
     else:
         # Let the output go to stderr naturally
         pool_expr = '(const char *)_objc_autoreleasePoolPrint()'
 
-    pool_result = frame.EvaluateExpression(pool_expr)
+    pool_result = frame.EvaluateExpression(pool_expr, OBJECT_EXPR_OPTIONS)
 
     if not pool_result.IsValid() or pool_result.GetError().Fail():
         return instances, ""
@@ -92,13 +303,13 @@ def find_in_autorelease_pool(
     if pool_addr == 0:
         return instances, ""
 
-    error = lldb.SBError()
-    pool_info = process.ReadCStringFromMemory(pool_addr, 1000000, error)
+    # Raw bytes, read in growing chunks: most pools are far below the limit
+    pool_info = read_c_string_bytes(process, pool_addr, POOL_READ_LIMIT)
 
-    if not error.Success() or not pool_info:
+    if not pool_info:
         return instances, ""
 
-    pool_output = pool_info if verbose else ""
+    pool_output = pool_info.decode('utf-8', errors='replace') if verbose else ""
 
     # Parse pool info to extract addresses
     # Pool output format (from _objc_autoreleasePoolPrint):
@@ -109,57 +320,35 @@ def find_in_autorelease_pool(
     #   objc[47068]: [0x9fac10040]  0x123456789012    <NSString: "hello">
     #
     # We need to extract object addresses (not slot addresses, markers, or POOL addresses)
-    collected_addresses = set()
-
-    # Look for lines with actual object pointers (after the slot address)
-    for line in pool_info.split('\n'):
-        # Skip empty lines, headers, and special markers
-        if not line.strip():
-            continue
-        if 'AUTORELEASE POOLS' in line or 'releases pending' in line or '####' in line:
-            continue
-
-        # Parse lines like: "objc[PID]: [slot_addr]  object_addr  ..."
-        # or: "[slot_addr]  object_addr  ..."
-        # Look for a hex address that's not a PAGE marker, POOL marker, or dots
-        match = re.search(r'\[0x[0-9a-fA-F]+\]\s+(0x[0-9a-fA-F]+)', line)
-        if match:
-            addr_str = match.group(1)
-
-            # Skip if this line is a PAGE or POOL marker
-            if 'PAGE' in line or ('####' in line and 'POOL' in line):
-                continue
-
-            try:
-                addr = int(addr_str, 16)
-            except ValueError:
-                continue
-
-            if addr == 0 or addr in collected_addresses:
-                continue
-
-            # Check if this is an instance of our target class
-            # Use isKindOfClass to support subclasses
-            check_expr = f'(BOOL)[(id)0x{addr:x} isKindOfClass:(Class)0x{class_ptr:x}]'
-            check_result = frame.EvaluateExpression(check_expr)
-
-            if check_result.IsValid() and check_result.GetValueAsUnsigned() == 1:
-                collected_addresses.add(addr)
-
-                # Get description
-                desc_expr = f'(const char *)[[(id)0x{addr:x} description] UTF8String]'
-                desc_result = frame.EvaluateExpression(desc_expr)
-
-                description = "instance"
-                if desc_result.IsValid() and not desc_result.GetError().Fail():
-                    desc_addr = desc_result.GetValueAsUnsigned()
-                    if desc_addr != 0:
-                        error2 = lldb.SBError()
-                        desc_bytes = process.ReadCStringFromMemory(desc_addr, 256, error2)
-                        if error2.Success() and desc_bytes:
-                            description = desc_bytes
-
-                instances.append((addr, description))
+    # Scan the raw bytes in one pass instead of splitting into lines; header
+    # lines ("AUTORELEASE POOLS", "releases pending") never match the entry regex.
+    # An object autoreleased several times has one entry per autorelease:
+    # dict.fromkeys keeps pool order and drops the repeats before any target call.
+    unique_addresses = dict.fromkeys(
+        int(match.group(1), 16)
+        for match in _POOL_ENTRY_RE.finditer(pool_info)
+        if not _is_marker_entry(pool_info, match)
+    )
+    unique_addresses.pop(0, None)
+    candidates = list(unique_addresses)
+
+    # Check candidates against the class (and fetch their names) in batches
+    matches = []
+    for start in range(0, len(candidates), POOL_BATCH_SIZE):
+        batch = candidates[start:start + POOL_BATCH_SIZE]
+        batch_matches = check_pool_batch(frame, batch, class_ptr, templates, exact, fetch_desc)
+        if batch_matches is None:
+            batch_matches = check_pool_individually(
+                frame, batch, class_ptr, templates, exact, fetch_desc
+            )
+        matches.extend(batch_matches)
+
+    for addr, description, actual_class in matches:
+        instances.append((
+            addr,
+            actual_class or class_name,  # Default to searched class
+            description or ("instance" if fetch_desc else "")
+        ))
 
     return instances, pool_output
 
@@ -173,7 +362,7 @@ def find_pool_instances_command(
     """
     LLDB command to find instances of an Objective-C class in autorelease pools.
 
-    Usage: opool [--verbose] ClassName
+    Usage: opool [--verbose] [--exact] [--no-desc] [--count] ClassName
     """
     target = debugger.GetSelectedTarget()
     process = target.GetProcess()
@@ -186,19 +375,23 @@ def find_pool_instances_command(
     args = command.strip().split()
 
     if len(args) < 1:
-        result.SetError("Usage: opool [--verbose] ClassName")
+        result.SetError(POOL_USAGE)
         return
 
-    # Check for --verbose flag
-    verbose = False
-    if args[0] == '--verbose':
-        verbose = True
-        args = args[1:]
+    # Collect leading flags
+    flags = set()
+    while args and args[0].startswith('--'):
+        flags.add(args.pop(0))
 
-    if len(args) < 1:
-        result.SetError("Usage: opool [--verbose] ClassName")
+    if len(args) < 1 or not flags <= POOL_FLAGS:
+        result.SetError(POOL_USAGE)
         return
 
+    verbose = '--verbose' in flags
+    exact = '--exact' in flags
+    count_only = '--count' in flags
+    fetch_desc = not count_only and '--no-desc' not in flags
+
     # Get current frame
     thread = process.GetSelectedThread()
     frame = thread.GetSelectedFrame()
@@ -206,7 +399,7 @@ def find_pool_instances_command(
     class_name = args[0]
 
     # Find instances in autorelease pools
-    instances, pool_output = find_in_autorelease_pool(frame, class_name, verbose)
+    instances, pool_output = find_in_autorelease_pool(frame, class_name, verbose, exact, fetch_desc)
 
     # Show pool output if verbose
     if verbose and pool_output:
@@ -217,20 +410,18 @@ def find_pool_instances_command(
         result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
         return
 
+    if count_only:
+        noun = "instance" if len(instances) == 1 else "instances"
+        print(f"{len(instances)} {noun} of {class_name} found in autorelease pools")
+        result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
+        return
+
     # Display results
-    for addr, description in instances:
-        # Get the actual class of this instance
-        class_expr = f'(const char *)class_getName((Class)object_getClass((id)0x{addr:x}))'
-        class_result = frame.EvaluateExpression(class_expr)
-
-        actual_class = class_name  # Default to searched class
-        if class_result.IsValid() and not class_result.GetError().Fail():
-            class_addr = class_result.GetValueAsUnsigned()
-            if class_addr != 0:
-                error = lldb.SBError()
-                class_bytes = process.ReadCStringFromMemory(class_addr, 256, error)
-                if error.Success() and class_bytes:
-                    actual_class = class_bytes
+    for addr, actual_class, description in instances:
+        if not fetch_desc:
+            # Dim address (gray), then actual class
+            print(f"\033[90m0x{addr:016x}\033[0m  {actual_class}")
+            continue
 
         # Truncate long descriptions
         if len(description) > 100:
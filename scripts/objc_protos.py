@@ -25,11 +25,9 @@ from __future__ import annotations
 
 import lldb
 import os
-import re
-import struct
 import sys
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 # Add the script directory to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,7 +39,15 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-from objc_utils import unquote_string
+from objc_core import get_pattern_info
+from objc_utils import (
+    FAST_EXPR_OPTIONS,
+    RUNTIME_LIST_EXPR_OPTIONS,
+    get_pointer_size,
+    get_scratch,
+    unpack_pointers,
+    unquote_string,
+)
 
 # Import class cache from objc_cls if available (for reuse)
 try:
@@ -52,31 +58,278 @@ except ImportError:
     matches_pattern = None
 
 
-def _matches_pattern(name: str, pattern: Optional[str]) -> bool:
+# Batch result buffers live in the shared scratch arena (objc_utils.get_scratch),
+# reused by every batch of every oprotos command. Batches therefore run strictly
+# one after another: each batch's results must be read before the next
+# expression overwrites the arena.
+PROTOS_ARENA_SIZE = 16 * 1024  # largest batch: 50 name slots
+
+# Batches copy names into fixed-size, NUL-terminated slots of one buffer so
+# Python reads them all with a single ReadMemory
+NAME_SLOT_SIZE = 256
+NAMES_HEADER_SIZE = 8  # count header of a whole-list names buffer
+
+# ANSI codes for secondary (dim gray) output, dropped when stdout isn't a
+# terminal (pipes, log files) so no escape bytes end up there
+DIM, RESET = ("\033[90m", "\033[0m") if sys.stdout.isatty() else ("", "")
+
+# Grouped conformance output: base class line, then dim "→ also:" subclass line
+_GROUP_HEAD = "  {}\n"
+_GROUP_TAIL = "    " + DIM + "→ also: {}" + RESET + "\n"
+MAX_SUBCLASSES_SHOWN = 5
+
+# Summary line under every conformance listing
+_SCANNED_LINE = "[Scanned {:,} classes | {:.2f}s]\n".format
+
+# --verbose footer, filled from the find_conforming_classes timing dict
+_TIMING_BREAKDOWN = (
+    "\n  Timing breakdown:\n"
+    "    Class enumeration: {class_enum:.2f}s\n"
+    "    Conformance check: {conformance_check:.2f}s\n"
+    "    Expressions: {expression_count:,}\n"
+    "    Memory reads: {memory_read_count:,}\n"
+)
+
+# Protocol pointers never move once registered, so found (non-zero) pointers
+# are cached per process. These caches hold target addresses, so they are keyed
+# by process unique ID: a relaunched process that reuses a pid must not see them.
+# Structure: {process_unique_id: {protocol_name: pointer}}
+_protocol_ptr_cache: Dict[int, Dict[str, int]] = {}
+
+# Class list from the fallback enumeration, valid until the process resumes
+# Structure: {process_unique_id: (stop_id, class_names, class_count, {class_name: class_ptr})}
+_class_list_cache: Dict[int, Tuple[int, List[str], int, Dict[str, int]]] = {}
+
+# Whether reading the class struct's superclass field matches
+# class_getSuperclass in this process. Structure: {process_unique_id: bool}
+_superclass_field_ok: Dict[int, bool] = {}
+
+# Conformance results (before --direct filtering), valid until the process
+# resumes. Only complete scans are stored.
+# Structure: {(process_unique_id, stop_id, protocol_name): ([(class_name, is_direct)], class_count)}
+_conformance_cache: Dict[Tuple[int, int, str], Tuple[List[Tuple[str, bool]], int]] = {}
+
+
+def _get_scratch(process: lldb.SBProcess, size: int) -> int:
+    """Return the scratch arena sized for oprotos batches, or 0 if unavailable."""
+    return get_scratch(process, size, PROTOS_ARENA_SIZE)
+
+
+def _buffer_declaration(pointer_type: str, name: str, size: int, scratch: int) -> str:
+    """Declare a batch result buffer: the scratch buffer if there is one, else malloc."""
+    if scratch != 0:
+        return f'    {pointer_type}{name} = ({pointer_type})0x{scratch:x};\n'
+    return (
+        f'    {pointer_type}{name} = ({pointer_type})malloc({size});\n'
+        f'    if (!{name}) return (void *)0;\n'
+    )
+
+
+def _free_batch_buffer(
+    frame: lldb.SBFrame,
+    buffer_ptr: int,
+    scratch: int,
+    timing: Optional[Dict[str, Any]] = None
+) -> None:
+    """Free a malloc'd batch buffer; the scratch buffer is kept for the next batch."""
+    if buffer_ptr != scratch:
+        frame.EvaluateExpression(f'(void)free((void *)0x{buffer_ptr:x})', FAST_EXPR_OPTIONS)
+        if timing is not None:
+            timing['expression_count'] += 1
+
+
+def _copy_name(slot: int, name_expr: str) -> str:
+    """Block statements copying a C string (empty for NULL) into a names slot."""
+    offset = slot * NAME_SLOT_SIZE
+    return (
+        f'    name = (const char *)({name_expr});\n'
+        f'    (void)strncpy(names + {offset}, name ? name : "", {NAME_SLOT_SIZE - 1});\n'
+        f'    names[{offset + NAME_SLOT_SIZE - 1}] = 0;\n'
+    )
+
+
+def _unpack_names(data: bytes) -> List[str]:
+    """Decode the slots of a names buffer ('' for empty slots)."""
+    return [
+        data[start:start + NAME_SLOT_SIZE].split(b'\0', 1)[0].decode('utf-8', errors='replace')
+        for start in range(0, len(data), NAME_SLOT_SIZE)
+    ]
+
+
+def _head(items: List[str], n: int) -> Tuple[List[str], int]:
+    """Split a list into its first n items and the count of the rest."""
+    return items[:n], max(0, len(items) - n)
+
+
+def _pattern_matcher(pattern: Optional[str]) -> Optional[Callable[[str], bool]]:
     """
-    Check if name matches the pattern.
+    Resolve a pattern to a name predicate once, before a matching loop.
     Supports wildcards: * (any characters) and ? (single character)
     Without wildcards: exact match (case-sensitive)
+
+    Returns None when there is no pattern (everything matches).
     """
     if pattern is None:
-        return True
+        return None
 
-    # Check if pattern contains wildcard characters
-    has_wildcards = '*' in pattern or '?' in pattern
+    # Wildcard check and regex compilation are cached per pattern
+    has_wildcards, matcher = get_pattern_info(pattern)
 
     if has_wildcards:
-        # Convert wildcard pattern to regex
-        regex_pattern = re.escape(pattern)
-        regex_pattern = regex_pattern.replace(r'\*', '.*')
-        regex_pattern = regex_pattern.replace(r'\?', '.')
-        regex_pattern = f'^{regex_pattern}$'
-        try:
-            return bool(re.match(regex_pattern, name, re.IGNORECASE))
-        except re.error:
-            return name == pattern
+        return matcher
+    # Exact matching (case-sensitive)
+    return pattern.__eq__
+
+
+def _literal_prefix(pattern: Optional[str]) -> Optional[str]:
+    """Return PREFIX for a 'PREFIX*' pattern of identifier characters, else None."""
+    if pattern is None or not pattern.endswith('*'):
+        return None
+    prefix = pattern[:-1]
+    if prefix and prefix.replace('_', 'a').isalnum() and prefix.isascii():
+        return prefix
+    return None
+
+
+def _copy_all_protocol_names(
+    frame: lldb.SBFrame,
+    timing: Dict[str, Any],
+    prefix: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Enumerate all protocol names with a single block expression.
+
+    The block copies the protocol list, copies every name into a malloc'd
+    names buffer (count header, then NAME_SLOT_SIZE slots) and frees the list.
+    With a prefix, only names starting with it (case-insensitive, like the
+    wildcard matcher) are copied, and the header counts just those.
+
+    Returns:
+        Protocol names ('' for unnamed slots), or None if the block failed
+    """
+    process = frame.GetThread().GetProcess()
+
+    if prefix is not None:
+        prefix_check = f'        if (!name || (int)strncasecmp(name, "{prefix}", {len(prefix)}) != 0) continue;\n'
     else:
-        # Exact matching (case-sensitive)
-        return name == pattern
+        prefix_check = ''
+
+    names_expr = f'''
+(void *)(^{{
+    unsigned int count = 0;
+    void **list = (void **)objc_copyProtocolList(&count);
+    char *names = (char *)malloc({NAMES_HEADER_SIZE} + count * {NAME_SLOT_SIZE});
+    if (!names) {{
+        if (list) (void)free(list);
+        return (void *)0;
+    }}
+    const char *name;
+    unsigned int i, found = 0;
+    for (i = 0; i < count; i++) {{
+        name = (const char *)protocol_getName(list[i]);
+{prefix_check}        (void)strncpy(names + {NAMES_HEADER_SIZE} + found * {NAME_SLOT_SIZE}, name ? name : "", {NAME_SLOT_SIZE - 1});
+        names[{NAMES_HEADER_SIZE} + found * {NAME_SLOT_SIZE} + {NAME_SLOT_SIZE - 1}] = 0;
+        found++;
+    }}
+    *(unsigned int *)names = found;
+    if (list) (void)free(list);
+    return (void *)names;
+}}())
+'''
+    names_result = frame.EvaluateExpression(names_expr, RUNTIME_LIST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
+
+    if not names_result.IsValid() or names_result.GetError().Fail():
+        return None
+
+    names_ptr = names_result.GetValueAsUnsigned()
+    if names_ptr == 0:
+        return None
+
+    error = lldb.SBError()
+    count = process.ReadUnsignedFromMemory(names_ptr, 4, error)
+    timing['memory_read_count'] += 1
+
+    names_bytes = b''
+    if error.Success() and count > 0:
+        names_bytes = process.ReadMemory(names_ptr + NAMES_HEADER_SIZE, count * NAME_SLOT_SIZE, error)
+        timing['memory_read_count'] += 1
+
+    frame.EvaluateExpression(f'(void)free((void *)0x{names_ptr:x})', FAST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
+
+    if not error.Success():
+        return None
+
+    return _unpack_names(names_bytes)
+
+
+def _resolve_protocol_names(
+    frame: lldb.SBFrame,
+    batch: Sequence[int],
+    scratch: int,
+    timing: Dict[str, Any]
+) -> List[str]:
+    """
+    Get the names of a batch of protocol pointers with one block expression.
+
+    If the block fails, the batch is split in half and each half retried, so
+    a bad pointer only costs extra expressions for its own slice. A single
+    pointer is resolved with a plain protocol_getName call.
+    """
+    if len(batch) == 1:
+        proto_ptr = batch[0]
+        if proto_ptr == 0:
+            return []
+        name_expr = f'(const char *)protocol_getName((void *)0x{proto_ptr:x})'
+        name_result = frame.EvaluateExpression(name_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
+
+        if name_result.IsValid() and not name_result.GetError().Fail():
+            proto_name = name_result.GetSummary()
+            if proto_name:
+                return [unquote_string(proto_name)]
+        return []
+
+    # Build batch expression
+    batch_expr = '''
+(void *)(^{
+'''
+    batch_expr += _buffer_declaration('char *', 'names', len(batch) * NAME_SLOT_SIZE, scratch)
+    batch_expr += '    const char *name;\n'
+    for i, proto_ptr in enumerate(batch):
+        name_expr = f'protocol_getName((void *)0x{proto_ptr:x})' if proto_ptr != 0 else '0'
+        batch_expr += _copy_name(i, name_expr)
+
+    batch_expr += '''    return (void *)names;
+}())
+'''
+    batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
+
+    if not batch_result.IsValid() or batch_result.GetError().Fail():
+        middle = len(batch) // 2
+        return (
+            _resolve_protocol_names(frame, batch[:middle], scratch, timing)
+            + _resolve_protocol_names(frame, batch[middle:], scratch, timing)
+        )
+
+    names_ptr = batch_result.GetValueAsUnsigned()
+    if names_ptr == 0:
+        return []
+
+    # Read all names of the batch at once
+    error = lldb.SBError()
+    process = frame.GetThread().GetProcess()
+    names_bytes = process.ReadMemory(names_ptr, len(batch) * NAME_SLOT_SIZE, error)
+    timing['memory_read_count'] += 1
+
+    _free_batch_buffer(frame, names_ptr, scratch, timing)
+
+    if not error.Success():
+        return []
+
+    return [name for name in _unpack_names(names_bytes) if name]
 
 
 def get_all_protocols(
@@ -100,143 +353,103 @@ def get_all_protocols(
         'memory_read_count': 0
     }
 
+    # An exact name (no wildcards) is a single objc_getProtocol lookup
+    if pattern is not None and '*' not in pattern and '?' not in pattern:
+        protocol_ptr = get_protocol_pointer(frame, pattern)
+        timing['expression_count'] += 1
+        timing['total'] = time.time() - start_time
+        return ([pattern] if protocol_ptr != 0 else []), timing
+
+    matcher = _pattern_matcher(pattern)
+
+    # Copy every name in one block; the batched enumeration below is the fallback
+    all_names = _copy_all_protocol_names(frame, timing, _literal_prefix(pattern))
+    if all_names is not None:
+        protocol_names = [
+            name for name in all_names
+            if name and (matcher is None or matcher(name))
+        ]
+        timing['total'] = time.time() - start_time
+        return sorted(protocol_names), timing
+
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    pointer_size = get_pointer_size(frame)
+
+    batch_size = 50
+
+    # One scratch buffer holds the count variable, then each batch's results
+    scratch = _get_scratch(process, batch_size * NAME_SLOT_SIZE)
 
     # Allocate count variable
-    count_var_expr = '(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
-    timing['expression_count'] += 1
+    if scratch != 0:
+        count_var_ptr = scratch
+    else:
+        count_var_expr = '(unsigned int *)malloc(sizeof(unsigned int))'
+        count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
 
-    if not count_var_result.IsValid() or count_var_result.GetError().Fail():
-        return [], timing
+        if not count_var_result.IsValid() or count_var_result.GetError().Fail():
+            return [], timing
 
-    count_var_ptr = count_var_result.GetValueAsUnsigned()
+        count_var_ptr = count_var_result.GetValueAsUnsigned()
 
     # Get protocol list
     proto_list_expr = f'(void *)objc_copyProtocolList((unsigned int *)0x{count_var_ptr:x})'
-    proto_list_result = frame.EvaluateExpression(proto_list_expr)
+    proto_list_result = frame.EvaluateExpression(proto_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     if not proto_list_result.IsValid() or proto_list_result.GetError().Fail():
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], timing
 
     proto_list_ptr = proto_list_result.GetValueAsUnsigned()
 
     # Read the count
-    count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
-    timing['expression_count'] += 1
+    error = lldb.SBError()
+    proto_count = process.ReadUnsignedFromMemory(count_var_ptr, 4, error)
+    timing['memory_read_count'] += 1
 
-    if not count_read_result.IsValid() or count_read_result.GetError().Fail():
+    if not error.Success():
         if proto_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], timing
 
-    proto_count = count_read_result.GetValueAsUnsigned()
-
     if proto_count == 0 or proto_list_ptr == 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], timing
 
     # Bulk read protocol pointer array
     array_size = proto_count * pointer_size
-    error = lldb.SBError()
     proto_array_bytes = process.ReadMemory(proto_list_ptr, array_size, error)
     timing['memory_read_count'] += 1
 
     if not error.Success():
         if proto_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], timing
 
     # Parse protocol pointers
-    if pointer_size == 8:
-        format_str = f'{proto_count}Q'
-    else:
-        format_str = f'{proto_count}I'
-
-    proto_pointers = struct.unpack(format_str, proto_array_bytes)
+    proto_pointers = unpack_pointers(proto_array_bytes, pointer_size)
 
     # Get protocol names - batch them for efficiency
     protocol_names = []
-    batch_size = 50
 
     for batch_start in range(0, len(proto_pointers), batch_size):
-        batch_end = min(batch_start + batch_size, len(proto_pointers))
-        batch = proto_pointers[batch_start:batch_end]
+        batch = proto_pointers[batch_start:batch_start + batch_size]
 
-        # Build batch expression
-        batch_expr = f'''
-(void *)(^{{
-    void **info = (void **)malloc({len(batch) * 8});
-    if (!info) return (void *)0;
-'''
-        for i, proto_ptr in enumerate(batch):
-            if proto_ptr != 0:
-                batch_expr += f'    info[{i}] = (void *)protocol_getName((void *)0x{proto_ptr:x});\n'
-            else:
-                batch_expr += f'    info[{i}] = (void *)0;\n'
-
-        batch_expr += '''    return (void *)info;
-}())
-'''
-        batch_result = frame.EvaluateExpression(batch_expr)
-        timing['expression_count'] += 1
-
-        if batch_result.IsValid() and not batch_result.GetError().Fail():
-            info_ptr = batch_result.GetValueAsUnsigned()
-            if info_ptr != 0:
-                # Read pointers
-                info_bytes = process.ReadMemory(info_ptr, len(batch) * pointer_size, error)
-                timing['memory_read_count'] += 1
-
-                if error.Success():
-                    if pointer_size == 8:
-                        name_ptrs = struct.unpack(f'{len(batch)}Q', info_bytes)
-                    else:
-                        name_ptrs = struct.unpack(f'{len(batch)}I', info_bytes)
-
-                    for name_ptr in name_ptrs:
-                        if name_ptr != 0:
-                            proto_name = process.ReadCStringFromMemory(name_ptr, 256, error)
-                            if error.Success() and proto_name:
-                                if pattern is None or _matches_pattern(proto_name, pattern):
-                                    protocol_names.append(proto_name)
-
-                frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})')
-                timing['expression_count'] += 1
-        else:
-            # Fallback to individual calls
-            for proto_ptr in batch:
-                if proto_ptr == 0:
-                    continue
-                name_expr = f'(const char *)protocol_getName((void *)0x{proto_ptr:x})'
-                name_result = frame.EvaluateExpression(name_expr)
-                timing['expression_count'] += 1
-
-                if name_result.IsValid() and not name_result.GetError().Fail():
-                    proto_name = name_result.GetSummary()
-                    if proto_name:
-                        proto_name = unquote_string(proto_name)
-                        if pattern is None or _matches_pattern(proto_name, pattern):
-                            protocol_names.append(proto_name)
+        for proto_name in _resolve_protocol_names(frame, batch, scratch, timing):
+            if matcher is None or matcher(proto_name):
+                protocol_names.append(proto_name)
 
     # Clean up
     if proto_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{proto_list_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-    timing['expression_count'] += 1
+    _free_batch_buffer(frame, count_var_ptr, scratch, timing)
 
     timing['total'] = time.time() - start_time
 
@@ -254,13 +467,45 @@ def get_protocol_pointer(frame: lldb.SBFrame, protocol_name: str) -> int:
     Returns:
         Protocol pointer address, or 0 if not found
     """
+    unique_id = frame.GetThread().GetProcess().GetUniqueID()
+    cached = _protocol_ptr_cache.get(unique_id, {}).get(protocol_name)
+    if cached:
+        return cached
+
     proto_expr = f'(void *)objc_getProtocol("{protocol_name}")'
-    proto_result = frame.EvaluateExpression(proto_expr)
+    proto_result = frame.EvaluateExpression(proto_expr, FAST_EXPR_OPTIONS)
 
     if not proto_result.IsValid() or proto_result.GetError().Fail():
         return 0
 
-    return proto_result.GetValueAsUnsigned()
+    protocol_ptr = proto_result.GetValueAsUnsigned()
+    if protocol_ptr != 0:
+        _protocol_ptr_cache.setdefault(unique_id, {})[protocol_name] = protocol_ptr
+
+    return protocol_ptr
+
+
+def _conforming_class_ptr(
+    frame: lldb.SBFrame,
+    class_name: str,
+    class_ptr: Optional[int],
+    protocol_ptr: int
+) -> Optional[int]:
+    """
+    Check one class's conformance, resolving it by name when class_ptr is unknown.
+
+    Returns:
+        The class pointer if it conforms, 0 if not, None if the expression failed
+    """
+    cls_expr = f'(Class)0x{class_ptr:x}' if class_ptr else f'(Class)NSClassFromString(@"{class_name}")'
+    expr = f'''(void *)({{
+    Class cls = {cls_expr};
+    (cls && (BOOL)class_conformsToProtocol(cls, (void *)0x{protocol_ptr:x})) ? (void *)cls : (void *)0;
+}})'''
+    result = frame.EvaluateExpression(expr, FAST_EXPR_OPTIONS)
+    if not result.IsValid() or result.GetError().Fail():
+        return None
+    return result.GetValueAsUnsigned()
 
 
 def check_class_conforms_to_protocol(
@@ -283,7 +528,7 @@ def check_class_conforms_to_protocol(
         return False
 
     conforms_expr = f'(BOOL)class_conformsToProtocol((Class)0x{class_ptr:x}, (void *)0x{protocol_ptr:x})'
-    conforms_result = frame.EvaluateExpression(conforms_expr)
+    conforms_result = frame.EvaluateExpression(conforms_expr, FAST_EXPR_OPTIONS)
 
     if not conforms_result.IsValid() or conforms_result.GetError().Fail():
         return False
@@ -305,13 +550,126 @@ def get_class_superclass(frame: lldb.SBFrame, class_ptr: int) -> int:
     if class_ptr == 0:
         return 0
 
+    process = frame.GetThread().GetProcess()
+    unique_id = process.GetUniqueID()
+
+    # The superclass field follows isa in the class struct. Read it directly
+    # once the first lookup in this process has matched class_getSuperclass.
+    field_ok = _superclass_field_ok.get(unique_id)
+    field_ptr = None
+    if field_ok is not False:
+        error = lldb.SBError()
+        field_ptr = process.ReadPointerFromMemory(class_ptr + get_pointer_size(frame), error)
+        if not error.Success():
+            field_ptr = None
+        elif field_ok:
+            return field_ptr
+
     super_expr = f'(void *)class_getSuperclass((Class)0x{class_ptr:x})'
-    super_result = frame.EvaluateExpression(super_expr)
+    super_result = frame.EvaluateExpression(super_expr, FAST_EXPR_OPTIONS)
 
     if not super_result.IsValid() or super_result.GetError().Fail():
         return 0
 
-    return super_result.GetValueAsUnsigned()
+    super_ptr = super_result.GetValueAsUnsigned()
+    if field_ok is None and field_ptr is not None:
+        _superclass_field_ok[unique_id] = field_ptr == super_ptr
+
+    return super_ptr
+
+
+def check_direct_conformance(
+    frame: lldb.SBFrame,
+    class_ptrs: List[int],
+    protocol_ptr: int,
+    timing: Dict[str, Any]
+) -> List[bool]:
+    """
+    Check which conforming classes declare the conformance themselves.
+
+    A class conforms directly when it has no superclass or its superclass
+    doesn't conform. Superclass lookup and conformance check run in batched
+    block expressions, one result byte per class: 1 if the superclass
+    conforms, 0 if not, 2 if there is no superclass.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        class_ptrs: Class pointers of the conforming classes
+        protocol_ptr: Protocol pointer address
+        timing: Timing dict (expression and memory read counts are updated)
+
+    Returns:
+        One is_direct flag per class, in order
+    """
+    if not class_ptrs:
+        return []
+
+    process = frame.GetThread().GetProcess()
+    direct_flags = []
+    batch_size = 50
+    scratch = _get_scratch(process, batch_size)
+
+    for batch_start in range(0, len(class_ptrs), batch_size):
+        batch = class_ptrs[batch_start:batch_start + batch_size]
+
+        batch_expr = '''
+(void *)(^{
+'''
+        batch_expr += _buffer_declaration('unsigned char *', 'results', len(batch), scratch)
+        batch_expr += f'''    void *proto = (void *)0x{protocol_ptr:x};
+    Class sup;
+'''
+        for i, class_ptr in enumerate(batch):
+            batch_expr += (
+                f'    sup = (Class)class_getSuperclass((Class)0x{class_ptr:x});\n'
+                f'    results[{i}] = sup ? (unsigned char)class_conformsToProtocol(sup, proto) : 2;\n'
+            )
+
+        batch_expr += '''    return (void *)results;
+}())
+'''
+        batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
+
+        results_bytes = None
+        if batch_result.IsValid() and not batch_result.GetError().Fail():
+            results_addr = batch_result.GetValueAsUnsigned()
+            if results_addr != 0:
+                error = lldb.SBError()
+                results_bytes = process.ReadMemory(results_addr, len(batch), error)
+                timing['memory_read_count'] += 1
+                if not error.Success():
+                    results_bytes = None
+
+                _free_batch_buffer(frame, results_addr, scratch, timing)
+
+        if results_bytes is not None:
+            direct_flags.extend(result != 1 for result in results_bytes)
+            continue
+
+        # Fallback to individual calls
+        for class_ptr in batch:
+            super_ptr = get_class_superclass(frame, class_ptr)
+            timing['expression_count'] += 1
+
+            if super_ptr == 0:
+                direct_flags.append(True)
+            else:
+                super_conforms = check_class_conforms_to_protocol(frame, super_ptr, protocol_ptr)
+                timing['expression_count'] += 1
+                direct_flags.append(not super_conforms)
+
+    return direct_flags
+
+
+def _filter_direct(
+    conforming_classes: List[Tuple[str, bool]],
+    direct_only: bool
+) -> List[Tuple[str, bool]]:
+    """Drop inherited conformers when only direct conformance was asked for."""
+    if not direct_only:
+        return conforming_classes
+    return [(class_name, is_direct) for class_name, is_direct in conforming_classes if is_direct]
 
 
 def find_conforming_classes(
@@ -328,7 +686,7 @@ def find_conforming_classes(
         frame: LLDB frame for expression evaluation
         protocol_name: Name of the protocol to check
         direct_only: If True, only return classes that directly declare conformance
-        force_reload: If True, bypass class cache
+        force_reload: If True, bypass the class and conformance caches
         verbose: If True, print progress
 
     Returns:
@@ -345,7 +703,18 @@ def find_conforming_classes(
     }
 
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    pid = process.GetProcessID()
+    unique_id = process.GetUniqueID()
+    stop_id = process.GetStopID()
+    pointer_size = get_pointer_size(frame)
+
+    cache_key = (unique_id, stop_id, protocol_name)
+    if force_reload:
+        _conformance_cache.pop(cache_key, None)
+    elif cache_key in _conformance_cache:
+        conforming_classes, class_count = _conformance_cache[cache_key]
+        timing['total'] = time.time() - start_time
+        return _filter_direct(conforming_classes, direct_only), timing, class_count
 
     # Get protocol pointer
     protocol_ptr = get_protocol_pointer(frame, protocol_name)
@@ -365,44 +734,61 @@ def find_conforming_classes(
         )
         timing['expression_count'] += cls_timing.get('expression_count', 0)
         timing['memory_read_count'] += cls_timing.get('memory_read_count', 0)
+        # The cache is keyed by pid; its pointers are only trusted for this
+        # very process (otherwise each class is resolved by name)
+        cls_entry = _class_cache.get(pid, {})
+        class_ptrs = cls_entry.get('pointers', {}) if cls_entry.get('unique_id') == unique_id else {}
     else:
         # Fallback: enumerate classes ourselves
+        if force_reload:
+            _class_list_cache.pop(unique_id, None)
         class_names, class_count = _enumerate_all_classes(frame, timing)
+        cached_list = _class_list_cache.get(unique_id)
+        class_ptrs = cached_list[3] if cached_list is not None and cached_list[0] == stop_id else {}
 
     timing['class_enum'] = time.time() - class_enum_start
 
     if verbose:
         print(f"Scanning {len(class_names)} classes for {protocol_name} conformance...")
 
-    # Build class name -> pointer map for efficiency
     conformance_start = time.time()
-    conforming_classes = []
-
-    # First pass: find all conforming classes
-    # We need class pointers for conformance check
-    class_ptr_map = {}
+    conforming_names = []
+    conforming_ptrs = []
+    complete = True
 
-    # Batch get class pointers
+    # Check each class's conformance in one batch (resolving by name only when
+    # the enumeration didn't provide its pointer): the block stores the class
+    # pointer for conforming classes and NULL otherwise
     batch_size = 50
+    scratch = _get_scratch(process, batch_size * 8)
     for batch_start in range(0, len(class_names), batch_size):
         batch_end = min(batch_start + batch_size, len(class_names))
         batch = class_names[batch_start:batch_end]
 
-        # Build batch expression to get class pointers
-        batch_expr = f'''
-(void *)(^{{
-    void **ptrs = (void **)malloc({len(batch) * 8});
-    if (!ptrs) return (void *)0;
+        batch_expr = '''
+(void *)(^{
+'''
+        batch_expr += _buffer_declaration('void **', 'ptrs', len(batch) * 8, scratch)
+        batch_expr += f'''    void *proto = (void *)0x{protocol_ptr:x};
+    Class cls;
 '''
         for i, class_name in enumerate(batch):
-            batch_expr += f'    ptrs[{i}] = (void *)NSClassFromString(@"{class_name}");\n'
+            class_ptr = class_ptrs.get(class_name)
+            if class_ptr:
+                batch_expr += f'    cls = (Class)0x{class_ptr:x};\n'
+            else:
+                batch_expr += f'    cls = (Class)NSClassFromString(@"{class_name}");\n'
+            batch_expr += (
+                f'    ptrs[{i}] = (cls && (BOOL)class_conformsToProtocol(cls, proto)) ? (void *)cls : (void *)0;\n'
+            )
 
         batch_expr += '''    return (void *)ptrs;
 }())
 '''
-        batch_result = frame.EvaluateExpression(batch_expr)
+        batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
         timing['expression_count'] += 1
 
+        ptrs = None
         if batch_result.IsValid() and not batch_result.GetError().Fail():
             ptrs_addr = batch_result.GetValueAsUnsigned()
             if ptrs_addr != 0:
@@ -411,215 +797,167 @@ def find_conforming_classes(
                 timing['memory_read_count'] += 1
 
                 if error.Success():
-                    if pointer_size == 8:
-                        ptrs = struct.unpack(f'{len(batch)}Q', ptrs_bytes)
-                    else:
-                        ptrs = struct.unpack(f'{len(batch)}I', ptrs_bytes)
+                    ptrs = unpack_pointers(ptrs_bytes, pointer_size)
 
-                    for class_name, class_ptr in zip(batch, ptrs):
-                        if class_ptr != 0:
-                            class_ptr_map[class_name] = class_ptr
+                _free_batch_buffer(frame, ptrs_addr, scratch, timing)
 
-                frame.EvaluateExpression(f'(void)free((void *)0x{ptrs_addr:x})')
+        if ptrs is None:
+            # Fallback to individual checks so one bad class doesn't drop the batch
+            ptrs = []
+            for class_name in batch:
+                class_ptr = _conforming_class_ptr(frame, class_name, class_ptrs.get(class_name), protocol_ptr)
                 timing['expression_count'] += 1
+                if class_ptr is None:
+                    complete = False
+                    class_ptr = 0
+                ptrs.append(class_ptr)
 
-    # Now check conformance in batches
-    class_names_with_ptrs = [(name, ptr) for name, ptr in class_ptr_map.items()]
-
-    for batch_start in range(0, len(class_names_with_ptrs), batch_size):
-        batch_end = min(batch_start + batch_size, len(class_names_with_ptrs))
-        batch = class_names_with_ptrs[batch_start:batch_end]
-
-        # Build batch expression to check conformance
-        batch_expr = f'''
-(void *)(^{{
-    unsigned char *results = (unsigned char *)malloc({len(batch)});
-    if (!results) return (void *)0;
-'''
-        for i, (class_name, class_ptr) in enumerate(batch):
-            batch_expr += f'    results[{i}] = (unsigned char)class_conformsToProtocol((Class)0x{class_ptr:x}, (void *)0x{protocol_ptr:x});\n'
-
-        batch_expr += '''    return (void *)results;
-}())
-'''
-        batch_result = frame.EvaluateExpression(batch_expr)
-        timing['expression_count'] += 1
-
-        if batch_result.IsValid() and not batch_result.GetError().Fail():
-            results_addr = batch_result.GetValueAsUnsigned()
-            if results_addr != 0:
-                error = lldb.SBError()
-                results_bytes = process.ReadMemory(results_addr, len(batch), error)
-                timing['memory_read_count'] += 1
-
-                if error.Success():
-                    for i, (class_name, class_ptr) in enumerate(batch):
-                        if results_bytes[i] != 0:
-                            conforming_classes.append((class_name, class_ptr))
-
-                frame.EvaluateExpression(f'(void)free((void *)0x{results_addr:x})')
-                timing['expression_count'] += 1
+        for class_name, class_ptr in zip(batch, ptrs):
+            if class_ptr != 0:
+                conforming_names.append(class_name)
+                conforming_ptrs.append(class_ptr)
 
         if verbose and batch_start > 0 and batch_start % 500 == 0:
-            print(f"  Progress: {batch_start}/{len(class_names_with_ptrs)} classes checked...")
+            print(f"  Progress: {batch_start}/{len(class_names)} classes checked...")
 
-    # If direct_only, filter to classes where superclass doesn't conform
-    if direct_only:
-        direct_conforming = []
-        for class_name, class_ptr in conforming_classes:
-            super_ptr = get_class_superclass(frame, class_ptr)
-            timing['expression_count'] += 1
+    # Mark each class as direct or inherited (superclass doesn't conform)
+    conforming_classes = list(zip(
+        conforming_names,
+        check_direct_conformance(frame, conforming_ptrs, protocol_ptr, timing)
+    ))
 
-            if super_ptr == 0:
-                # No superclass - this is direct
-                direct_conforming.append((class_name, True))
-            else:
-                # Check if superclass conforms
-                super_conforms = check_class_conforms_to_protocol(frame, super_ptr, protocol_ptr)
-                timing['expression_count'] += 1
-
-                if not super_conforms:
-                    # Superclass doesn't conform - this is direct
-                    direct_conforming.append((class_name, True))
-        conforming_classes = direct_conforming
-    else:
-        # Mark each class as direct or inherited
-        result_classes = []
-        for class_name, class_ptr in conforming_classes:
-            super_ptr = get_class_superclass(frame, class_ptr)
-            timing['expression_count'] += 1
-
-            if super_ptr == 0:
-                is_direct = True
-            else:
-                super_conforms = check_class_conforms_to_protocol(frame, super_ptr, protocol_ptr)
-                timing['expression_count'] += 1
-                is_direct = not super_conforms
-
-            result_classes.append((class_name, is_direct))
-        conforming_classes = result_classes
+    # Keep only the current stop's results for this process; a scan with
+    # failed checks is returned but not cached, so the next run retries
+    if class_names and complete:
+        for key in [key for key in _conformance_cache if key[0] == unique_id and key[1] != stop_id]:
+            del _conformance_cache[key]
+        _conformance_cache[cache_key] = (conforming_classes, class_count)
 
     timing['conformance_check'] = time.time() - conformance_start
     timing['total'] = time.time() - start_time
 
-    return conforming_classes, timing, class_count
+    return _filter_direct(conforming_classes, direct_only), timing, class_count
 
 
 def _enumerate_all_classes(frame: lldb.SBFrame, timing: Dict[str, Any]) -> Tuple[List[str], int]:
     """
     Fallback class enumeration when ocls is not available.
+
+    Results are cached per process until the next resume (stop ID change).
     """
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    unique_id = process.GetUniqueID()
+    stop_id = process.GetStopID()
+
+    cached = _class_list_cache.get(unique_id)
+    if cached is not None and cached[0] == stop_id:
+        return cached[1], cached[2]
+
+    pointer_size = get_pointer_size(frame)
+
+    batch_size = 50
+
+    # One scratch buffer holds the count variable, then each batch's results
+    scratch = _get_scratch(process, batch_size * NAME_SLOT_SIZE)
 
     # Allocate count variable
-    count_var_expr = '(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
-    timing['expression_count'] += 1
+    if scratch != 0:
+        count_var_ptr = scratch
+    else:
+        count_var_expr = '(unsigned int *)malloc(sizeof(unsigned int))'
+        count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
 
-    if not count_var_result.IsValid() or count_var_result.GetError().Fail():
-        return [], 0
+        if not count_var_result.IsValid() or count_var_result.GetError().Fail():
+            return [], 0
 
-    count_var_ptr = count_var_result.GetValueAsUnsigned()
+        count_var_ptr = count_var_result.GetValueAsUnsigned()
 
     # Get class list
     class_list_expr = f'(void *)objc_copyClassList((unsigned int *)0x{count_var_ptr:x})'
-    class_list_result = frame.EvaluateExpression(class_list_expr)
+    class_list_result = frame.EvaluateExpression(class_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
     timing['expression_count'] += 1
 
     if not class_list_result.IsValid() or class_list_result.GetError().Fail():
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], 0
 
     class_list_ptr = class_list_result.GetValueAsUnsigned()
 
     # Read count
-    count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
-    timing['expression_count'] += 1
+    error = lldb.SBError()
+    class_count = process.ReadUnsignedFromMemory(count_var_ptr, 4, error)
+    timing['memory_read_count'] += 1
 
-    class_count = count_read_result.GetValueAsUnsigned() if count_read_result.IsValid() else 0
+    if not error.Success():
+        class_count = 0
 
     if class_count == 0:
         if class_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], 0
 
     # Bulk read class pointer array
     array_size = class_count * pointer_size
-    error = lldb.SBError()
     class_array_bytes = process.ReadMemory(class_list_ptr, array_size, error)
     timing['memory_read_count'] += 1
 
     if not error.Success():
         if class_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
             timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
+        _free_batch_buffer(frame, count_var_ptr, scratch, timing)
         return [], class_count
 
-    if pointer_size == 8:
-        class_pointers = struct.unpack(f'{class_count}Q', class_array_bytes)
-    else:
-        class_pointers = struct.unpack(f'{class_count}I', class_array_bytes)
+    class_pointers = unpack_pointers(class_array_bytes, pointer_size)
 
     # Get class names in batches
     class_names = []
-    batch_size = 50
+    class_ptrs: Dict[str, int] = {}
 
     for batch_start in range(0, len(class_pointers), batch_size):
         batch_end = min(batch_start + batch_size, len(class_pointers))
         batch = class_pointers[batch_start:batch_end]
 
-        batch_expr = f'''
-(void *)(^{{
-    void **info = (void **)malloc({len(batch) * 8});
-    if (!info) return (void *)0;
+        batch_expr = '''
+(void *)(^{
 '''
+        batch_expr += _buffer_declaration('char *', 'names', len(batch) * NAME_SLOT_SIZE, scratch)
+        batch_expr += '    const char *name;\n'
         for i, class_ptr in enumerate(batch):
-            if class_ptr != 0:
-                batch_expr += f'    info[{i}] = (void *)class_getName((Class)0x{class_ptr:x});\n'
-            else:
-                batch_expr += f'    info[{i}] = (void *)0;\n'
+            name_expr = f'class_getName((Class)0x{class_ptr:x})' if class_ptr != 0 else '0'
+            batch_expr += _copy_name(i, name_expr)
 
-        batch_expr += '''    return (void *)info;
+        batch_expr += '''    return (void *)names;
 }())
 '''
-        batch_result = frame.EvaluateExpression(batch_expr)
+        batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
         timing['expression_count'] += 1
 
         if batch_result.IsValid() and not batch_result.GetError().Fail():
-            info_ptr = batch_result.GetValueAsUnsigned()
-            if info_ptr != 0:
-                info_bytes = process.ReadMemory(info_ptr, len(batch) * pointer_size, error)
+            names_ptr = batch_result.GetValueAsUnsigned()
+            if names_ptr != 0:
+                names_bytes = process.ReadMemory(names_ptr, len(batch) * NAME_SLOT_SIZE, error)
                 timing['memory_read_count'] += 1
 
                 if error.Success():
-                    if pointer_size == 8:
-                        name_ptrs = struct.unpack(f'{len(batch)}Q', info_bytes)
-                    else:
-                        name_ptrs = struct.unpack(f'{len(batch)}I', info_bytes)
-
-                    for name_ptr in name_ptrs:
-                        if name_ptr != 0:
-                            class_name = process.ReadCStringFromMemory(name_ptr, 256, error)
-                            if error.Success() and class_name:
-                                class_names.append(class_name)
-
-                frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})')
-                timing['expression_count'] += 1
+                    for class_name, class_ptr in zip(_unpack_names(names_bytes), batch):
+                        if class_name:
+                            class_names.append(class_name)
+                            class_ptrs[class_name] = class_ptr
+
+                _free_batch_buffer(frame, names_ptr, scratch, timing)
 
     # Clean up
     if class_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})')
+        frame.EvaluateExpression(f'(void)free((void *)0x{class_list_ptr:x})', FAST_EXPR_OPTIONS)
         timing['expression_count'] += 1
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-    timing['expression_count'] += 1
+    _free_batch_buffer(frame, count_var_ptr, scratch, timing)
+
+    if class_names:
+        _class_list_cache[unique_id] = (stop_id, class_names, class_count, class_ptrs)
 
     return class_names, class_count
 
@@ -638,8 +976,28 @@ def group_classes_by_inheritance(
     Returns:
         List of (base_class, [subclasses], is_direct) tuples
     """
+    return list(group_classes_by_inheritance_iter(frame, conforming_classes))
+
+
+def group_classes_by_inheritance_iter(
+    frame: lldb.SBFrame,
+    conforming_classes: List[Tuple[str, bool]]
+) -> Iterator[Tuple[str, List[str], bool]]:
+    """
+    Group conforming classes by inheritance, yielding one group at a time.
+
+    The superclasses of all classes are needed before any root is
+    known, so groups are yielded (sorted by base class) once the scan is done.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        conforming_classes: List of (class_name, is_direct) tuples
+
+    Yields:
+        (base_class, [subclasses], is_direct) tuples
+    """
     if not conforming_classes:
-        return []
+        return
 
     # Build set of conforming class names for quick lookup
     conforming_set = {name for name, _ in conforming_classes}
@@ -647,80 +1005,81 @@ def group_classes_by_inheritance(
 
     # Build superclass map using batching to avoid timeout
     process = frame.GetThread().GetProcess()
-    pointer_size = frame.GetModule().GetAddressByteSize()
     superclass_map = {}
 
-    # First, get all class pointers in batches
-    class_ptr_map = {}
+    # First, get each class's superclass name in batches. Only the immediate
+    # superclass is needed: every conforming ancestor is in the batch itself.
     batch_size = 50
     class_names = [name for name, _ in conforming_classes]
+    scratch = _get_scratch(process, batch_size * NAME_SLOT_SIZE)
 
     for batch_start in range(0, len(class_names), batch_size):
         batch_end = min(batch_start + batch_size, len(class_names))
         batch = class_names[batch_start:batch_end]
 
-        # Build batch expression to get class pointers and superclass names
-        batch_expr = f'''
-(void *)(^{{
-    void **ptrs = (void **)malloc({len(batch) * 2 * 8});
-    if (!ptrs) return (void *)0;
+        # Build batch expression to get superclass names
+        batch_expr = '''
+(void *)(^{
 '''
+        batch_expr += _buffer_declaration('char *', 'names', len(batch) * NAME_SLOT_SIZE, scratch)
+        batch_expr += '    const char *name;\n    Class cls;\n'
         for i, class_name in enumerate(batch):
-            batch_expr += f'''    {{
-        Class cls = NSClassFromString(@"{class_name}");
-        ptrs[{i*2}] = (void *)cls;
-        ptrs[{i*2+1}] = cls ? (void *)class_getName(class_getSuperclass(cls)) : (void *)0;
-    }}
-'''
+            batch_expr += f'    cls = (Class)NSClassFromString(@"{class_name}");\n'
+            batch_expr += _copy_name(i, '(cls = cls ? (Class)class_getSuperclass(cls) : (Class)0) ? class_getName(cls) : 0')
 
-        batch_expr += '''    return (void *)ptrs;
+        batch_expr += '''    return (void *)names;
 }())
 '''
-        batch_result = frame.EvaluateExpression(batch_expr)
+        batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
 
         if batch_result.IsValid() and not batch_result.GetError().Fail():
-            ptrs_addr = batch_result.GetValueAsUnsigned()
-            if ptrs_addr != 0:
+            names_ptr = batch_result.GetValueAsUnsigned()
+            if names_ptr != 0:
                 error = lldb.SBError()
-                ptrs_bytes = process.ReadMemory(ptrs_addr, len(batch) * 2 * pointer_size, error)
+                names_bytes = process.ReadMemory(names_ptr, len(batch) * NAME_SLOT_SIZE, error)
 
                 if error.Success():
-                    if pointer_size == 8:
-                        ptrs = struct.unpack(f'{len(batch) * 2}Q', ptrs_bytes)
-                    else:
-                        ptrs = struct.unpack(f'{len(batch) * 2}I', ptrs_bytes)
-
-                    for i, class_name in enumerate(batch):
-                        class_ptr = ptrs[i*2]
-                        super_name_ptr = ptrs[i*2+1]
-
-                        if class_ptr != 0:
-                            class_ptr_map[class_name] = class_ptr
-
-                        if super_name_ptr != 0:
-                            super_name = process.ReadCStringFromMemory(super_name_ptr, 256, error)
-                            if error.Success() and super_name:
-                                superclass_map[class_name] = super_name
-
-                frame.EvaluateExpression(f'(void)free((void *)0x{ptrs_addr:x})')
+                    for class_name, super_name in zip(batch, _unpack_names(names_bytes)):
+                        if super_name:
+                            superclass_map[class_name] = super_name
+
+                _free_batch_buffer(frame, names_ptr, scratch)
+
+    # Superclass of each conforming class if it conforms too, else None
+    parent_in_set: Dict[str, Optional[str]] = {}
+    for name in conforming_set:
+        parent = superclass_map.get(name)
+        parent_in_set[name] = parent if parent in conforming_set else None
+
+    # Root conforming ancestor per class, filled for every node on each walk
+    # (path compression) so shared ancestors are only walked once
+    root_cache: Dict[str, str] = {}
+
+    def find_root(name: str) -> str:
+        path = []
+        root = name
+        while root not in root_cache:
+            path.append(root)
+            parent = parent_in_set[root]
+            if parent is None or parent in path:
+                break
+            root = parent
+        root = root_cache.get(root, root)
+        for node in path:
+            root_cache[node] = root
+        return root
 
     # Find "root" conforming classes (those whose superclass doesn't conform)
     root_classes = []
     subclass_map = {}  # maps root -> [subclasses]
 
     for class_name, is_direct in conforming_classes:
-        super_name = superclass_map.get(class_name)
+        super_name = parent_in_set[class_name]
 
-        if super_name and super_name in conforming_set:
+        if super_name is not None:
             # This class has a conforming superclass
             # Find the root conforming ancestor
-            root = super_name
-            visited = {class_name}
-            while root in superclass_map and superclass_map[root] in conforming_set:
-                if root in visited:
-                    break
-                visited.add(root)
-                root = superclass_map[root]
+            root = find_root(super_name)
 
             if root not in subclass_map:
                 subclass_map[root] = []
@@ -729,14 +1088,8 @@ def group_classes_by_inheritance(
             # This is a root conforming class
             root_classes.append(class_name)
 
-    # Build result
-    result = []
     for root in sorted(root_classes):
-        subclasses = sorted(subclass_map.get(root, []))
-        is_direct = direct_map.get(root, True)
-        result.append((root, subclasses, is_direct))
-
-    return result
+        yield root, sorted(subclass_map.get(root, [])), direct_map.get(root, True)
 
 
 def find_objc_protocol_conformance(
@@ -780,16 +1133,11 @@ def find_objc_protocol_conformance(
             else:
                 print("No protocols found")
         else:
-            if pattern:
-                print(f"Protocols matching '{pattern}':")
-            else:
-                print("Registered protocols:")
-
-            for proto in protocols:
-                print(f"  {proto}")
-
-            print(f"\nTotal: {len(protocols)} protocol(s)")
-            print(f"[{timing['total']:.2f}s]")
+            out = [f"Protocols matching '{pattern}':\n" if pattern else "Registered protocols:\n"]
+            out.extend(f"  {proto}\n" for proto in protocols)
+            out.append(f"\nTotal: {len(protocols)} protocol(s)\n")
+            out.append(f"[{timing['total']:.2f}s]\n")
+            sys.stdout.write(''.join(out))
 
         result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
         return
@@ -822,15 +1170,13 @@ def find_objc_protocol_conformance(
             result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
             return
 
-        print(f"Protocols matching '{protocol_pattern}':")
-        for proto in matching_protocols:
-            print(f"  {proto}")
-
-        print(f"\nTotal: {len(matching_protocols)} protocol(s) matching '{protocol_pattern}'")
-        print(f"[{proto_timing['total']:.2f}s]")
-        print(f"\n\033[90mTip: Use a specific protocol name to find conforming classes, e.g.:\033[0m")
-        if matching_protocols:
-            print(f"\033[90m  oprotos {matching_protocols[0]}\033[0m")
+        out = [f"Protocols matching '{protocol_pattern}':\n"]
+        out.extend(f"  {proto}\n" for proto in matching_protocols)
+        out.append(f"\nTotal: {len(matching_protocols)} protocol(s) matching '{protocol_pattern}'\n")
+        out.append(f"[{proto_timing['total']:.2f}s]\n")
+        out.append(f"\n{DIM}Tip: Use a specific protocol name to find conforming classes, e.g.:{RESET}\n")
+        out.append(f"{DIM}  oprotos {matching_protocols[0]}{RESET}\n")
+        sys.stdout.write(''.join(out))
 
         result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
         return
@@ -851,39 +1197,41 @@ def find_objc_protocol_conformance(
             print(f"No classes conform to: {protocol_pattern}")
         else:
             # Group by inheritance
-            grouped = group_classes_by_inheritance(frame, conforming)
+            grouped = group_classes_by_inheritance_iter(frame, conforming)
 
             conformance_type = "directly conform" if direct_only else "conform"
-            print(f"Classes that {conformance_type} to {protocol_pattern}:")
+            out = [f"Classes that {conformance_type} to {protocol_pattern}:\n"]
 
             for base_class, subclasses, _is_direct in grouped:
-                print(f"  {base_class}")
+                out.append(_GROUP_HEAD.format(base_class))
                 if subclasses:
                     # Show subclasses with dim formatting
-                    subclass_str = ', '.join(subclasses[:5])
-                    if len(subclasses) > 5:
-                        subclass_str += f", ... (+{len(subclasses) - 5} more)"
-                    print(f"    \033[90m→ also: {subclass_str}\033[0m")
+                    head, extra = _head(subclasses, MAX_SUBCLASSES_SHOWN)
+                    subclass_str = ', '.join(head)
+                    if extra:
+                        subclass_str += f", ... (+{extra} more)"
+                    out.append(_GROUP_TAIL.format(subclass_str))
 
-            print(f"\nTotal: {len(conforming)} class(es) {conformance_type} to {protocol_pattern}")
-            print(f"[Scanned {scanned:,} classes | {timing['total']:.2f}s]")
+            out.append(f"\nTotal: {len(conforming)} class(es) {conformance_type} to {protocol_pattern}\n")
+            out.append(_SCANNED_LINE(scanned, timing['total']))
 
             if verbose:
-                print(f"\n  Timing breakdown:")
-                print(f"    Class enumeration: {timing.get('class_enum', 0):.2f}s")
-                print(f"    Conformance check: {timing.get('conformance_check', 0):.2f}s")
-                print(f"    Expressions: {timing.get('expression_count', 0):,}")
-                print(f"    Memory reads: {timing.get('memory_read_count', 0):,}")
+                out.append(_TIMING_BREAKDOWN.format_map(timing))
+
+            sys.stdout.write(''.join(out))
 
     result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
 
 
+# Command registration, built once at import
+_INSTALL_CMD = (
+    'command script add -h "Find Objective-C classes that conform to a protocol. '
+    'Usage: oprotos <protocol> [--direct] [--reload] [--verbose] | oprotos --list [pattern]" '
+    f'-f {__name__}.find_objc_protocol_conformance oprotos'
+)
+
+
 def __lldb_init_module(debugger: lldb.SBDebugger, internal_dict: Dict[str, Any]) -> None:
     """Initialize the module by registering the command."""
-    module_path = f"{__name__}.find_objc_protocol_conformance"
-    debugger.HandleCommand(
-        'command script add -h "Find Objective-C classes that conform to a protocol. '
-        'Usage: oprotos <protocol> [--direct] [--reload] [--verbose] | oprotos --list [pattern]" '
-        f'-f {module_path} oprotos'
-    )
+    debugger.HandleCommand(_INSTALL_CMD)
     print(f"[lldb-objc v{__version__}] 'oprotos' installed - Find classes conforming to protocols")
@@ -12,7 +12,9 @@ Usage:
 
 Options:
     --reload       Force reload methods from runtime (bypass cache)
-    --clear-cache  Clear cache for current process
+    --clear-cache  Clear cache for current process (and the class's disk entries)
+    --disk-cache   Use and update the on-disk selector cache (opt-in)
+    --purge-disk-cache  Delete the on-disk selector cache for all images
     --verbose      Show detailed timing breakdown and resource usage
     --instance     Show only instance methods (-)
     --class        Show only class methods (+)
@@ -23,20 +25,30 @@ Pattern matching:
   - With ?: matches any single character
 
 Performance:
-  - Optimized using batched expression evaluation
+  - Optimized using a single looping expression per method list
   - Per-class method caching for instant subsequent queries
+  - With --disk-cache, method lists are also kept on disk in
+    ~/.cache/lldb-objc/selectors/<image UUID>/ so later debug sessions start
+    warm (only with the same set of loaded images). Disk entries don't see
+    runtime changes such as swizzles or class_addMethod, so it is opt-in
   - Use --reload to refresh cache when runtime state changes
 """
 
 from __future__ import annotations
 
+import array
+import bisect
+import glob
+import hashlib
+import json
 import lldb
 import os
-import re
+import shutil
 import struct
 import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Add the script directory to path for version import
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -48,21 +60,149 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-from objc_utils import unquote_string
+from objc_core import (
+    ADDRESS_MASK,
+    MAX_METHOD_LIST_COUNT,
+    extract_category_from_symbol,
+    gather_selrefs,
+    get_pattern_info,
+    parse_method_entries,
+    parse_method_list_header,
+    parse_small_method_entries,
+    selref_span,
+)
+from objc_utils import (
+    EXPR_NO_RESULT_ERROR,
+    FAST_EXPR_OPTIONS,
+    RUNTIME_LIST_EXPR_OPTIONS,
+    TOP_LEVEL_EXPR_OPTIONS,
+    get_pointer_size,
+    get_scratch,
+    get_scratch_size,
+    unpack_pointers,
+    unquote_string,
+)
 
 # Type aliases
 TimingDict = Dict[str, Any]
 CacheEntry = Dict[str, Any]
 
-# Configurable batch size for selector name retrieval
-# Smaller than ocls because selector expressions are simpler
-DEFAULT_BATCH_SIZE = 50
-
 # Global cache for selector lists
 # Structure: {process_id: {class_name: {'instance': [(sel_name, imp_addr, category), ...], 'class': [...], 'timestamp': time}}}
 # category is None if method is not from a category (i.e., defined in the base class)
 _selector_cache: Dict[int, Dict[str, CacheEntry]] = {}
 
+# objc_debug_isa_class_mask per process (0 if the runtime doesn't export it)
+# Structure: {process_id: mask}
+_isa_class_mask_cache: Dict[int, int] = {}
+
+# Objective-C runtime layout (objc4, 64-bit) walked by _read_method_list:
+#   objc_class:     isa, superclass, cache (2 words), bits at +0x20
+#   class_rw_t:     uint32 flags, 2 x uint16, ro_or_rw_ext at +0x08
+#                   (low bit set: class_rw_ext_t, otherwise class_ro_t)
+#   class_rw_ext_t: ro, methods at +0x08 (low bit set: array_t of lists)
+#   class_ro_t:     baseMethods at +0x20
+#   method_list_t:  uint32 entsizeAndFlags, uint32 count, entries
+CLASS_BITS_OFFSET = 0x20
+RW_RO_OR_EXT_OFFSET = 0x08
+RW_EXT_METHODS_OFFSET = 0x08
+RO_BASE_METHODS_OFFSET = 0x20
+FAST_DATA_MASK = 0x00007ffffffffff8
+RW_REALIZED = 1 << 31
+# (method_list_t itself is decoded by the objc_core parsers)
+
+# IMPs of relative method_t entries, looked up through the runtime so swizzles
+# held in its side table are reported. The Method pointers are written to the
+# scratch arena and replaced in place by their IMPs.
+_SMALL_IMP_EXPR = '''
+(void *)(^{{
+    void **m = (void **)0x{arena:x};
+    for (unsigned long i = 0; i < {count}ul; i++) {{
+        m[i] = (void *)method_getImplementation(m[i]);
+    }}
+    return (void *)m;
+}}())
+'''
+
+# Category method symbols per image, keyed by offset from the image's __TEXT
+# so the map stays valid wherever (and in whichever process) it is loaded
+# Structure: {module_uuid: {imp_text_offset: category_name}}
+_module_categories_cache: Dict[str, Dict[int, str]] = {}
+
+# Selector name reads: longest name expected, and the widest span of
+# __objc_methname fetched with a single ReadMemory
+SELECTOR_NAME_MAX = 256
+SELECTOR_READ_SPAN = 64 * 1024
+
+# On-disk selector cache, one JSON file per class:
+#   <DISK_CACHE_DIR>/<image UUID>/<class name>.json
+# IMPs are stored as (image, offset from its __TEXT) so entries survive ASLR.
+# An entry is only used when the same set of images is loaded as when it was
+# written: another image could add categories or swizzle the class. Entries
+# replay an earlier session's runtime state (swizzles, added methods, KVO
+# subclasses), so the cache is only read and written with --disk-cache.
+DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'lldb-objc', 'selectors')
+DISK_CACHE_VERSION = 2
+
+# Out-params and loop buffers for the class_copyMethodList fallback live in
+# the shared scratch arena (objc_utils.get_scratch), reused by every lookup.
+# Target-side malloc remains the fallback when allocation fails.
+#
+# Instance and class method lookups therefore run one after another rather
+# than on worker threads: both would share the count slot, an expression
+# can't overlap another expression or a memory read (evaluation resumes the
+# process), and the usual direct-read path is bound by the debugserver link.
+
+# Method loop run against the scratch arena. The arena starts with two
+# pointer-sized words (method count, class_copyMethodList array) and the
+# (selector name, IMP) pairs are written after them, so the expression text
+# only changes when the arena does and is the same for every class.
+_LOOP_EXPR = '''
+(void *)(^{{
+    void **args = (void **)0x{arena:x};
+    unsigned int count = (unsigned int)(unsigned long)args[0];
+    void **methods = (void **)args[1];
+    void **info = args + 2;
+    for (unsigned int i = 0; i < count; i++) {{
+        void *m = methods[i];
+        info[i * 2] = m ? (void *)sel_getName((SEL)method_getName(m)) : (void *)0;
+        info[i * 2 + 1] = m ? (void *)method_getImplementation(m) : (void *)0;
+    }}
+    (void)free(methods);
+    return (void *)info;
+}}())
+'''
+
+# The same copy and loop as a function defined once per process, so a lookup
+# is a single short call. It uses the arena layout above, filling the pairs
+# only when capacity allows; otherwise it returns 0 and leaves the method
+# array in the second word for _LOOP_EXPR with a larger arena.
+_OSEL_COPY_SOURCE = '''
+void *__osel_copy(void *cls, void **args, unsigned long capacity) {
+    unsigned int count = 0;
+    void **methods = (void **)class_copyMethodList((Class)cls, &count);
+    args[0] = (void *)(unsigned long)count;
+    args[1] = (void *)methods;
+    if (!methods || count > capacity) return (void *)0;
+    void **info = args + 2;
+    for (unsigned int i = 0; i < count; i++) {
+        void *m = methods[i];
+        info[i * 2] = m ? (void *)sel_getName((SEL)method_getName(m)) : (void *)0;
+        info[i * 2 + 1] = m ? (void *)method_getImplementation(m) : (void *)0;
+    }
+    (void)free(methods);
+    args[1] = (void *)0;
+    return (void *)info;
+}
+'''
+_COPY_CALL = '(void *)__osel_copy((void *)0x{cls:x}, (void **)0x{arena:x}, {capacity}ul)'
+# Whether __osel_copy could be defined, per process
+# Structure: {process_unique_id: defined}
+_copy_helper_defined: Dict[int, bool] = {}
+
+# Turned off while osel evaluates its runtime expressions (see set_memory_cache_tracking)
+TRACK_MEMORY_CACHE_SETTING = 'target.process.track-memory-cache-changes'
+
 
 def find_objc_selectors(
     debugger: lldb.SBDebugger,
@@ -76,7 +216,9 @@ def find_objc_selectors(
 
     Flags:
         --reload: Force cache refresh and reload methods from runtime
-        --clear-cache: Clear the cache for the current process
+        --clear-cache: Clear the cache for the current process (and the class's disk entries)
+        --disk-cache: Use and update the on-disk selector cache
+        --purge-disk-cache: Delete the on-disk selector cache
         --verbose: Show detailed timing breakdown and resource usage
         --instance: Show only instance methods
         --class: Show only class methods
@@ -88,18 +230,26 @@ def find_objc_selectors(
         result.SetError("Process must be running and stopped")
         return
 
-    # Parse the input: ClassName [--reload] [--clear-cache] [--verbose] [--instance] [--class] [pattern]
+    # Parse the input: ClassName [--reload] [--clear-cache] [--disk-cache] [--purge-disk-cache] [--verbose] [--instance] [--class] [pattern]
     args = command.strip().split()
     force_reload = '--reload' in args
     clear_cache = '--clear-cache' in args
+    use_disk_cache = '--disk-cache' in args
     verbose = '--verbose' in args
     instance_only = '--instance' in args
     class_only = '--class' in args
 
+    if '--purge-disk-cache' in args:
+        shutil.rmtree(DISK_CACHE_DIR, ignore_errors=True)
+        print(f"On-disk selector cache purged ({DISK_CACHE_DIR})")
+
     # Remove flags from args
     non_flag_args = [arg for arg in args if not arg.startswith('--')]
 
     if len(non_flag_args) < 1:
+        if '--purge-disk-cache' in args:
+            result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
+            return
         # Handle --clear-cache without class name
         if clear_cache:
             pid = process.GetProcessID()
@@ -110,7 +260,7 @@ def find_objc_selectors(
                 print("No selector cache found for current process")
             result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
             return
-        result.SetError("Usage: osel ClassName [--reload] [--clear-cache] [--verbose] [--instance] [--class] [pattern]")
+        result.SetError("Usage: osel ClassName [--reload] [--clear-cache] [--disk-cache] [--purge-disk-cache] [--verbose] [--instance] [--class] [pattern]")
         return
 
     class_name = non_flag_args[0]
@@ -124,6 +274,8 @@ def find_objc_selectors(
             print(f"Cache cleared for class '{class_name}'")
         else:
             print(f"No cache found for class '{class_name}'")
+        if _drop_disk_cache(class_name):
+            print(f"On-disk cache cleared for class '{class_name}'")
         if not pattern and not force_reload:
             result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
             return
@@ -144,7 +296,8 @@ def find_objc_selectors(
         'instance_methods': 0,
         'class_methods': 0,
         'expression_count': 0,
-        'memory_read_count': 0
+        'memory_read_count': 0,
+        'error_count': 0
     }
 
     setup_start = time.time()
@@ -156,70 +309,99 @@ def find_objc_selectors(
         all_instance_methods = cache_entry['instance']
         all_class_methods = cache_entry['class']
 
-        # Filter by pattern (methods are tuples of (sel_name, imp_addr, category))
-        if pattern:
-            instance_methods = [m for m in all_instance_methods if matches_pattern(m[0], pattern)]
-            class_methods = [m for m in all_class_methods if matches_pattern(m[0], pattern)]
-        else:
-            instance_methods = all_instance_methods
-            class_methods = all_class_methods
-
         from_cache = True
-        timing['total'] = time.time() - start_time
     else:
-        # Get the class using NSClassFromString
-        class_expr = f'(Class)NSClassFromString(@"{class_name}")'
-        class_result = frame.EvaluateExpression(class_expr)
-        timing['expression_count'] += 1
+        # Scratch writes made by the expressions below would otherwise each
+        # bump the process memory ID and flush LLDB's cached values
+        saved_tracking = set_memory_cache_tracking(debugger, False)
+        try:
+            # Look the class up in the symbol tables first (no expression needed)
+            class_ptr = _resolve_class_ptr(target, class_name)
 
-        if not class_result.IsValid() or class_result.GetError().Fail():
-            result.SetError(f"Failed to resolve class '{class_name}': {class_result.GetError()}")
-            return
+            if class_ptr == 0:
+                # Fall back to NSClassFromString (no symbol, or duplicate definitions)
+                class_expr = f'(Class)NSClassFromString(@"{class_name}")'
+                class_result = frame.EvaluateExpression(class_expr, FAST_EXPR_OPTIONS)
+                timing['expression_count'] += 1
 
-        class_ptr = class_result.GetValueAsUnsigned()
+                if not class_result.IsValid() or class_result.GetError().Fail():
+                    result.SetError(f"Failed to resolve class '{class_name}': {class_result.GetError()}")
+                    return
 
-        if class_ptr == 0:
-            result.SetError(f"Class '{class_name}' not found")
-            return
+                class_ptr = class_result.GetValueAsUnsigned()
 
-        print(f"Class pointer: {class_result.GetValue()}")
+                if class_ptr == 0:
+                    result.SetError(f"Class '{class_name}' not found")
+                    return
 
-        timing['setup'] = time.time() - setup_start
+            print(f"Class pointer: 0x{class_ptr:016x}")
 
-        # Find instance methods (unless --class flag is set)
-        instance_start = time.time()
-        if not class_only:
-            all_instance_methods, inst_timing = get_methods_optimized(
-                frame, process, class_ptr, is_instance=True, resolve_categories=True
-            )
-            timing['expression_count'] += inst_timing['expression_count']
-            timing['memory_read_count'] += inst_timing['memory_read_count']
-        else:
-            all_instance_methods = []
-            inst_timing = {'expression_count': 0, 'memory_read_count': 0}
-        timing['instance_methods'] = time.time() - instance_start
-
-        # Get metaclass for class methods (unless --instance flag is set)
-        class_start = time.time()
-        if not instance_only:
-            metaclass_expr = f'(Class)object_getClass((id)0x{class_ptr:x})'
-            metaclass_result = frame.EvaluateExpression(metaclass_expr)
-            timing['expression_count'] += 1
+            timing['setup'] = time.time() - setup_start
 
-            if metaclass_result.IsValid() and not metaclass_result.GetError().Fail():
-                metaclass_ptr = metaclass_result.GetValueAsUnsigned()
-                all_class_methods, cls_timing = get_methods_optimized(
-                    frame, process, metaclass_ptr, is_instance=False, resolve_categories=True
-                )
-                timing['expression_count'] += cls_timing['expression_count']
-                timing['memory_read_count'] += cls_timing['memory_read_count']
+            # Method lists persisted by an earlier session for this image
+            disk_entry = None
+            if use_disk_cache and not force_reload:
+                disk_entry = _load_disk_cache(target, class_ptr, class_name)
+
+            if disk_entry is not None:
+                all_instance_methods, all_class_methods = disk_entry
+                from_cache = True
             else:
-                all_class_methods = []
-        else:
-            all_class_methods = []
-        timing['class_methods'] = time.time() - class_start
+                # Find instance methods (unless --class flag is set)
+                instance_start = time.time()
+                if not class_only:
+                    all_instance_methods, inst_timing = get_methods_optimized(
+                        frame, process, class_ptr, is_instance=True, resolve_categories=True
+                    )
+                    timing['expression_count'] += inst_timing['expression_count']
+                    timing['memory_read_count'] += inst_timing['memory_read_count']
+                    timing['error_count'] += inst_timing['error_count']
+                else:
+                    all_instance_methods = []
+                    inst_timing = {'expression_count': 0, 'memory_read_count': 0, 'error_count': 0}
+                timing['instance_methods'] = time.time() - instance_start
+
+                # Get metaclass for class methods (unless --instance flag is set)
+                class_start = time.time()
+                if not instance_only:
+                    # The metaclass is the class object's isa
+                    metaclass_ptr = _read_metaclass_ptr(target, process, class_ptr)
+
+                    if metaclass_ptr != 0:
+                        timing['memory_read_count'] += 1
+                    else:
+                        metaclass_expr = f'(Class)object_getClass((id)0x{class_ptr:x})'
+                        metaclass_result = frame.EvaluateExpression(metaclass_expr, FAST_EXPR_OPTIONS)
+                        timing['expression_count'] += 1
+
+                        if metaclass_result.IsValid() and not metaclass_result.GetError().Fail():
+                            metaclass_ptr = metaclass_result.GetValueAsUnsigned()
+
+                    if metaclass_ptr != 0:
+                        all_class_methods, cls_timing = get_methods_optimized(
+                            frame, process, metaclass_ptr, is_instance=False, resolve_categories=True
+                        )
+                        timing['expression_count'] += cls_timing['expression_count']
+                        timing['memory_read_count'] += cls_timing['memory_read_count']
+                        timing['error_count'] += cls_timing['error_count']
+                    else:
+                        # No metaclass: the class methods are unknown, not empty
+                        all_class_methods = []
+                        timing['error_count'] += 1
+                else:
+                    all_class_methods = []
+                timing['class_methods'] = time.time() - class_start
+        finally:
+            if saved_tracking is not None:
+                set_memory_cache_tracking(debugger, saved_tracking)
 
-        timing['total'] = time.time() - start_time
+        if not from_cache:
+            timing['total'] = time.time() - start_time
+
+            # Only complete results are worth keeping across sessions; a failed
+            # or timed-out lookup would otherwise persist as an empty list
+            if use_disk_cache and not instance_only and not class_only and timing['error_count'] == 0:
+                _save_disk_cache(target, class_ptr, class_name, all_instance_methods, all_class_methods)
 
         # Store in cache (unfiltered lists)
         if pid not in _selector_cache:
@@ -230,95 +412,159 @@ def find_objc_selectors(
             'timestamp': time.time()
         }
 
-        # Apply pattern filter (methods are tuples of (sel_name, imp_addr, category))
-        if pattern:
-            instance_methods = [m for m in all_instance_methods if matches_pattern(m[0], pattern)]
-            class_methods = [m for m in all_class_methods if matches_pattern(m[0], pattern)]
-        else:
-            instance_methods = all_instance_methods
-            class_methods = all_class_methods
+    # Apply pattern filter (methods are tuples of (sel_name, imp_addr, category))
+    if pattern:
+        match = compile_pattern(pattern)
+        instance_methods = [m for m in all_instance_methods if match(m[0])]
+        class_methods = [m for m in all_class_methods if match(m[0])]
+    else:
+        instance_methods = all_instance_methods
+        class_methods = all_class_methods
 
-    # Display results
-    print()
+    if from_cache:
+        timing['total'] = time.time() - start_time
+
+    # Display results (built up and written once)
+    out = ["\n"]
 
     # Show instance methods unless --class flag is set
     if not class_only:
         if instance_methods:
-            print(f"Instance methods ({len(instance_methods)}):")
-            for method in sorted(instance_methods, key=lambda x: x[0]):
-                sel_name = method[0]
-                imp_addr = method[1]
-                category = method[2] if len(method) > 2 else None
-                # Display address in dimmed gray text, with category if available
-                if imp_addr:
-                    if category:
-                        print(f"  -{sel_name}  \033[90m({category}) 0x{imp_addr:x}\033[0m")
-                    else:
-                        print(f"  -{sel_name}  \033[90m0x{imp_addr:x}\033[0m")
-                else:
-                    print(f"  -{sel_name}")
+            out.append(f"Instance methods ({len(instance_methods)}):\n")
+            _append_method_lines(out, '-', instance_methods)
         else:
-            print("No instance methods found")
+            out.append("No instance methods found\n")
 
     # Show class methods unless --instance flag is set
     if not instance_only:
+        if not class_only:
+            out.append("\n")  # Extra newline between sections
         if class_methods:
-            if not class_only:
-                print()  # Extra newline between sections
-            print(f"Class methods ({len(class_methods)}):")
-            for method in sorted(class_methods, key=lambda x: x[0]):
-                sel_name = method[0]
-                imp_addr = method[1]
-                category = method[2] if len(method) > 2 else None
-                # Display address in dimmed gray text, with category if available
-                if imp_addr:
-                    if category:
-                        print(f"  +{sel_name}  \033[90m({category}) 0x{imp_addr:x}\033[0m")
-                    else:
-                        print(f"  +{sel_name}  \033[90m0x{imp_addr:x}\033[0m")
-                else:
-                    print(f"  +{sel_name}")
+            out.append(f"Class methods ({len(class_methods)}):\n")
+            _append_method_lines(out, '+', class_methods)
         else:
-            if not class_only:
-                print()
-            print("No class methods found")
+            out.append("No class methods found\n")
 
     total = len(instance_methods) + len(class_methods)
     total_unfiltered = len(all_instance_methods) + len(all_class_methods)
-    print(f"\nTotal: {total} method(s)")
+    out.append(f"\nTotal: {total} method(s)\n")
 
-    # Print timing metrics
+    # Timing metrics
     if verbose:
-        print()
-        print(f"{'─' * 70}")
+        out.append("\n")
+        out.append(f"{'─' * 70}\n")
         if from_cache:
-            print(f"Performance Summary: (from cache)")
-            print(f"  Total time:     {timing['total']:.3f}s")
-            print(f"  Methods:        {total_unfiltered:,} total, {total:,} matched")
-            print(f"  Source:         Cached (use --reload to refresh)")
+            out.append("Performance Summary: (from cache)\n")
+            out.append(f"  Total time:     {timing['total']:.3f}s\n")
+            out.append(f"  Methods:        {total_unfiltered:,} total, {total:,} matched\n")
+            out.append("  Source:         Cached (use --reload to refresh)\n")
         else:
-            print(f"Performance Summary:")
-            print(f"  Total time:     {timing['total']:.2f}s")
-            print(f"  Methods:        {total_unfiltered:,} total, {total:,} matched")
+            out.append("Performance Summary:\n")
+            out.append(f"  Total time:     {timing['total']:.2f}s\n")
+            out.append(f"  Methods:        {total_unfiltered:,} total, {total:,} matched\n")
             if timing['total'] > 0:
-                print(f"  Throughput:     {total_unfiltered / timing['total']:.0f} methods/sec")
-            print(f"\n  Timing breakdown:")
-            print(f"    Setup:            {timing['setup']:.3f}s")
-            print(f"    Instance methods: {timing['instance_methods']:.3f}s")
-            print(f"    Class methods:    {timing['class_methods']:.3f}s")
-            print(f"\n  Resource usage:")
-            print(f"    Expressions:  {timing['expression_count']:,}")
-            print(f"    Memory reads: {timing['memory_read_count']:,}")
-        print(f"{'─' * 70}")
+                out.append(f"  Throughput:     {total_unfiltered / timing['total']:.0f} methods/sec\n")
+            out.append("\n  Timing breakdown:\n")
+            out.append(f"    Setup:            {timing['setup']:.3f}s\n")
+            out.append(f"    Instance methods: {timing['instance_methods']:.3f}s\n")
+            out.append(f"    Class methods:    {timing['class_methods']:.3f}s\n")
+            out.append("\n  Resource usage:\n")
+            out.append(f"    Expressions:  {timing['expression_count']:,}\n")
+            out.append(f"    Memory reads: {timing['memory_read_count']:,}\n")
+        out.append(f"{'─' * 70}\n")
     else:
         # Compact timing for non-verbose mode
         if from_cache:
-            print(f"\n[{total_unfiltered:,} total | {total:,} matched | {timing['total']:.3f}s | cached]")
+            out.append(f"\n[{total_unfiltered:,} total | {total:,} matched | {timing['total']:.3f}s | cached]\n")
         else:
-            print(f"\n[{total_unfiltered:,} total | {total:,} matched | {timing['total']:.2f}s]")
+            out.append(f"\n[{total_unfiltered:,} total | {total:,} matched | {timing['total']:.2f}s]\n")
+
+    sys.stdout.write(''.join(out))
 
     result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
 
+def _append_method_lines(out: List[str], marker: str, methods: List[Tuple[str, int, Optional[str]]]) -> None:
+    """Append one display line per method to out, sorted by selector name."""
+    for sel_name, imp_addr, category in sorted(methods, key=itemgetter(0)):
+        # Display address in dimmed gray text, with category if available
+        if not imp_addr:
+            out.append(f"  {marker}{sel_name}\n")
+        elif category:
+            out.append(f"  {marker}{sel_name}  \033[90m({category}) 0x{imp_addr:x}\033[0m\n")
+        else:
+            out.append(f"  {marker}{sel_name}  \033[90m0x{imp_addr:x}\033[0m\n")
+
+def _resolve_class_ptr(target: lldb.SBTarget, class_name: str) -> int:
+    """
+    Find a class object through its _OBJC_CLASS_$_ symbol.
+
+    LLDB indexes those symbols as eSymbolTypeObjCClass under the bare class
+    name, so this is a symbol table lookup with nothing run in the process.
+    When several images define the class, only the runtime knows which copy
+    it registered, so the lookup is left to the caller's runtime fallback.
+
+    Returns:
+        Class pointer, or 0 if no loaded image, or more than one, has a
+        symbol for the class
+    """
+    addresses = set()
+    for context in target.FindSymbols(class_name, lldb.eSymbolTypeObjCClass):
+        symbol = context.GetSymbol()
+        if symbol.IsValid() and symbol.GetName() == class_name:
+            address = symbol.GetStartAddress().GetLoadAddress(target)
+            if address != lldb.LLDB_INVALID_ADDRESS:
+                addresses.add(address)
+    return addresses.pop() if len(addresses) == 1 else 0
+
+def _read_metaclass_ptr(target: lldb.SBTarget, process: lldb.SBProcess, class_ptr: int) -> int:
+    """
+    Read a class object's isa and strip it to the metaclass pointer.
+
+    The runtime exports the mask it applies to isa values as
+    objc_debug_isa_class_mask; it is looked up once per process.
+
+    Returns:
+        Metaclass pointer, or 0 if the mask or the isa could not be read
+    """
+    pid = process.GetProcessID()
+    error = lldb.SBError()
+    mask = _isa_class_mask_cache.get(pid)
+    if mask is None:
+        mask = 0
+        for context in target.FindSymbols('objc_debug_isa_class_mask', lldb.eSymbolTypeData):
+            address = context.GetSymbol().GetStartAddress().GetLoadAddress(target)
+            if address != lldb.LLDB_INVALID_ADDRESS:
+                mask = process.ReadPointerFromMemory(address, error)
+                if not error.Success():
+                    mask = 0
+                break
+        _isa_class_mask_cache[pid] = mask
+    if mask == 0:
+        return 0
+
+    isa = process.ReadPointerFromMemory(class_ptr, error)
+    if not error.Success():
+        return 0
+    return isa & mask
+
+def set_memory_cache_tracking(debugger: lldb.SBDebugger, enabled: bool) -> Optional[bool]:
+    """
+    Set target.process.track-memory-cache-changes for this debugger.
+
+    Returns:
+        The previous value, or None if the setting is unavailable (nothing was changed)
+    """
+    instance_name = debugger.GetInstanceName()
+    previous = lldb.SBDebugger.GetInternalVariableValue(TRACK_MEMORY_CACHE_SETTING, instance_name)
+    if not previous.IsValid() or previous.GetSize() == 0:
+        return None
+    error = lldb.SBDebugger.SetInternalVariable(
+        TRACK_MEMORY_CACHE_SETTING, 'true' if enabled else 'false', instance_name
+    )
+    if not error.Success():
+        return None
+    return previous.GetStringAtIndex(0) == 'true'
+
 def matches_pattern(selector_name: str, pattern: Optional[str]) -> bool:
     """
     Check if selector name matches the pattern.
@@ -328,358 +574,795 @@ def matches_pattern(selector_name: str, pattern: Optional[str]) -> bool:
     if pattern is None:
         return True
 
-    # Check if pattern contains wildcard characters
-    has_wildcards = '*' in pattern or '?' in pattern
+    # Wildcard check and regex compilation are cached per pattern
+    has_wildcards, matcher_or_lower = get_pattern_info(pattern)
 
     if has_wildcards:
-        # Convert wildcard pattern to regex
-        # Escape special regex characters except * and ?
-        regex_pattern = re.escape(pattern)
-        # Replace escaped wildcards with regex equivalents
-        regex_pattern = regex_pattern.replace(r'\*', '.*')
-        regex_pattern = regex_pattern.replace(r'\?', '.')
-        # Make it match the whole string and case-insensitive
-        regex_pattern = f'^{regex_pattern}$'
-        try:
-            return bool(re.match(regex_pattern, selector_name, re.IGNORECASE))
-        except re.error:
-            # Fallback to substring match if regex is invalid
-            return pattern.lower() in selector_name.lower()
+        return matcher_or_lower(selector_name)
     else:
         # Simple substring matching (case-insensitive)
-        return pattern.lower() in selector_name.lower()
+        return matcher_or_lower in selector_name.lower()
+
+def compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """
+    Resolve a pattern once into a predicate equivalent to matches_pattern(name, pattern).
+    Use this when filtering many names against the same pattern.
+    """
+    has_wildcards, matcher_or_lower = get_pattern_info(pattern)
+
+    if has_wildcards:
+        return matcher_or_lower
+    return lambda selector_name: matcher_or_lower in selector_name.lower()
 
-def build_selector_batch_expression(method_pointers: Tuple[int, ...]) -> str:
+def build_selector_batch_expression(method_list_ptr: int, method_count: int) -> str:
     """
-    Build a compound expression that calls sel_getName(method_getName()) and
-    method_getImplementation() for multiple methods.
+    Build one expression that walks a class_copyMethodList() array in the
+    target and calls sel_getName(method_getName()) and
+    method_getImplementation() for every entry.
+
+    The loop runs in the target, so the expression text depends only on the
+    list address and count, never on the number of methods. The method
+    array is freed once the loop has finished with it. Used when there is
+    no scratch arena for _LOOP_EXPR; the returned buffer is malloc'd.
 
     Args:
-        method_pointers: List of method pointer addresses
+        method_list_ptr: Address of the Method array from class_copyMethodList
+        method_count: Number of entries in the array
 
     Returns:
-        String containing the compound expression
+        String containing the expression
 
     The returned buffer format is:
-        Array of (batch_size * 2) pointers:
+        Array of (method_count * 2) pointers:
         - Even indices: selector name pointers
         - Odd indices: IMP addresses
     """
-    batch_size = len(method_pointers)
-
-    # Allocate buffer for pointers (batch_size * 2 * pointer_size)
-    # Each method needs: selector name pointer + IMP pointer
-
-    # Build expression using Objective-C block
-    # Use sizeof(void*) to handle both 32-bit and 64-bit architectures
-    expr = f'''
+    return f'''
 (void *)(^{{
-    void **info = (void **)malloc({batch_size * 2} * sizeof(void*));
+    unsigned int count = {method_count}u;
+    void **methods = (void **)0x{method_list_ptr:x};
+    void **info = (void **)malloc(count * 2 * sizeof(void*));
     if (!info) return (void *)0;
+    for (unsigned int i = 0; i < count; i++) {{
+        void *m = methods[i];
+        info[i * 2] = m ? (void *)sel_getName((SEL)method_getName(m)) : (void *)0;
+        info[i * 2 + 1] = m ? (void *)method_getImplementation(m) : (void *)0;
+    }}
+    (void)free(methods);
+    return (void *)info;
+}}())
 '''
 
-    for i, method_ptr in enumerate(method_pointers):
-        if method_ptr != 0:
-            expr += f'''
-    info[{i * 2}] = (void *)sel_getName((SEL)method_getName((void *)0x{method_ptr:x}));
-    info[{i * 2 + 1}] = (void *)method_getImplementation((void *)0x{method_ptr:x});
-'''
-        else:
-            expr += f'''
-    info[{i * 2}] = (void *)0;
-    info[{i * 2 + 1}] = (void *)0;
-'''
 
-    expr += '''
-    return (void *)info;
-}())
-'''
+def _module_categories(module: lldb.SBModule) -> Dict[int, str]:
+    """
+    Map every category method in a module, by offset from the module's
+    __TEXT, to its category name, from one pass over the module's symbols
+    (cached by UUID).
+    """
+    uuid = module.GetUUIDString()
+    categories = _module_categories_cache.get(uuid)
+    if categories is None:
+        categories = {}
+        text_base = module.FindSection('__TEXT').GetFileAddress()
+        for symbol in module:
+            if symbol.GetType() != lldb.eSymbolTypeCode:
+                continue
+            name = symbol.GetName()
+            # Only "-[Class(Category) sel]" style names can carry a category
+            if not name or name[1:2] != '[' or '(' not in name:
+                continue
+            _, category, _ = extract_category_from_symbol(name)
+            if category:
+                categories[symbol.GetStartAddress().GetFileAddress() - text_base] = category
+        if uuid:
+            _module_categories_cache[uuid] = categories
+    return categories
+
+def _category_lookup(target: lldb.SBTarget) -> Callable[[int], Optional[str]]:
+    """
+    Build an IMP -> category name lookup for the target's loaded images.
 
-    return expr
+    IMPs are matched to images by __TEXT range (bisect over the sorted
+    ranges) and then looked up by offset in _module_categories, so resolving
+    a class costs at most one symbol scan per image instead of a symbol
+    search per method.
+    """
+    starts, ranges = _text_ranges(target)
 
+    def category_for(imp_addr: int) -> Optional[str]:
+        i = _range_index(starts, ranges, imp_addr)
+        if i < 0:
+            return None
+        start, _, module = ranges[i]
+        return _module_categories(module).get(imp_addr - start)
 
-def get_methods_optimized(
-    frame: lldb.SBFrame,
-    process: lldb.SBProcess,
-    class_ptr: int,
-    is_instance: bool = True,
-    resolve_categories: bool = False
-) -> Tuple[List[Tuple[str, int, Optional[str]]], TimingDict]:
+    return category_for
+
+def _text_ranges(target: lldb.SBTarget) -> Tuple[List[int], List[Tuple[int, int, lldb.SBModule]]]:
     """
-    Get all methods for a class using class_copyMethodList.
-    Returns a tuple of (list of (selector_name, imp_address, category_name) tuples, timing dict).
-    category_name is None if resolve_categories=False or if the method is not from a category.
+    Get the loaded images' __TEXT ranges sorted by start address.
 
-    Optimized implementation using:
-    - Bulk memory reads for method pointer array
-    - Batched sel_getName(method_getName()) and method_getImplementation() calls
-    - process.ReadCStringFromMemory() for fast string retrieval
-    - Optional symbol resolution for category detection (when resolve_categories=True)
+    Returns:
+        Tuple of (start addresses, [(start, end, module), ...]) for bisecting
+    """
+    ranges = []
+    for module in target.module_iter():
+        text = module.FindSection('__TEXT')
+        if text.IsValid():
+            start = text.GetLoadAddress(target)
+            if start != lldb.LLDB_INVALID_ADDRESS:
+                ranges.append((start, start + text.GetByteSize(), module))
+    ranges.sort(key=lambda r: r[0])
+    return [r[0] for r in ranges], ranges
+
+def _range_index(starts: List[int], ranges: List[Tuple[int, int, lldb.SBModule]], address: int) -> int:
+    """Index of the _text_ranges entry containing address, or -1."""
+    if not address:
+        return -1
+    i = bisect.bisect_right(starts, address) - 1
+    if i < 0 or address >= ranges[i][1]:
+        return -1
+    return i
+
+def _loaded_images_digest(ranges: List[Tuple[int, int, lldb.SBModule]]) -> str:
+    """Digest of the loaded images' UUIDs (order-independent), from _text_ranges."""
+    uuids = sorted(module.GetUUIDString() or '' for _, _, module in ranges)
+    return hashlib.sha1('\n'.join(uuids).encode()).hexdigest()
+
+def _disk_cache_path(target: lldb.SBTarget, class_ptr: int, class_name: str) -> Optional[str]:
+    """Path of the on-disk entry for a class, under the UUID of the image defining it."""
+    module = target.ResolveLoadAddress(class_ptr).GetModule()
+    uuid = module.GetUUIDString() if module.IsValid() else None
+    if not uuid or os.sep in class_name:
+        return None
+    return os.path.join(DISK_CACHE_DIR, uuid, f"{class_name}.json")
+
+def _drop_disk_cache(class_name: str) -> int:
+    """
+    Delete a class's on-disk entries under every image UUID.
 
-    For N methods:
-    - Before: ~2N expression evaluations
-    - After: ~(N/batch_size + 4) expression evaluations + ~(N/batch_size + 1) memory reads
+    Returns:
+        Number of entries removed
     """
-    timing = {
-        'expression_count': 0,
-        'memory_read_count': 0
-    }
+    if os.sep in class_name:
+        return 0
+    removed = 0
+    for path in glob.glob(os.path.join(glob.escape(DISK_CACHE_DIR), '*', glob.escape(f"{class_name}.json"))):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def _save_disk_cache(
+    target: lldb.SBTarget,
+    class_ptr: int,
+    class_name: str,
+    instance_methods: List[Tuple[str, int, Optional[str]]],
+    class_methods: List[Tuple[str, int, Optional[str]]]
+) -> None:
+    """
+    Write a class's method lists to the on-disk cache (atomically, via rename).
 
-    # Allocate space for method count
-    count_var_expr = f'(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
-    timing['expression_count'] += 1
+    Skipped when an IMP lies outside every loaded image (e.g. a block-based
+    IMP), since it couldn't be relocated in a later session. Callers only
+    save lists read without errors.
+    """
+    path = _disk_cache_path(target, class_ptr, class_name)
+    if path is None:
+        return
 
-    if not count_var_result.IsValid() or count_var_result.GetError().Fail():
-        print(f"Warning: Failed to allocate count variable")
-        return [], timing
+    starts, ranges = _text_ranges(target)
+    images: List[str] = []
+    image_index: Dict[str, int] = {}
+
+    def encode(methods: List[Tuple[str, int, Optional[str]]]) -> Optional[List[list]]:
+        rows = []
+        for sel_name, imp_addr, category in methods:
+            if not imp_addr:
+                rows.append([sel_name, -1, 0, category])
+                continue
+            i = _range_index(starts, ranges, imp_addr)
+            if i < 0:
+                return None
+            uuid = ranges[i][2].GetUUIDString()
+            if uuid not in image_index:
+                image_index[uuid] = len(images)
+                images.append(uuid)
+            rows.append([sel_name, image_index[uuid], imp_addr - ranges[i][0], category])
+        return rows
+
+    instance_rows = encode(instance_methods)
+    class_rows = encode(class_methods)
+    if instance_rows is None or class_rows is None:
+        return
 
-    count_var_ptr = count_var_result.GetValueAsUnsigned()
+    entry = {
+        'version': DISK_CACHE_VERSION,
+        'loaded': _loaded_images_digest(ranges),
+        'images': images,
+        'instance': instance_rows,
+        'class': class_rows,
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
-    # Copy method list
-    method_list_expr = f'(void *)class_copyMethodList((Class)0x{class_ptr:x}, (unsigned int *)0x{count_var_ptr:x})'
-    method_list_result = frame.EvaluateExpression(method_list_expr)
-    timing['expression_count'] += 1
+def _load_disk_cache(
+    target: lldb.SBTarget,
+    class_ptr: int,
+    class_name: str
+) -> Optional[Tuple[List[Tuple[str, int, Optional[str]]], List[Tuple[str, int, Optional[str]]]]]:
+    """
+    Read a class's method lists from the on-disk cache, relocated to this session.
 
-    if not method_list_result.IsValid() or method_list_result.GetError().Fail():
-        print(f"Warning: class_copyMethodList failed: {method_list_result.GetError()}")
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
-        return [], timing
+    Returns:
+        Tuple of (instance_methods, class_methods), or None if there is no
+        usable entry (missing, unreadable, or written with a different set of
+        loaded images)
+    """
+    path = _disk_cache_path(target, class_ptr, class_name)
+    if path is None:
+        return None
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != DISK_CACHE_VERSION:
+        return None
+
+    _, ranges = _text_ranges(target)
+    if entry.get('loaded') != _loaded_images_digest(ranges):
+        return None
+    loaded = {module.GetUUIDString(): start for start, _, module in ranges}
+    try:
+        bases = [loaded[uuid] for uuid in entry['images']]
+        return tuple(
+            [(sel_name, bases[image] + offset if image >= 0 else 0, category)
+             for sel_name, image, offset, category in entry[kind]]
+            for kind in ('instance', 'class')
+        )
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def _read_selector_names(
+    process: lldb.SBProcess,
+    sel_ptrs: Sequence[int],
+    timing: TimingDict
+) -> List[Optional[str]]:
+    """
+    Read the C string behind each selector pointer.
 
-    method_list_ptr = method_list_result.GetValueAsUnsigned()
+    Selector names sit together in __objc_methname, so pointers are sorted
+    and each run spanning at most SELECTOR_READ_SPAN bytes is fetched with
+    one ReadMemory and split in Python. A run whose read fails (e.g. its
+    last string ends near an unmapped page) falls back to per-string reads.
+    Memory read and error counts are added to timing.
 
-    # Read the count
-    count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
-    timing['expression_count'] += 1
+    Returns:
+        One name per pointer, in order (None for NULL or unreadable names)
+    """
+    names: List[Optional[str]] = [None] * len(sel_ptrs)
+    order = sorted((ptr, i) for i, ptr in enumerate(sel_ptrs) if ptr)
+    error = lldb.SBError()
 
-    if not count_read_result.IsValid() or count_read_result.GetError().Fail():
-        print(f"Warning: Failed to read method count")
-        if method_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})')
-            timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
-        return [], timing
+    start = 0
+    while start < len(order):
+        lo = order[start][0]
+        end = start + 1
+        while end < len(order) and order[end][0] + SELECTOR_NAME_MAX - lo <= SELECTOR_READ_SPAN:
+            end += 1
+        run = order[start:end]
+        start = end
 
-    method_count = count_read_result.GetValueAsUnsigned()
+        data = process.ReadMemory(lo, run[-1][0] + SELECTOR_NAME_MAX - lo, error)
+        timing['memory_read_count'] += 1
+        if error.Success() and data:
+            for ptr, i in run:
+                offset = ptr - lo
+                nul = data.find(b'\0', offset, offset + SELECTOR_NAME_MAX)
+                if nul == -1:
+                    # Truncate like ReadCStringFromMemory would
+                    nul = offset + SELECTOR_NAME_MAX - 1
+                if nul > offset:
+                    names[i] = data[offset:nul].decode('utf-8', 'replace')
+            continue
 
-    if method_count == 0 or method_list_ptr == 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
-        return [], timing
+        error.Clear()
+        for ptr, i in run:
+            name = process.ReadCStringFromMemory(ptr, SELECTOR_NAME_MAX, error)
+            timing['memory_read_count'] += 1
+            if error.Success() and name:
+                names[i] = name
+            else:
+                if error.Fail():
+                    timing['error_count'] += 1
+                error.Clear()
 
-    # OPTIMIZATION: Bulk read the method pointer array
-    pointer_size = frame.GetModule().GetAddressByteSize()
-    array_size = method_count * pointer_size
+    return names
 
-    error = lldb.SBError()
-    method_array_bytes = process.ReadMemory(method_list_ptr, array_size, error)
-    timing['memory_read_count'] += 1
 
-    if not error.Success():
-        print(f"Warning: Failed to read method array from memory: {error}")
-        if method_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})')
-            timing['expression_count'] += 1
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
-        timing['expression_count'] += 1
-        return [], timing
+def _read_method_list(
+    frame: lldb.SBFrame,
+    process: lldb.SBProcess,
+    class_ptr: int,
+    pointer_size: int,
+    timing: TimingDict
+) -> Optional[List[Tuple[str, int, Optional[str]]]]:
+    """
+    Get a class's methods by walking the runtime structures with memory
+    reads: class bits -> class_rw_t -> class_rw_ext_t methods (which
+    include attached categories) or class_ro_t baseMethods -> method_list_t.
+    Expression and memory read counts are added to timing.
 
-    # Parse method pointers in Python (fast - no LLDB overhead)
-    if pointer_size == 8:
-        format_str = f'{method_count}Q'  # 64-bit unsigned pointers
-    else:
-        format_str = f'{method_count}I'  # 32-bit unsigned pointers
+    Relative (small) method lists store the original IMP; a swizzled method's
+    IMP lives in a runtime side table. Their IMPs are therefore looked up with
+    one method_getImplementation batch (_resolve_small_imps).
 
-    method_pointers = struct.unpack(format_str, method_array_bytes)
+    Returns:
+        List of (selector_name, imp_address, None) tuples, or None if the
+        class isn't realized yet or its layout isn't one this reader knows
+        (32-bit, shared-cache direct selectors, unexpected sizes)
+    """
+    if pointer_size != 8:
+        return None
 
-    # OPTIMIZATION: Batch the selector name and IMP retrieval
-    selectors = []  # List of (sel_name, imp_addr) tuples
-    batch_size = DEFAULT_BATCH_SIZE
+    error = lldb.SBError()
 
-    for batch_idx in range(0, len(method_pointers), batch_size):
-        batch_end = min(batch_idx + batch_size, len(method_pointers))
-        batch = method_pointers[batch_idx:batch_end]
-        current_batch_size = len(batch)
+    # class_data_bits_t -> class_rw_t
+    bits = process.ReadPointerFromMemory(class_ptr + CLASS_BITS_OFFSET, error)
+    timing['memory_read_count'] += 1
+    if not error.Success() or bits & FAST_DATA_MASK == 0:
+        return None
 
-        # Build and execute batch expression
-        batch_expr = build_selector_batch_expression(batch)
-        batch_result = frame.EvaluateExpression(batch_expr)
-        timing['expression_count'] += 1
+    rw_bytes = process.ReadMemory(bits & FAST_DATA_MASK, RW_RO_OR_EXT_OFFSET + 8, error)
+    timing['memory_read_count'] += 1
+    if not error.Success():
+        return None
 
-        if not batch_result.IsValid() or batch_result.GetError().Fail():
-            # Fallback: process each method individually
-            for method_ptr in batch:
-                if method_ptr == 0:
-                    continue
-                # Get selector name
-                sel_name_expr = f'(const char *)sel_getName((SEL)method_getName((void *)0x{method_ptr:x}))'
-                sel_name_result = frame.EvaluateExpression(sel_name_expr)
-                timing['expression_count'] += 1
+    rw_flags = struct.unpack_from('<I', rw_bytes)[0]
+    ro_or_rw_ext = struct.unpack_from('<Q', rw_bytes, RW_RO_OR_EXT_OFFSET)[0]
+    if not rw_flags & RW_REALIZED:
+        # bits still points at the compiler's class_ro_t; class_copyMethodList realizes it
+        return None
 
-                # Get IMP
-                imp_expr = f'(void *)method_getImplementation((void *)0x{method_ptr:x})'
-                imp_result = frame.EvaluateExpression(imp_expr)
-                timing['expression_count'] += 1
+    if ro_or_rw_ext & 1:
+        methods = process.ReadPointerFromMemory((ro_or_rw_ext & FAST_DATA_MASK) + RW_EXT_METHODS_OFFSET, error)
+    else:
+        methods = process.ReadPointerFromMemory((ro_or_rw_ext & FAST_DATA_MASK) + RO_BASE_METHODS_OFFSET, error)
+    timing['memory_read_count'] += 1
+    if not error.Success():
+        return None
 
-                if sel_name_result.IsValid() and not sel_name_result.GetError().Fail():
-                    sel_name = sel_name_result.GetSummary()
-                    if sel_name:
-                        sel_name = unquote_string(sel_name)
-                        imp_addr = imp_result.GetValueAsUnsigned() if imp_result.IsValid() else 0
-                        selectors.append((sel_name, imp_addr, None))  # Category resolved later
+    if ro_or_rw_ext & 1 and methods & 1:
+        # array_t: uint32 count, then the list pointers (categories first)
+        array_ptr = methods & FAST_DATA_MASK
+        list_count = process.ReadUnsignedFromMemory(array_ptr, 4, error)
+        timing['memory_read_count'] += 1
+        if not error.Success() or list_count > MAX_METHOD_LIST_COUNT:
+            return None
+        list_bytes = process.ReadMemory(array_ptr + 8, list_count * 8, error) if list_count else b''
+        timing['memory_read_count'] += 1
+        if not error.Success():
+            return None
+        method_lists = unpack_pointers(list_bytes, pointer_size)
+    else:
+        method_lists = (methods,)
+
+    sel_ptrs = []
+    imps = []
+    # Relative entries: (index into imps, Method pointer), IMPs filled in below
+    small_methods = []
+    for method_list in method_lists:
+        method_list &= FAST_DATA_MASK
+        if method_list == 0:
             continue
 
-        info_ptr = batch_result.GetValueAsUnsigned()
-        if info_ptr == 0:
+        header = process.ReadMemory(method_list, 8, error)
+        timing['memory_read_count'] += 1
+        if not error.Success():
+            return None
+
+        layout = parse_method_list_header(header)
+        if layout is None:
+            return None
+        entsize, count, is_small = layout
+        if count == 0:
             continue
 
-        # Read the pointer array from memory using correct pointer size
-        # Now we have 2 pointers per method: sel_name_ptr and imp_ptr
-        ptr_array_size = current_batch_size * 2 * pointer_size
-        ptr_bytes = process.ReadMemory(info_ptr, ptr_array_size, error)
+        entries_ptr = method_list + 8
+        entries = process.ReadMemory(entries_ptr, count * entsize, error)
         timing['memory_read_count'] += 1
+        if not error.Success():
+            return None
+
+        if is_small:
+            selrefs, method_ptrs = parse_small_method_entries(entries, entries_ptr, entsize)
+
+            # The selector refs sit together in __objc_selrefs; read them in one go
+            span = selref_span(selrefs)
+            if span is None:
+                return None
+            selref_bytes = process.ReadMemory(span[0], span[1], error)
+            timing['memory_read_count'] += 1
+            if not error.Success():
+                return None
+            sel_ptrs.extend(gather_selrefs(selref_bytes, span[0], selrefs))
+            small_methods.extend(zip(range(len(imps), len(imps) + count), method_ptrs))
+            imps.extend([0] * count)
+        else:
+            list_sels, list_imps = parse_method_entries(entries, entsize)
+            sel_ptrs.extend(list_sels)
+            imps.extend(list_imps)
 
-        if error.Success():
-            # Parse pointers using correct format for architecture
-            ptr_format = f'{current_batch_size * 2}Q' if pointer_size == 8 else f'{current_batch_size * 2}I'
-            ptrs = struct.unpack(ptr_format, ptr_bytes)
+    if small_methods:
+        small_imps = _resolve_small_imps(frame, process, [ptr for _, ptr in small_methods], timing)
+        if small_imps is None:
+            return None
+        for (index, _), imp in zip(small_methods, small_imps):
+            imps[index] = imp
 
-            # Read each selector name string from memory
-            for i in range(current_batch_size):
-                sel_ptr = ptrs[i * 2]
-                imp_addr = ptrs[i * 2 + 1]
+    names = _read_selector_names(process, sel_ptrs, timing)
+    return [(name, imp_addr, None) for name, imp_addr in zip(names, imps) if name]  # Category resolved later
 
-                if sel_ptr == 0:
-                    continue
 
-                sel_name = process.ReadCStringFromMemory(sel_ptr, 256, error)
-                timing['memory_read_count'] += 1
+def _resolve_small_imps(
+    frame: lldb.SBFrame,
+    process: lldb.SBProcess,
+    method_ptrs: Sequence[int],
+    timing: TimingDict
+) -> Optional[List[int]]:
+    """
+    Look up the IMPs of relative method_t entries with one expression.
 
-                if error.Success() and sel_name:
-                    selectors.append((sel_name, imp_addr, None))  # Category resolved later
+    Returns:
+        IMPs in method_ptrs order (pointer authentication stripped), or None
+        if the scratch arena, the expression or the read-back failed
+    """
+    size = len(method_ptrs) * 8
+    arena = get_scratch(process, size)
+    if not arena:
+        return None
 
-        # Free the info buffer
-        frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})')
-        timing['expression_count'] += 1
+    error = lldb.SBError()
+    process.WriteMemory(arena, array.array('Q', method_ptrs).tobytes(), error)
+    if not error.Success():
+        return None
 
-    # Clean up allocated memory
-    if method_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})')
-        timing['expression_count'] += 1
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+    imp_expr = _SMALL_IMP_EXPR.format(arena=arena, count=len(method_ptrs))
+    imp_result = frame.EvaluateExpression(imp_expr, RUNTIME_LIST_EXPR_OPTIONS)
     timing['expression_count'] += 1
+    if not imp_result.IsValid() or imp_result.GetError().Fail() or imp_result.GetValueAsUnsigned() != arena:
+        return None
 
-    # Optionally resolve category info from symbols
-    if resolve_categories and selectors:
-        from objc_utils import extract_category_from_symbol
-        target = frame.GetThread().GetProcess().GetTarget()
-        methods_with_categories = []
-        for sel_name, imp_addr, _ in selectors:
-            category = None
-            if imp_addr:
-                addr = target.ResolveLoadAddress(imp_addr)
-                if addr.IsValid():
-                    symbol = addr.GetSymbol()
-                    if symbol.IsValid():
-                        symbol_name = symbol.GetName()
-                        if symbol_name:
-                            _, category, _ = extract_category_from_symbol(symbol_name)
-            methods_with_categories.append((sel_name, imp_addr, category))
-        selectors = methods_with_categories
-
-    return selectors, timing
+    imp_bytes = process.ReadMemory(arena, size, error)
+    timing['memory_read_count'] += 1
+    if not error.Success():
+        return None
+    return [imp & ADDRESS_MASK for imp in unpack_pointers(imp_bytes, 8)]
 
 
-def get_methods(
+def _copy_method_list(
     frame: lldb.SBFrame,
+    process: lldb.SBProcess,
     class_ptr: int,
-    is_instance: bool = True,
-    pattern: Optional[str] = None
-) -> List[str]:
+    pointer_size: int,
+    timing: TimingDict
+) -> List[Tuple[str, int, Optional[str]]]:
     """
-    Get all methods for a class using class_copyMethodList.
-    Returns a list of selector names.
+    Get a class's methods through class_copyMethodList: one call to the
+    __osel_copy helper, or the copy and one looping batch expression when
+    the helper is unavailable. Expression and memory read counts are added
+    to timing.
 
-    NOTE: This is the legacy unoptimized implementation kept for reference.
-    Use get_methods_optimized() for better performance.
+    Returns:
+        List of (selector_name, imp_address, None) tuples
     """
-    # Allocate space for method count
-    count_var_expr = f'(unsigned int *)malloc(sizeof(unsigned int))'
-    count_var_result = frame.EvaluateExpression(count_var_expr)
+    selectors = _copy_with_helper(frame, process, class_ptr, pointer_size, timing)
+    if selectors is not None:
+        return selectors
 
-    if not count_var_result.IsValid() or count_var_result.GetError().Fail():
-        print(f"Warning: Failed to allocate count variable")
-        return []
+    error = lldb.SBError()
 
-    count_var_ptr = count_var_result.GetValueAsUnsigned()
+    # The method count out-param lives in the process scratch arena
+    count_var_ptr = get_scratch(process, 4)
+    owns_count_var = count_var_ptr == 0
+    if not owns_count_var:
+        process.WriteMemory(count_var_ptr, b'\0\0\0\0', error)
+        error.Clear()
+    else:
+        # Fallback: allocate it in the target
+        count_var_expr = '(unsigned int *)malloc(sizeof(unsigned int))'
+        count_var_result = frame.EvaluateExpression(count_var_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
+
+        if not count_var_result.IsValid() or count_var_result.GetError().Fail():
+            print("Warning: Failed to allocate count variable")
+            timing['error_count'] += 1
+            return []
+
+        count_var_ptr = count_var_result.GetValueAsUnsigned()
 
     # Copy method list
     method_list_expr = f'(void *)class_copyMethodList((Class)0x{class_ptr:x}, (unsigned int *)0x{count_var_ptr:x})'
-    method_list_result = frame.EvaluateExpression(method_list_expr)
+    method_list_result = frame.EvaluateExpression(method_list_expr, RUNTIME_LIST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
 
     if not method_list_result.IsValid() or method_list_result.GetError().Fail():
         print(f"Warning: class_copyMethodList failed: {method_list_result.GetError()}")
-        # Clean up
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+        timing['error_count'] += 1
+        if owns_count_var:
+            frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
+            timing['expression_count'] += 1
         return []
 
     method_list_ptr = method_list_result.GetValueAsUnsigned()
 
-    # Read the count
-    count_read_expr = f'(unsigned int)(*(unsigned int *)0x{count_var_ptr:x})'
-    count_read_result = frame.EvaluateExpression(count_read_expr)
+    # Read the count straight from memory (no expression needed for a plain load)
+    method_count = process.ReadUnsignedFromMemory(count_var_ptr, 4, error)
+    timing['memory_read_count'] += 1
 
-    if not count_read_result.IsValid() or count_read_result.GetError().Fail():
-        print(f"Warning: Failed to read method count")
-        # Clean up
+    if not error.Success():
+        print(f"Warning: Failed to read method count: {error}")
+        timing['error_count'] += 1
         if method_list_ptr != 0:
-            frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})')
-        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+            frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})', FAST_EXPR_OPTIONS)
+            timing['expression_count'] += 1
+        if owns_count_var:
+            frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
+            timing['expression_count'] += 1
         return []
 
-    method_count = count_read_result.GetValueAsUnsigned()
+    if owns_count_var:
+        frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})', FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
 
-    # Collect selector names
-    selectors = []
-    pointer_size = frame.GetModule().GetAddressByteSize()
+    if method_count == 0 or method_list_ptr == 0:
+        return []
 
-    for i in range(method_count):
-        # Get method at index
-        method_offset = i * pointer_size
-        method_ptr_expr = f'(void *)((void **)0x{method_list_ptr:x})[{i}]'
-        method_ptr_result = frame.EvaluateExpression(method_ptr_expr)
+    return _loop_method_list(frame, process, method_list_ptr, method_count, pointer_size, timing)
 
-        if not method_ptr_result.IsValid() or method_ptr_result.GetError().Fail():
-            continue
+def _has_copy_helper(frame: lldb.SBFrame, process: lldb.SBProcess, timing: TimingDict) -> bool:
+    """
+    Check whether __osel_copy is defined in the process.
+
+    The first call per process defines _OSEL_COPY_SOURCE in the target;
+    later calls return the cached result without touching the target.
+    """
+    unique_id = process.GetUniqueID()
+    defined = _copy_helper_defined.get(unique_id)
+    if defined is None:
+        result = frame.EvaluateExpression(_OSEL_COPY_SOURCE, TOP_LEVEL_EXPR_OPTIONS)
+        timing['expression_count'] += 1
+        error = result.GetError()
+        # A redefinition means the helper is already there (e.g. after oreload)
+        defined = (error.Success() or error.GetError() == EXPR_NO_RESULT_ERROR
+                   or 'redefinition' in (error.GetCString() or ''))
+        _copy_helper_defined[unique_id] = defined
+    return defined
+
+def _copy_with_helper(
+    frame: lldb.SBFrame,
+    process: lldb.SBProcess,
+    class_ptr: int,
+    pointer_size: int,
+    timing: TimingDict
+) -> Optional[List[Tuple[str, int, Optional[str]]]]:
+    """
+    Get a class's methods with a single __osel_copy call into the scratch arena.
+
+    Returns:
+        List of (selector_name, imp_address, None) tuples, or None if the
+        helper or the arena is unavailable or the call failed
+    """
+    header_size = 2 * pointer_size
+    arena = get_scratch(process, header_size)
+    if not arena or not _has_copy_helper(frame, process, timing):
+        return None
+
+    # Clear the header so a failed call can't leave a previous class's count
+    error = lldb.SBError()
+    process.WriteMemory(arena, bytes(header_size), error)
+    if not error.Success():
+        return None
 
-        method_ptr = method_ptr_result.GetValueAsUnsigned()
+    capacity = (get_scratch_size(process) - header_size) // (2 * pointer_size)
+    copy_expr = _COPY_CALL.format(cls=class_ptr, arena=arena, capacity=capacity)
+    copy_result = frame.EvaluateExpression(copy_expr, RUNTIME_LIST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
+    if not copy_result.IsValid() or copy_result.GetError().Fail():
+        return None
+
+    header = process.ReadMemory(arena, header_size, error)
+    timing['memory_read_count'] += 1
+    if not error.Success():
+        return None
+
+    method_count, method_list_ptr = unpack_pointers(header, pointer_size)
+    info_ptr = copy_result.GetValueAsUnsigned()
+    if info_ptr != 0:
+        return _read_selector_info(process, info_ptr, method_count, pointer_size, timing)
+    if method_count == 0 or method_list_ptr == 0:
+        return []
+
+    # Too many methods for the arena: the helper left the array to the loop
+    return _loop_method_list(frame, process, method_list_ptr, method_count, pointer_size, timing)
+
+def _read_selector_info(
+    process: lldb.SBProcess,
+    info_ptr: int,
+    method_count: int,
+    pointer_size: int,
+    timing: TimingDict
+) -> List[Tuple[str, int, Optional[str]]]:
+    """Read the (selector name, IMP) pointer pairs left by the loop and resolve the names."""
+    error = lldb.SBError()
+    # 2 pointers per method: sel_name_ptr and imp_ptr
+    ptr_bytes = process.ReadMemory(info_ptr, method_count * 2 * pointer_size, error)
+    timing['memory_read_count'] += 1
+
+    if not error.Success():
+        print(f"Warning: Failed to read selector info from memory: {error}")
+        timing['error_count'] += 1
+        return []
+
+    ptrs = unpack_pointers(ptr_bytes, pointer_size)
+    names = _read_selector_names(process, ptrs[0::2], timing)
+    return [
+        (name, imp_addr, None)  # Category resolved later
+        for name, imp_addr in zip(names, ptrs[1::2]) if name
+    ]
+
+def _loop_method_list(
+    frame: lldb.SBFrame,
+    process: lldb.SBProcess,
+    method_list_ptr: int,
+    method_count: int,
+    pointer_size: int,
+    timing: TimingDict
+) -> List[Tuple[str, int, Optional[str]]]:
+    """
+    Resolve a class_copyMethodList array with one looping batch expression
+    (per-method expressions if that fails). The array is freed either way.
+
+    Returns:
+        List of (selector_name, imp_address, None) tuples
+    """
+    error = lldb.SBError()
+    selectors = []  # List of (sel_name, imp_addr, category) tuples
+
+    # OPTIMIZATION: One expression loops over the whole method list in the
+    # target and frees it. Its arguments and results go in the scratch arena
+    # (the count slot has been read, so it may be overwritten); the arena is
+    # reused by the next lookup, so nothing is left to free afterwards.
+    info_size = method_count * 2 * pointer_size
+    arena = get_scratch(process, 2 * pointer_size + info_size)
+    if arena:
+        args = struct.pack('<QQ' if pointer_size == 8 else '<II', method_count, method_list_ptr)
+        process.WriteMemory(arena, args, error)
+        if error.Success():
+            batch_expr = _LOOP_EXPR.format(arena=arena)
+        else:
+            error.Clear()
+            arena = 0
+    if not arena:
+        batch_expr = build_selector_batch_expression(method_list_ptr, method_count)
+    batch_result = frame.EvaluateExpression(batch_expr, RUNTIME_LIST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
+
+    info_ptr = 0
+    if batch_result.IsValid() and not batch_result.GetError().Fail():
+        info_ptr = batch_result.GetValueAsUnsigned()
+
+    if info_ptr != 0:
+        selectors = _read_selector_info(process, info_ptr, method_count, pointer_size, timing)
+
+        # Only a malloc'd info buffer (no scratch arena) needs freeing
+        if not arena:
+            frame.EvaluateExpression(f'(void)free((void *)0x{info_ptr:x})', FAST_EXPR_OPTIONS)
+            timing['expression_count'] += 1
+        return selectors
+
+    # Fallback: read the method array and process each method individually
+    method_array_bytes = process.ReadMemory(method_list_ptr, method_count * pointer_size, error)
+    timing['memory_read_count'] += 1
+
+    if error.Success():
+        method_pointers = unpack_pointers(method_array_bytes, pointer_size)
+    else:
+        print(f"Warning: Failed to read method array from memory: {error}")
+        timing['error_count'] += 1
+        error.Clear()
+        method_pointers = ()
 
+    for method_ptr in method_pointers:
         if method_ptr == 0:
             continue
-
-        # Get selector name using method_getName
+        # Get selector name
         sel_name_expr = f'(const char *)sel_getName((SEL)method_getName((void *)0x{method_ptr:x}))'
-        sel_name_result = frame.EvaluateExpression(sel_name_expr)
+        sel_name_result = frame.EvaluateExpression(sel_name_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
+
+        # Get IMP
+        imp_expr = f'(void *)method_getImplementation((void *)0x{method_ptr:x})'
+        imp_result = frame.EvaluateExpression(imp_expr, FAST_EXPR_OPTIONS)
+        timing['expression_count'] += 1
 
         if sel_name_result.IsValid() and not sel_name_result.GetError().Fail():
             sel_name = sel_name_result.GetSummary()
             if sel_name:
                 sel_name = unquote_string(sel_name)
+                imp_addr = imp_result.GetValueAsUnsigned() if imp_result.IsValid() else 0
+                selectors.append((sel_name, imp_addr, None))  # Category resolved later
+        else:
+            timing['error_count'] += 1
 
-                # Apply pattern filter if provided
-                if matches_pattern(sel_name, pattern):
-                    selectors.append(sel_name)
-
-    # Clean up allocated memory
-    if method_list_ptr != 0:
-        frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})')
-    frame.EvaluateExpression(f'(void)free((void *)0x{count_var_ptr:x})')
+    # Clean up allocated memory (the batch expression didn't get to free it)
+    frame.EvaluateExpression(f'(void)free((void *)0x{method_list_ptr:x})', FAST_EXPR_OPTIONS)
+    timing['expression_count'] += 1
 
     return selectors
 
+
+def get_methods_optimized(
+    frame: lldb.SBFrame,
+    process: lldb.SBProcess,
+    class_ptr: int,
+    is_instance: bool = True,
+    resolve_categories: bool = False
+) -> Tuple[List[Tuple[str, int, Optional[str]]], TimingDict]:
+    """
+    Get all methods for a class.
+    Returns a tuple of (list of (selector_name, imp_address, category_name) tuples, timing dict).
+    category_name is None if resolve_categories=False or if the method is not from a category.
+
+    Optimized implementation using:
+    - Direct reads of the class's method lists (_read_method_list): no
+      expressions, or one for the IMPs of relative (shared cache) lists
+    - Fallback: class_copyMethodList plus one looping expression for every
+      sel_getName(method_getName()) and method_getImplementation() call
+    - Selector names read in bulk from __objc_methname (_read_selector_names)
+    - Optional symbol resolution for category detection (when resolve_categories=True)
+
+    For N methods:
+    - Before: ~2N expression evaluations
+    - After: 0 expression evaluations (1 with relative lists) + ~6 memory reads
+      (fallback: 1 __osel_copy call, or 2 expression evaluations without
+      the helper, + ~4 memory reads)
+    """
+    timing = {
+        'expression_count': 0,
+        'memory_read_count': 0,
+        'error_count': 0
+    }
+
+    pointer_size = get_pointer_size(frame)
+
+    # Read the method lists straight out of the class; the runtime calls are
+    # the fallback for layouts the reader doesn't recognise
+    selectors = _read_method_list(frame, process, class_ptr, pointer_size, timing)
+    if selectors is None:
+        selectors = _copy_method_list(frame, process, class_ptr, pointer_size, timing)
+
+    # Optionally resolve category info from symbols
+    if resolve_categories and selectors:
+        category_for = _category_lookup(process.GetTarget())
+        selectors = [(sel_name, imp_addr, category_for(imp_addr)) for sel_name, imp_addr, _ in selectors]
+
+    return selectors, timing
+
+
 def __lldb_init_module(debugger: lldb.SBDebugger, internal_dict: Dict[str, Any]) -> None:
     """Initialize the module by registering the command."""
     module_path = f"{__name__}.find_objc_selectors"
@@ -12,10 +12,13 @@ For pure Python utilities (parsing, formatting), see objc_core.py
 
 from __future__ import annotations
 
+import array
 import lldb
 import os
+import re
+import struct
 import sys
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Set, Tuple, List
 
 # Add the script directory to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -36,6 +39,435 @@ from objc_core import (
     extract_category_from_symbol
 )
 
+# Expression options for single-pointer runtime lookups (class_getName,
+# objc_getProtocol, ...). These expressions only return plain pointers and
+# integers, so dynamic type resolution is wasted work; a short timeout on the
+# current thread keeps a stuck lookup from stalling the session. Results are
+# never referenced as $N, so no persistent variable is created for them.
+FAST_EXPR_OPTIONS = lldb.SBExpressionOptions()
+FAST_EXPR_OPTIONS.SetFetchDynamicValue(lldb.eNoDynamicValues)
+FAST_EXPR_OPTIONS.SetUnwindOnError(True)
+FAST_EXPR_OPTIONS.SetIgnoreBreakpoints(True)
+FAST_EXPR_OPTIONS.SetTimeoutInMicroSeconds(500000)
+FAST_EXPR_OPTIONS.SetTryAllThreads(False)
+FAST_EXPR_OPTIONS.SetSuppressPersistentResult(True)
+
+# FAST_EXPR_OPTIONS without JIT: single C calls such as objc_getClass("X")
+# run in LLDB's IR interpreter, skipping code generation. Used through
+# evaluate_interpreted(), which retries with JIT when the interpreter can't.
+INTERPRETED_EXPR_OPTIONS = lldb.SBExpressionOptions()
+INTERPRETED_EXPR_OPTIONS.SetFetchDynamicValue(lldb.eNoDynamicValues)
+INTERPRETED_EXPR_OPTIONS.SetUnwindOnError(True)
+INTERPRETED_EXPR_OPTIONS.SetIgnoreBreakpoints(True)
+INTERPRETED_EXPR_OPTIONS.SetTimeoutInMicroSeconds(500000)
+INTERPRETED_EXPR_OPTIONS.SetTryAllThreads(False)
+INTERPRETED_EXPR_OPTIONS.SetSuppressPersistentResult(True)
+INTERPRETED_EXPR_OPTIONS.SetAllowJIT(False)
+
+# Expression options for expressions that enumerate or copy runtime lists
+# (objc_copyClassList, class_copyMethodList, ...) and for batch blocks.
+# These take the runtime lock and can realize classes, so they may wait on
+# another thread holding the lock or running +initialize, and large images
+# legitimately run past 500ms. After the one-thread timeout the other threads
+# are resumed, with no overall cap.
+RUNTIME_LIST_EXPR_OPTIONS = lldb.SBExpressionOptions()
+RUNTIME_LIST_EXPR_OPTIONS.SetFetchDynamicValue(lldb.eNoDynamicValues)
+RUNTIME_LIST_EXPR_OPTIONS.SetUnwindOnError(True)
+RUNTIME_LIST_EXPR_OPTIONS.SetIgnoreBreakpoints(True)
+RUNTIME_LIST_EXPR_OPTIONS.SetTimeoutInMicroSeconds(0)
+RUNTIME_LIST_EXPR_OPTIONS.SetTryAllThreads(True)
+RUNTIME_LIST_EXPR_OPTIONS.SetOneThreadTimeoutInMicroSeconds(500000)
+RUNTIME_LIST_EXPR_OPTIONS.SetSuppressPersistentResult(True)
+
+# Expression options for calls into arbitrary objects (-description and friends).
+# Same as FAST_EXPR_OPTIONS minus the short timeout: a batch does the work of
+# many single calls, and -description can run app code that needs other threads.
+OBJECT_EXPR_OPTIONS = lldb.SBExpressionOptions()
+OBJECT_EXPR_OPTIONS.SetFetchDynamicValue(lldb.eNoDynamicValues)
+OBJECT_EXPR_OPTIONS.SetUnwindOnError(True)
+OBJECT_EXPR_OPTIONS.SetIgnoreBreakpoints(True)
+OBJECT_EXPR_OPTIONS.SetSuppressPersistentResult(True)
+
+# Options for defining functions in the target with a top-level expression
+TOP_LEVEL_EXPR_OPTIONS = lldb.SBExpressionOptions()
+TOP_LEVEL_EXPR_OPTIONS.SetTopLevel(True)
+TOP_LEVEL_EXPR_OPTIONS.SetSuppressPersistentResult(True)
+TOP_LEVEL_EXPR_OPTIONS.SetIgnoreBreakpoints(True)
+
+# UserExpression::kNoResult: the expression completed but produced no value
+# (always the case for top-level definitions and void calls)
+EXPR_NO_RESULT_ERROR = 0x1001
+
+# Runtime helpers defined once per process. Call sites then send a short call
+# with the same shape every time instead of re-spelling the runtime calls.
+RUNTIME_HELPERS_SOURCE = '''
+const char *__lldbobjc_class_name(void *cls) {
+    return cls ? (const char *)class_getName((Class)cls) : (const char *)0;
+}
+const char *__lldbobjc_object_class_name(void *obj) {
+    return obj ? (const char *)class_getName((Class)object_getClass((id)obj)) : (const char *)0;
+}
+const char *__lldbobjc_description(void *obj) {
+    return obj ? (const char *)[[(id)obj description] UTF8String] : (const char *)0;
+}
+const char *__lldbobjc_sel_name(void *sel) {
+    return sel ? (const char *)sel_getName((SEL)sel) : (const char *)0;
+}
+const char *__lldbobjc_pool_print_quiet(void) {
+    int saved_stderr = (int)dup(2);
+    int devnull = (int)open("/dev/null", 1);
+    (void)dup2(devnull, 2);
+    const char *result = (const char *)_objc_autoreleasePoolPrint();
+    (void)dup2(saved_stderr, 2);
+    (void)close(saved_stderr);
+    (void)close(devnull);
+    return result;
+}
+'''
+
+# Expression templates keyed by shape; fill with str.format(address)
+# (pool_print_quiet takes no argument and is used as is).
+# HELPER_TEMPLATES call the functions above; INLINE_TEMPLATES are the
+# equivalent plain expressions, used when the helpers could not be defined.
+HELPER_TEMPLATES = {
+    'class_name': '__lldbobjc_class_name((void *){})',
+    'object_class_name': '__lldbobjc_object_class_name((void *){})',
+    'description': '__lldbobjc_description((void *){})',
+    'sel_name': '__lldbobjc_sel_name((void *){})',
+    'pool_print_quiet': '(const char *)__lldbobjc_pool_print_quiet()',
+}
+INLINE_TEMPLATES = {
+    'class_name': '(const char *)class_getName((Class){})',
+    'object_class_name': '(const char *)class_getName((Class)object_getClass((id){}))',
+    'description': '(const char *)[[(id){} description] UTF8String]',
+    'sel_name': '(const char *)sel_getName((SEL){})',
+    # Redirects stderr to /dev/null around the call
+    'pool_print_quiet': '''
+        (const char *)(({
+            int saved_stderr = dup(2);
+            int devnull = open("/dev/null", 1);
+            dup2(devnull, 2);
+            const char *result = _objc_autoreleasePoolPrint();
+            dup2(saved_stderr, 2);
+            close(saved_stderr);
+            close(devnull);
+            result;
+        }))
+        ''',
+}
+
+# Scratch arenas: one block of target memory per process, allocated from
+# Python with SBProcess.AllocateMemory (no malloc/free expressions) on first
+# use and shared by the batches of every command. Callers fall back to
+# target-side malloc when allocation fails.
+#
+# Users of the arena run strictly one after another: results must be read
+# before the next expression overwrites it. Keyed by process unique ID, so a
+# relaunched process that reuses a pid never sees the old process's address.
+# Structure: {process_unique_id: (address, size)}
+SCRATCH_PERMISSIONS = lldb.ePermissionsReadable | lldb.ePermissionsWritable
+SCRATCH_ARENA_SIZE = 4096
+_scratch_arenas: Dict[int, Tuple[int, int]] = {}
+
+# Per-process caches for values that never change during a process's lifetime
+# Structure: {process_id: value}
+_ptr_size_cache: Dict[int, int] = {}
+_triple_cache: Dict[int, str] = {}
+
+# Which expression templates work in a process. Keyed by process unique ID:
+# the helpers are defined in one process, and a relaunch under a reused pid
+# doesn't have them. Structure: {process_unique_id: templates}
+_templates_cache: Dict[int, Dict[str, str]] = {}
+
+
+def get_pointer_size(frame: lldb.SBFrame) -> int:
+    """
+    Get the target pointer size in bytes, cached per process.
+
+    Args:
+        frame: The LLDB SBFrame
+
+    Returns:
+        Pointer size in bytes (8 on 64-bit targets, 4 on 32-bit)
+    """
+    process = frame.GetThread().GetProcess()
+    pid = process.GetProcessID()
+    pointer_size = _ptr_size_cache.get(pid)
+    if pointer_size is None:
+        # The process knows its own address size; the frame's module may be
+        # missing (JIT or stripped code) and would need an SBModule lookup
+        pointer_size = process.GetAddressByteSize()
+        _ptr_size_cache[pid] = pointer_size
+    return pointer_size
+
+
+def get_scratch(process: lldb.SBProcess, size: int, min_size: int = SCRATCH_ARENA_SIZE) -> int:
+    """
+    Get the process scratch arena, allocating or growing it as needed.
+
+    Args:
+        process: Process the arena belongs to
+        size: Bytes the caller needs
+        min_size: Smallest arena to allocate (callers with large batches pass more)
+
+    Returns:
+        Arena address (at least size bytes), or 0 if allocation failed
+    """
+    unique_id = process.GetUniqueID()
+    arena = _scratch_arenas.get(unique_id)
+    if arena is not None:
+        if arena[1] >= size:
+            return arena[0]
+        # Too small: replace it with a larger one
+        process.DeallocateMemory(arena[0])
+        del _scratch_arenas[unique_id]
+
+    arena_size = max(size, min_size)
+    error = lldb.SBError()
+    scratch = process.AllocateMemory(arena_size, SCRATCH_PERMISSIONS, error)
+    if not error.Success() or scratch == 0:
+        return 0
+
+    _scratch_arenas[unique_id] = (scratch, arena_size)
+    return scratch
+
+
+def get_scratch_size(process: lldb.SBProcess) -> int:
+    """Size in bytes of the process scratch arena (0 if none is allocated)."""
+    arena = _scratch_arenas.get(process.GetUniqueID())
+    return arena[1] if arena is not None else 0
+
+
+def unpack_pointers(data: bytes, pointer_size: int) -> array.array:
+    """Parse a pointer array read from the target without building a tuple."""
+    pointers = array.array('Q' if pointer_size == 8 else 'I')
+    pointers.frombytes(data)
+    return pointers
+
+
+def get_expression_templates(frame: lldb.SBFrame) -> Dict[str, str]:
+    """
+    Get the runtime expression templates for the frame's process.
+
+    The first call per process defines RUNTIME_HELPERS_SOURCE in the target;
+    later calls return the cached choice without touching the target.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+
+    Returns:
+        HELPER_TEMPLATES if the helpers are available, INLINE_TEMPLATES otherwise
+    """
+    unique_id = frame.GetThread().GetProcess().GetUniqueID()
+    templates = _templates_cache.get(unique_id)
+    if templates is None:
+        result = frame.EvaluateExpression(RUNTIME_HELPERS_SOURCE, TOP_LEVEL_EXPR_OPTIONS)
+        error = result.GetError()
+        # A redefinition means the helpers are already there (e.g. after oreload)
+        if (error.Success() or error.GetError() == EXPR_NO_RESULT_ERROR
+                or 'redefinition' in (error.GetCString() or '')):
+            templates = HELPER_TEMPLATES
+        else:
+            templates = INLINE_TEMPLATES
+        _templates_cache[unique_id] = templates
+    return templates
+
+
+# Expression shapes (literals masked by _EXPR_LITERAL_RE) the IR interpreter
+# rejected but JIT ran, per process; later expressions of that shape go
+# straight to JIT. Structure: {(process_unique_id, shape)}
+_jit_required: Set[Tuple[int, str]] = set()
+_EXPR_LITERAL_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\b0x[0-9a-fA-F]+\b|\b\d+\b')
+
+# Expression results meaning the interpreter could not take the expression
+# (it failed to prepare or gave up running it). Others, such as a crash or
+# timeout inside the called function, would fail the same way under JIT.
+_INTERPRETER_REJECTIONS = (
+    lldb.eExpressionSetupError,
+    lldb.eExpressionParseError,
+    lldb.eExpressionDiscarded,
+)
+
+
+def evaluate_interpreted(frame: lldb.SBFrame, expr: str) -> lldb.SBValue:
+    """
+    Evaluate a simple expression (plain C calls, no blocks or ObjC literals)
+    without JIT, falling back to FAST_EXPR_OPTIONS when the interpreter
+    rejects it.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        expr: Expression to evaluate
+
+    Returns:
+        The expression result
+    """
+    key = (frame.GetThread().GetProcess().GetUniqueID(), _EXPR_LITERAL_RE.sub('_', expr))
+    if key not in _jit_required:
+        result = frame.EvaluateExpression(expr, INTERPRETED_EXPR_OPTIONS)
+        error = result.GetError()
+        # Expression errors carry the ExpressionResults value as their code
+        if result.IsValid() and (not error.Fail() or (
+                error.GetType() == lldb.eErrorTypeExpression
+                and error.GetError() not in _INTERPRETER_REJECTIONS)):
+            return result
+
+    result = frame.EvaluateExpression(expr, FAST_EXPR_OPTIONS)
+    if result.IsValid() and not result.GetError().Fail():
+        _jit_required.add(key)
+    return result
+
+
+def evaluate_pointer_batch(
+    frame: lldb.SBFrame,
+    value_exprs: List[str],
+    options: Optional[lldb.SBExpressionOptions] = None
+) -> List[int]:
+    """
+    Evaluate several pointer-valued expressions with a single target call.
+
+    Every result is stored into a malloc'd array by one block expression, so N
+    values cost one parse/JIT/call instead of N. The array is read back with a
+    single memory read and freed.
+
+    If the batch fails (one faulting call unwinds the whole block), each
+    expression is evaluated on its own so the remaining values still resolve.
+
+    Args:
+        frame: LLDB frame for expression evaluation
+        value_exprs: Expressions yielding pointer-sized values (no trailing ';')
+        options: Expression options (default: RUNTIME_LIST_EXPR_OPTIONS)
+
+    Returns:
+        One value per expression, in order (0 where evaluation failed)
+    """
+    count = len(value_exprs)
+    if count == 0:
+        return []
+    if options is None:
+        options = RUNTIME_LIST_EXPR_OPTIONS
+
+    pointer_size = get_pointer_size(frame)
+    assignments = '\n'.join(
+        f'    out[{i}] = (void *)({expr});' for i, expr in enumerate(value_exprs)
+    )
+    batch_expr = f'''
+(void *)(^{{
+    void **out = (void **)malloc({count * pointer_size});
+    if (!out) return (void *)0;
+{assignments}
+    return (void *)out;
+}}())
+'''
+
+    batch_result = frame.EvaluateExpression(batch_expr, options)
+    if batch_result.IsValid() and not batch_result.GetError().Fail():
+        out_ptr = batch_result.GetValueAsUnsigned()
+        if out_ptr != 0:
+            error = lldb.SBError()
+            out_bytes = frame.GetThread().GetProcess().ReadMemory(
+                out_ptr, count * pointer_size, error
+            )
+            frame.EvaluateExpression(f'(void)free((void *)0x{out_ptr:x})', FAST_EXPR_OPTIONS)
+            if error.Success():
+                format_str = f'{count}Q' if pointer_size == 8 else f'{count}I'
+                return list(struct.unpack(format_str, out_bytes))
+
+    # Fallback to individual calls
+    values = []
+    for expr in value_exprs:
+        value_result = frame.EvaluateExpression(f'(void *)({expr})', options)
+        if value_result.IsValid() and not value_result.GetError().Fail():
+            values.append(value_result.GetValueAsUnsigned())
+        else:
+            values.append(0)
+    return values
+
+
+def read_c_strings(
+    process: lldb.SBProcess,
+    pointers: List[int],
+    max_length: int = 256
+) -> List[Optional[str]]:
+    """
+    Read a C string from each pointer, sharing one SBError across the reads.
+
+    Args:
+        process: LLDB process for memory reads
+        pointers: String addresses (0 entries are skipped)
+        max_length: Maximum bytes to read per string
+
+    Returns:
+        One string per pointer, in order (None for NULL, empty or unreadable strings)
+    """
+    error = lldb.SBError()
+    strings = []
+    for ptr in pointers:
+        if ptr == 0:
+            strings.append(None)
+            continue
+        string = process.ReadCStringFromMemory(ptr, max_length, error)
+        if not error.Success() or not string:
+            error.Clear()
+            strings.append(None)
+        else:
+            strings.append(string)
+    return strings
+
+
+def read_c_string_bytes(
+    process: lldb.SBProcess,
+    addr: int,
+    max_length: int,
+    initial_chunk: int = 64 * 1024
+) -> Optional[bytes]:
+    """
+    Read a NUL-terminated string as raw bytes, growing the read size on demand.
+
+    Reads start at initial_chunk bytes and double until the terminator shows
+    up, so short strings cost one small transfer rather than max_length bytes.
+    A read that fails (e.g. running into an unmapped page past the string) is
+    retried up to the next page boundary.
+
+    Args:
+        process: LLDB process for memory reads
+        addr: Address of the string
+        max_length: Maximum number of bytes to read
+        initial_chunk: Size of the first read
+
+    Returns:
+        String bytes without the terminator (truncated at max_length),
+        or None if nothing could be read
+    """
+    page_size = 4096
+    error = lldb.SBError()
+    chunks = []
+    total = 0
+    chunk_size = initial_chunk
+
+    while total < max_length:
+        size = min(chunk_size, max_length - total)
+        data = process.ReadMemory(addr, size, error)
+        if not error.Success() or not data:
+            error.Clear()
+            size = min(page_size - addr % page_size, max_length - total)
+            data = process.ReadMemory(addr, size, error)
+            if not error.Success() or not data:
+                break
+
+        nul = data.find(b'\0')
+        if nul != -1:
+            chunks.append(data[:nul])
+            break
+        chunks.append(data)
+        total += len(data)
+        addr += len(data)
+        chunk_size *= 2
+
+    if not chunks:
+        return None
+    return b''.join(chunks)
+
 
 def resolve_method_address(
     frame: lldb.SBFrame,
@@ -67,12 +499,14 @@ def resolve_method_address(
         - class_ptr, sel_ptr: int pointers for reference
         On error, resolved_address is invalid and error_message describes the issue
     """
+    # These lookups can run +initialize and method resolvers (app code), so they
+    # use OBJECT_EXPR_OPTIONS rather than the short-timeout metadata options
     # Step 1: Get the class using NSClassFromString
     target = frame.GetThread().GetProcess().GetTarget()
     invalid_addr = lldb.SBAddress()
 
     class_expr = f'(Class)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    class_result = frame.EvaluateExpression(class_expr, OBJECT_EXPR_OPTIONS)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
         return invalid_addr, 0, 0, f"Failed to resolve class '{class_name}': {class_result.GetError()}"
@@ -87,7 +521,7 @@ def resolve_method_address(
 
     # Step 2: Get the selector using NSSelectorFromString
     sel_expr = f'(SEL)NSSelectorFromString(@"{selector}")'
-    sel_result = frame.EvaluateExpression(sel_expr)
+    sel_result = frame.EvaluateExpression(sel_expr, OBJECT_EXPR_OPTIONS)
 
     if not sel_result.IsValid() or sel_result.GetError().Fail():
         return invalid_addr, class_ptr, 0, f"Failed to resolve selector '{selector}': {sel_result.GetError()}"
@@ -104,7 +538,7 @@ def resolve_method_address(
     lookup_class_ptr = class_ptr
     if not is_instance_method:
         metaclass_expr = f'(Class)object_getClass((id)0x{class_ptr:x})'
-        metaclass_result = frame.EvaluateExpression(metaclass_expr)
+        metaclass_result = frame.EvaluateExpression(metaclass_expr, OBJECT_EXPR_OPTIONS)
 
         if not metaclass_result.IsValid() or metaclass_result.GetError().Fail():
             return invalid_addr, class_ptr, sel_ptr, f"Failed to get metaclass: {metaclass_result.GetError()}"
@@ -113,7 +547,7 @@ def resolve_method_address(
 
     # Step 4: Get the method implementation using class_getMethodImplementation
     imp_expr = f'(void *)class_getMethodImplementation((Class)0x{lookup_class_ptr:x}, (SEL)0x{sel_ptr:x})'
-    imp_result = frame.EvaluateExpression(imp_expr)
+    imp_result = frame.EvaluateExpression(imp_expr, OBJECT_EXPR_OPTIONS)
 
     if not imp_result.IsValid() or imp_result.GetError().Fail():
         return invalid_addr, class_ptr, sel_ptr, f"Failed to get method implementation: {imp_result.GetError()}"
@@ -185,7 +619,8 @@ def detect_method_type(
     - If not found as class method, check instance method
     - Default to instance method if we can't determine
     """
-    # Check for class method first using class_getClassMethod
+    # Check for class method first using class_getClassMethod (may run
+    # +initialize, hence OBJECT_EXPR_OPTIONS)
     # This is more reliable than class_respondsToSelector for our purposes
     check_expr = f'''(void *)({{
         Class cls = (Class)NSClassFromString(@"{class_name}");
@@ -194,7 +629,7 @@ def detect_method_type(
         (void *)class_getClassMethod(cls, sel);
     }})'''
 
-    class_result = frame.EvaluateExpression(check_expr)
+    class_result = frame.EvaluateExpression(check_expr, OBJECT_EXPR_OPTIONS)
     if class_result.IsValid() and not class_result.GetError().Fail():
         has_class_method = class_result.GetValueAsUnsigned() != 0
         if has_class_method:
@@ -210,7 +645,7 @@ def detect_method_type(
         (void *)class_getInstanceMethod(cls, sel);
     }})'''
 
-    instance_result = frame.EvaluateExpression(check_expr)
+    instance_result = frame.EvaluateExpression(check_expr, OBJECT_EXPR_OPTIONS)
     if instance_result.IsValid() and not instance_result.GetError().Fail():
         has_instance_method = instance_result.GetValueAsUnsigned() != 0
         if has_instance_method:
@@ -239,8 +674,13 @@ def get_arch_registers(frame: lldb.SBFrame) -> Tuple[str, str, List[str]]:
         Tuple of (self_reg, cmd_reg, arg_regs) where arg_regs is a list of
         additional argument register names.
     """
-    target = frame.GetThread().GetProcess().GetTarget()
-    triple = target.GetTriple()
+    # Triples don't change mid-session, so look them up once per process
+    process = frame.GetThread().GetProcess()
+    pid = process.GetProcessID()
+    triple = _triple_cache.get(pid)
+    if triple is None:
+        triple = process.GetTarget().GetTriple()
+        _triple_cache[pid] = triple
 
     if 'arm64' in triple or 'aarch64' in triple:
         # ARM64: x0=self, x1=_cmd, x2-x7=args
@@ -16,8 +16,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'
 
 def format_output(text: str) -> str:
     """Format output with >> prefix on each line."""
-    lines = text.rstrip().split('\n')
-    return '\n'.join(f">> {line}" for line in lines)
+    return '>> ' + text.rstrip().replace('\n', '\n>> ')
 
 
 class TestFormatOutput:
@@ -61,11 +60,14 @@ It calls the following functions:
 1. func_a
 2. func_b"""
         result = format_output(claude_output)
-        # Note: empty lines get ">> " (with trailing space) because we use f">> {line}"
+        # Note: empty lines get ">> " (with trailing space)
         expected = ">> This function does XYZ.\n>> \n>> It calls the following functions:\n>> 1. func_a\n>> 2. func_b"
         assert result == expected
 
 
+ANNOTATE_FLAGS = frozenset(('-a', '--annotate'))
+
+
 def parse_args(command: str) -> tuple:
     """
     Parse command arguments.
@@ -76,15 +78,13 @@ def parse_args(command: str) -> tuple:
     use_claude = False
     address_parts = []
 
-    i = 0
-    while i < len(parts):
-        if parts[i] in ('-a', '--annotate'):
+    for part in parts:
+        if part in ANNOTATE_FLAGS:
             annotate = True
-        elif parts[i] == '--claude':
+        elif part == '--claude':
             use_claude = True
         else:
-            address_parts.append(parts[i])
-        i += 1
+            address_parts.append(part)
 
     return annotate, use_claude, ' '.join(address_parts)
 
@@ -6,6 +6,7 @@ that doesn't require LLDB runtime.
 """
 
 import pytest
+import struct
 import sys
 import os
 
@@ -14,10 +15,19 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../scripts'))
 
 from objc_core import (
     unquote_string,
+    get_pattern_info,
     parse_method_signature,
     format_method_name,
     extract_inherited_class,
-    extract_category_from_symbol
+    extract_category_from_symbol,
+    parse_method_list_header,
+    parse_method_entries,
+    parse_small_method_entries,
+    selref_span,
+    gather_selrefs,
+    SMALL_METHOD_LIST_FLAG,
+    DIRECT_SELECTORS_FLAG,
+    MAX_METHOD_LIST_COUNT
 )
 
 
@@ -59,6 +69,65 @@ class TestUnquoteString:
         """Should preserve multiple internal escaped quotes."""
         assert unquote_string('"a\\"b\\"c"') == 'a"b"c'
 
+    @pytest.mark.parsing
+    def test_unquote_leading_quote_only(self):
+        """Should return unchanged if the closing quote is missing."""
+        assert unquote_string('"hello') == '"hello'
+
+
+class TestGetPatternInfo:
+    """Tests for get_pattern_info() function."""
+
+    @pytest.mark.pattern
+    def test_plain_pattern_is_lowercased(self):
+        """Should report no wildcards and return lowercased pattern."""
+        assert get_pattern_info('SendMessage') == (False, 'sendmessage')
+
+    @pytest.mark.pattern
+    def test_star_wildcard(self):
+        """Should match * case-insensitively against the whole string."""
+        has_wildcards, matcher = get_pattern_info('IDS*')
+        assert has_wildcards is True
+        assert matcher('IDSService')
+        assert matcher('idsservice')
+        assert not matcher('_IDSService')
+
+    @pytest.mark.pattern
+    def test_question_wildcard(self):
+        """Should match ? against exactly one character."""
+        has_wildcards, matcher = get_pattern_info('NS?ate')
+        assert has_wildcards is True
+        assert matcher('NSDate')
+        assert not matcher('NSDDate')
+
+    @pytest.mark.pattern
+    def test_regex_characters_escaped(self):
+        """Should treat regex metacharacters literally."""
+        _, matcher = get_pattern_info('init.With*:')
+        assert matcher('init.WithFrame:')
+        assert not matcher('initXWithFrame:')
+
+    @pytest.mark.pattern
+    def test_literal_prefilter_keeps_regex_semantics(self):
+        """Literal substring present but out of position should not match."""
+        _, matcher = get_pattern_info('*set?')
+        assert matcher('setX')
+        assert matcher('_SETy')
+        assert not matcher('setXY')
+        assert not matcher('getX')
+
+    @pytest.mark.pattern
+    def test_all_wildcards(self):
+        """Pattern with no literal run should still match via regex."""
+        _, matcher = get_pattern_info('*')
+        assert matcher('')
+        assert matcher('anything')
+
+    @pytest.mark.pattern
+    def test_result_is_cached(self):
+        """Should return the same cached object on repeated calls."""
+        assert get_pattern_info('*Cached*') is get_pattern_info('*Cached*')
+
 
 class TestParseMethodSignature:
     """Tests for parse_method_signature() function."""
@@ -316,6 +385,122 @@ class TestExtractCategoryFromSymbol:
         assert sel == '_update'
 
 
+class TestParseMethodListHeader:
+    """Tests for parse_method_list_header() function."""
+
+    @pytest.mark.parsing
+    def test_pointer_list(self):
+        """Should decode a plain method_list_t header."""
+        header = struct.pack('<II', 24, 5)
+        assert parse_method_list_header(header) == (24, 5, False)
+
+    @pytest.mark.parsing
+    def test_small_list_flag(self):
+        """Should mark relative lists and strip the flag from entsize."""
+        header = struct.pack('<II', SMALL_METHOD_LIST_FLAG | 12, 3)
+        assert parse_method_list_header(header) == (12, 3, True)
+
+    @pytest.mark.parsing
+    def test_low_flag_bits_stripped(self):
+        """Should ignore the flag bits below entsize."""
+        header = struct.pack('<II', 24 | 3, 2)
+        assert parse_method_list_header(header) == (24, 2, False)
+
+    @pytest.mark.parsing
+    def test_empty_list(self):
+        """Should accept an empty list whatever its entsize."""
+        header = struct.pack('<II', 0, 0)
+        assert parse_method_list_header(header) == (0, 0, False)
+
+    @pytest.mark.parsing
+    @pytest.mark.parametrize("entsize", [0, 4, 8])
+    def test_rejects_entsize_below_12(self, entsize):
+        """Should reject entries too small to hold a method."""
+        assert parse_method_list_header(struct.pack('<II', entsize, 1)) is None
+        assert parse_method_list_header(struct.pack('<II', SMALL_METHOD_LIST_FLAG | entsize, 1)) is None
+
+    @pytest.mark.parsing
+    def test_rejects_direct_selectors(self):
+        """Should reject relative lists with shared-cache direct selectors."""
+        header = struct.pack('<II', SMALL_METHOD_LIST_FLAG | DIRECT_SELECTORS_FLAG | 12, 1)
+        assert parse_method_list_header(header) is None
+
+    @pytest.mark.parsing
+    @pytest.mark.parametrize("entsize", [12, 16, 28])
+    def test_rejects_bad_pointer_entsize(self, entsize):
+        """Should reject pointer entries shorter than 24 bytes or not 8-aligned."""
+        assert parse_method_list_header(struct.pack('<II', entsize, 1)) is None
+
+    @pytest.mark.parsing
+    def test_rejects_huge_count(self):
+        """Should treat an implausible count as a misread."""
+        header = struct.pack('<II', 24, MAX_METHOD_LIST_COUNT + 1)
+        assert parse_method_list_header(header) is None
+
+
+class TestParseMethodEntries:
+    """Tests for parse_method_entries() and parse_small_method_entries()."""
+
+    @pytest.mark.parsing
+    def test_pointer_entries(self):
+        """Should take SEL and IMP from each 24-byte entry."""
+        entries = struct.pack('<6Q', 0x1000, 0xa0, 0x2000, 0x1008, 0xa8, 0x2010)
+        assert parse_method_entries(entries, 24) == ([0x1000, 0x1008], [0x2000, 0x2010])
+
+    @pytest.mark.parsing
+    def test_pointer_entries_wider_stride(self):
+        """Should step over extra words in larger entries."""
+        entries = struct.pack('<8Q', 0x1000, 0xa0, 0x2000, 0, 0x1008, 0xa8, 0x2010, 0)
+        assert parse_method_entries(entries, 32) == ([0x1000, 0x1008], [0x2000, 0x2010])
+
+    @pytest.mark.parsing
+    def test_pointer_entries_strip_pac(self):
+        """Should strip pointer authentication bits from IMPs."""
+        entries = struct.pack('<3Q', 0x1000, 0xa0, 0x8a1f000100002000)
+        assert parse_method_entries(entries, 24)[1] == [0x100002000]
+
+    @pytest.mark.parsing
+    def test_small_entries(self):
+        """Should resolve selref offsets relative to each entry and tag Method pointers."""
+        entries = struct.pack('<6i', 0x100, 0x40, -0x20, 0xf8, 0x40, -0x20)
+        selrefs, methods = parse_small_method_entries(entries, 0x5000, 12)
+        assert selrefs == [0x5100, 0x5104]
+        assert methods == [0x5001, 0x500d]
+
+    @pytest.mark.parsing
+    def test_small_entries_wider_stride(self):
+        """Should step by entsize, not by three fields."""
+        entries = struct.pack('<8i', 0x100, 0, 0, 0, 0xf8, 0, 0, 0)
+        selrefs, methods = parse_small_method_entries(entries, 0x5000, 16)
+        assert selrefs == [0x5100, 0x5108]
+        assert methods == [0x5001, 0x5011]
+
+
+class TestSelrefGathering:
+    """Tests for selref_span() and gather_selrefs() functions."""
+
+    @pytest.mark.parsing
+    def test_span_covers_all_refs(self):
+        """Should cover the lowest through the highest ref."""
+        assert selref_span([0x5010, 0x5000, 0x5008]) == (0x5000, 0x18)
+
+    @pytest.mark.parsing
+    def test_span_rejects_misaligned_refs(self):
+        """Should reject refs that are not slots of one pointer array."""
+        assert selref_span([0x5000, 0x5004]) is None
+
+    @pytest.mark.parsing
+    def test_span_empty(self):
+        """Should return None for no refs."""
+        assert selref_span([]) is None
+
+    @pytest.mark.parsing
+    def test_gather_in_ref_order(self):
+        """Should return the SEL in each ref's slot, in the refs' order."""
+        data = struct.pack('<3Q', 0xaaa, 0xbbb, 0xccc)
+        assert gather_selrefs(data, 0x5000, [0x5010, 0x5000, 0x5010]) == [0xccc, 0xaaa, 0xccc]
+
+
 # Test parametrization examples for comprehensive coverage
 class TestParseMethodSignatureParametrized:
     """Parametrized tests for parse_method_signature edge cases."""